@@ -0,0 +1,40 @@
+"""add deposit_address_pool
+
+Revision ID: 3f1c9a2d7b40
+Revises: 74b975586598
+Create Date: 2026-10-19 10:12:41.518204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c9a2d7b40"
+down_revision: Union[str, Sequence[str], None] = "74b975586598"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "deposit_address_pool",
+        sa.Column("address", sa.String(), nullable=False),
+        sa.Column("network", sa.String(), server_default="TRC20", nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("address"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("deposit_address_pool")
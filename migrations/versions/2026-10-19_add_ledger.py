@@ -0,0 +1,105 @@
+"""add ledger
+
+Revision ID: 5e2d9a7c4b81
+Revises: a6c1f08e5b37
+Create Date: 2026-10-19 23:41:12.530417
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e2d9a7c4b81"
+down_revision: Union[str, Sequence[str], None] = "a6c1f08e5b37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "ledger_posting",
+        sa.Column("posting_id", sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column("transaction_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "account",
+            sa.Enum(
+                "WALLET",
+                "DEPOSITS",
+                "WITHDRAWALS",
+                "SBP_PAYOUTS",
+                "NETWORK_FEES",
+                "PAYMENT_FEES",
+                name="ledger_account_enum",
+                native_enum=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("wallet_id", sa.UUID(), nullable=True),
+        sa.Column("amount", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("clock_timestamp()"), nullable=False),
+        sa.CheckConstraint("(account = 'WALLET') = (wallet_id IS NOT NULL)", name="ck_ledger_posting_wallet_account"),
+        sa.ForeignKeyConstraint(["wallet_id"], ["wallet.wallet_id"], onupdate="CASCADE", ondelete="NO ACTION"),
+        sa.PrimaryKeyConstraint("posting_id"),
+    )
+    op.create_index(op.f("ix_ledger_posting_transaction_id"), "ledger_posting", ["transaction_id"], unique=False)
+    op.create_index(
+        "ix_ledger_posting_wallet_id_posting_id",
+        "ledger_posting",
+        ["wallet_id", "posting_id"],
+        unique=False,
+        postgresql_where=sa.text("wallet_id IS NOT NULL"),
+    )
+
+    op.create_table(
+        "wallet_balance_snapshot",
+        sa.Column("wallet_id", sa.UUID(), nullable=False),
+        sa.Column("last_posting_id", sa.BigInteger(), nullable=False),
+        sa.Column("balance", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["wallet_id"], ["wallet.wallet_id"], onupdate="CASCADE", ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("wallet_id"),
+    )
+    op.create_index(
+        op.f("ix_wallet_balance_snapshot_last_posting_id"),
+        "wallet_balance_snapshot",
+        ["last_posting_id"],
+        unique=False,
+    )
+
+    # Текущие балансы становятся начальными снимками (в микро-единицах USDT)
+    op.execute(
+        "INSERT INTO wallet_balance_snapshot (wallet_id, last_posting_id, balance) "
+        "SELECT wallet_id, 0, round(balance * 1000000)::bigint FROM wallet"
+    )
+    op.drop_column("wallet", "balance")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column(
+        "wallet",
+        sa.Column("balance", sa.DECIMAL(precision=20, scale=6), server_default="0.0", nullable=False),
+    )
+    op.execute(
+        "UPDATE wallet SET balance = ("
+        "coalesce((SELECT balance FROM wallet_balance_snapshot s WHERE s.wallet_id = wallet.wallet_id), 0) "
+        "+ coalesce((SELECT sum(p.amount) FROM ledger_posting p WHERE p.wallet_id = wallet.wallet_id "
+        "AND p.posting_id > coalesce((SELECT last_posting_id FROM wallet_balance_snapshot s "
+        "WHERE s.wallet_id = wallet.wallet_id), 0)), 0)"
+        ") / 1000000.0"
+    )
+
+    op.drop_index(op.f("ix_wallet_balance_snapshot_last_posting_id"), table_name="wallet_balance_snapshot")
+    op.drop_table("wallet_balance_snapshot")
+    op.drop_index(
+        "ix_ledger_posting_wallet_id_posting_id",
+        table_name="ledger_posting",
+        postgresql_where=sa.text("wallet_id IS NOT NULL"),
+    )
+    op.drop_index(op.f("ix_ledger_posting_transaction_id"), table_name="ledger_posting")
+    op.drop_table("ledger_posting")
@@ -0,0 +1,37 @@
+"""add operation keyset index
+
+Revision ID: c27d8e5f4a13
+Revises: 9b4e61c0d2a7
+Create Date: 2026-10-19 16:45:09.227381
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c27d8e5f4a13"
+down_revision: Union[str, Sequence[str], None] = "9b4e61c0d2a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_operation_wallet_id_created_at_operation_id",
+        "operation",
+        ["wallet_id", sa.text("created_at DESC"), sa.text("operation_id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_operation_wallet_id_created_at_operation_id",
+        table_name="operation",
+    )
@@ -0,0 +1,68 @@
+"""add wallet_address
+
+Revision ID: 9b4e61c0d2a7
+Revises: 3f1c9a2d7b40
+Create Date: 2026-10-19 14:03:27.904112
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4e61c0d2a7"
+down_revision: Union[str, Sequence[str], None] = "3f1c9a2d7b40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "wallet_address",
+        sa.Column("address", sa.String(), nullable=False),
+        sa.Column("wallet_id", sa.UUID(), nullable=False),
+        sa.Column("network", sa.String(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["wallet_id"],
+            ["wallet.wallet_id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("address"),
+    )
+    op.create_index(
+        op.f("ix_wallet_address_wallet_id"),
+        "wallet_address",
+        ["wallet_id"],
+        unique=False,
+    )
+    # Перенос существующих адресов из wallet.addresses; при дубликате адрес остается за первым кошельком
+    op.execute(
+        """
+        INSERT INTO wallet_address (address, wallet_id, network, created_at)
+        SELECT DISTINCT ON (a.address) a.address, w.wallet_id, 'TRC20', w.created_at
+        FROM wallet AS w
+        CROSS JOIN LATERAL unnest(w.addresses) AS a(address)
+        ORDER BY a.address, w.created_at
+        ON CONFLICT (address) DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_wallet_address_wallet_id"),
+        table_name="wallet_address",
+    )
+    op.drop_table("wallet_address")
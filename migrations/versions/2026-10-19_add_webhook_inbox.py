@@ -0,0 +1,53 @@
+"""add webhook_inbox
+
+Revision ID: 8d3f27a1c6e5
+Revises: 5e8a0b7c1d92
+Create Date: 2026-10-19 19:05:12.384120
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3f27a1c6e5"
+down_revision: Union[str, Sequence[str], None] = "5e8a0b7c1d92"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "webhook_inbox",
+        sa.Column("inbox_id", sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column("tx_id", sa.String(length=255), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("next_attempt_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("inbox_id"),
+        sa.UniqueConstraint("tx_id"),
+    )
+    op.create_index(
+        "ix_webhook_inbox_next_attempt_at_inbox_id",
+        "webhook_inbox",
+        ["next_attempt_at", "inbox_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_webhook_inbox_next_attempt_at_inbox_id", table_name="webhook_inbox")
+    op.drop_table("webhook_inbox")
@@ -0,0 +1,72 @@
+"""add withdrawal
+
+Revision ID: 3b9e4c2d7f18
+Revises: 8d3f27a1c6e5
+Create Date: 2026-10-19 21:14:37.502913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b9e4c2d7f18"
+down_revision: Union[str, Sequence[str], None] = "8d3f27a1c6e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "withdrawal",
+        sa.Column("withdrawal_id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("operation_id", sa.UUID(), nullable=False),
+        sa.Column("wallet_id", sa.UUID(), nullable=False),
+        sa.Column("address", sa.String(length=255), nullable=False),
+        sa.Column("amount", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "QUEUED",
+                "SUBMITTING",
+                "SUBMITTED",
+                "REJECTED",
+                "UNKNOWN",
+                name="withdrawal_status_enum",
+                native_enum=False,
+            ),
+            server_default="QUEUED",
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("next_attempt_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["wallet_id"], ["wallet.wallet_id"], onupdate="CASCADE", ondelete="NO ACTION"),
+        sa.PrimaryKeyConstraint("withdrawal_id"),
+        sa.UniqueConstraint("operation_id"),
+    )
+    op.create_index(op.f("ix_withdrawal_wallet_id"), "withdrawal", ["wallet_id"], unique=False)
+    op.create_index(
+        "ix_withdrawal_queued_next_attempt_at",
+        "withdrawal",
+        ["next_attempt_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'QUEUED'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_withdrawal_queued_next_attempt_at",
+        table_name="withdrawal",
+        postgresql_where=sa.text("status = 'QUEUED'"),
+    )
+    op.drop_index(op.f("ix_withdrawal_wallet_id"), table_name="withdrawal")
+    op.drop_table("withdrawal")
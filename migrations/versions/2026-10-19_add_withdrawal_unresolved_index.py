@@ -0,0 +1,39 @@
+"""add withdrawal unresolved index
+
+Revision ID: c7a4e19d2b60
+Revises: 5e2d9a7c4b81
+Create Date: 2026-10-19 23:58:04.118265
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7a4e19d2b60"
+down_revision: Union[str, Sequence[str], None] = "5e2d9a7c4b81"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_withdrawal_unresolved_updated_at",
+        "withdrawal",
+        ["updated_at"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('SUBMITTING', 'UNKNOWN')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_withdrawal_unresolved_updated_at",
+        table_name="withdrawal",
+        postgresql_where=sa.text("status IN ('SUBMITTING', 'UNKNOWN')"),
+    )
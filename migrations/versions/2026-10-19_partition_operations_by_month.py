@@ -0,0 +1,158 @@
+"""partition operation and referral_operation by month
+
+Revision ID: 5e8a0b7c1d92
+Revises: c27d8e5f4a13
+Create Date: 2026-10-19 18:20:54.661930
+
+"""
+
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e8a0b7c1d92"
+down_revision: Union[str, Sequence[str], None] = "c27d8e5f4a13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+# Таблица -> (первичный ключ, индексы, внешние ключи)
+TABLES = {
+    "operation": (
+        "operation_id",
+        {
+            "ix_operation_operation_id": "(operation_id)",
+            "ix_operation_wallet_id": "(wallet_id)",
+            "ix_operation_wallet_id_created_at_operation_id": "(wallet_id, created_at DESC, operation_id DESC)",
+        },
+        {
+            "operation_wallet_id_fkey": (
+                "FOREIGN KEY (wallet_id) REFERENCES wallet (wallet_id) ON UPDATE CASCADE ON DELETE NO ACTION"
+            ),
+        },
+    ),
+    "referral_operation": (
+        "referral_operation_id",
+        {
+            "ix_referral_operation_referral_operation_id": "(referral_operation_id)",
+            "ix_referral_operation_referral_id": "(referral_id)",
+            "ix_referral_operation_source_referral_id": "(source_referral_id)",
+        },
+        {
+            "referral_operation_referral_id_fkey": (
+                "FOREIGN KEY (referral_id) REFERENCES referral (telegram_id) ON UPDATE CASCADE ON DELETE CASCADE"
+            ),
+            "referral_operation_source_referral_id_fkey": (
+                "FOREIGN KEY (source_referral_id) REFERENCES referral (telegram_id) "
+                "ON UPDATE CASCADE ON DELETE SET NULL"
+            ),
+        },
+    ),
+}
+
+# Ссылки на operation_id: у секционированной таблицы уникален только (operation_id, created_at),
+# поэтому внешние ключи снимаются; для cryptocurrency_replenishment вместо них заводится индекс
+# (у sbp_payment он уже есть)
+INBOUND_FOREIGN_KEYS = {
+    "cryptocurrency_replenishment": (
+        "cryptocurrency_replenishment_operation_id_fkey",
+        "FOREIGN KEY (operation_id) REFERENCES operation (operation_id) ON UPDATE CASCADE ON DELETE NO ACTION",
+    ),
+    "sbp_payment": (
+        "sbp_payment_operation_id_fkey",
+        "FOREIGN KEY (operation_id) REFERENCES operation (operation_id) ON UPDATE CASCADE ON DELETE NO ACTION",
+    ),
+}
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    today = datetime.now(timezone.utc).date().replace(day=1)
+    # Все строки до границы остаются в прежней таблице, которая становится одной большой секцией.
+    # Граница взята с запасом в месяц, чтобы вставки во время миграции не нарушили CHECK.
+    boundary = _add_months(today, 2)
+
+    # Шаг 1 (без длительных блокировок): индексы под новый первичный ключ и проверенный CHECK по границе
+    with op.get_context().autocommit_block():
+        for table, (pk, _, _) in TABLES.items():
+            op.execute(
+                f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {table}_legacy_pkey "
+                f"ON {table} ({pk}, created_at)"
+            )
+            op.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {table}_legacy_created_at_check "
+                f"CHECK (created_at < '{boundary.isoformat()}') NOT VALID"
+            )
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {table}_legacy_created_at_check")
+
+    # Шаг 2 (короткая транзакция, только изменения каталога): подмена таблиц
+    for table_name, (constraint_name, _) in INBOUND_FOREIGN_KEYS.items():
+        op.execute(f"ALTER TABLE {table_name} DROP CONSTRAINT IF EXISTS {constraint_name}")
+    op.create_index(
+        "ix_cryptocurrency_replenishment_operation_id", "cryptocurrency_replenishment", ["operation_id"]
+    )
+
+    for table, (pk, indexes, foreign_keys) in TABLES.items():
+        legacy = f"{table}_legacy"
+        op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+        op.execute(
+            f"ALTER TABLE {legacy} DROP CONSTRAINT {table}_pkey, "
+            f"ADD CONSTRAINT {legacy}_pkey PRIMARY KEY USING INDEX {legacy}_pkey"
+        )
+        for index_name in indexes:
+            op.execute(f"ALTER INDEX {index_name} RENAME TO {index_name.replace(table, legacy, 1)}")
+
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)"
+        )
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({pk}, created_at)")
+        for index_name, columns in indexes.items():
+            op.execute(f"CREATE INDEX {index_name} ON {table} {columns}")
+        for constraint_name, definition in foreign_keys.items():
+            op.execute(f"ALTER TABLE {legacy} RENAME CONSTRAINT {constraint_name} TO {legacy}_{constraint_name}")
+            op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {constraint_name} {definition}")
+
+        # Проверенный CHECK позволяет подключить секцию без сканирования
+        op.execute(
+            f"ALTER TABLE {table} ATTACH PARTITION {legacy} "
+            f"FOR VALUES FROM (MINVALUE) TO ('{boundary.isoformat()}')"
+        )
+        for offset in range(MONTHS_AHEAD + 1):
+            start = _add_months(boundary, offset)
+            end = _add_months(start, 1)
+            op.execute(
+                f"CREATE TABLE {table}_y{start.year}m{start.month:02d} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, (pk, indexes, foreign_keys) in TABLES.items():
+        legacy = f"{table}_legacy"
+        op.execute(f"ALTER TABLE {table} DETACH PARTITION {legacy}")
+        op.execute(f"ALTER TABLE {legacy} DROP CONSTRAINT IF EXISTS {table}_legacy_created_at_check")
+        op.execute(f"INSERT INTO {legacy} SELECT * FROM {table}")
+        op.execute(f"DROP TABLE {table}")
+
+        op.execute(f"ALTER TABLE {legacy} RENAME TO {table}")
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {legacy}_pkey")
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({pk})")
+        for index_name in indexes:
+            op.execute(f"ALTER INDEX {index_name.replace(table, legacy, 1)} RENAME TO {index_name}")
+        for constraint_name in foreign_keys:
+            op.execute(f"ALTER TABLE {table} RENAME CONSTRAINT {legacy}_{constraint_name} TO {constraint_name}")
+
+    op.drop_index("ix_cryptocurrency_replenishment_operation_id", table_name="cryptocurrency_replenishment")
+    for table_name, (constraint_name, definition) in INBOUND_FOREIGN_KEYS.items():
+        op.execute(f"ALTER TABLE {table_name} ADD CONSTRAINT {constraint_name} {definition}")
@@ -0,0 +1,44 @@
+"""referral balance bigint
+
+Revision ID: a6c1f08e5b37
+Revises: 3b9e4c2d7f18
+Create Date: 2026-10-19 22:03:48.117254
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a6c1f08e5b37"
+down_revision: Union[str, Sequence[str], None] = "3b9e4c2d7f18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Баланс хранится в микро-единицах USDT: INTEGER переполняется уже на ~2147 USDT
+    op.alter_column(
+        "referral",
+        "balance",
+        existing_type=sa.Integer(),
+        type_=sa.BigInteger(),
+        existing_nullable=False,
+        existing_server_default=sa.text("0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "referral",
+        "balance",
+        existing_type=sa.BigInteger(),
+        type_=sa.Integer(),
+        existing_nullable=False,
+        existing_server_default=sa.text("0"),
+    )
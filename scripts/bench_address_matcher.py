@@ -0,0 +1,114 @@
+import argparse
+import base64
+import binascii
+import hashlib
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from crypto_processing.checksum import BASE58_ALPHABET, keccak256
+from crypto_processing.network import NETWORK_SPECS, WalletAddressMatcher
+
+NETWORKS = ("TRC20", "ERC20", "BEP20", "TON")
+
+
+def _tron_address() -> str:
+    payload = b"\x41" + os.urandom(20)
+    raw = payload + hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
+    number, encoded = int.from_bytes(raw, "big"), ""
+    while number:
+        number, digit = divmod(number, 58)
+        encoded = BASE58_ALPHABET[digit] + encoded
+    return encoded
+
+
+def _evm_address() -> str:
+    hex_address = os.urandom(20).hex()
+    if random.random() < 0.5:
+        return "0x" + hex_address
+    # Адрес с контрольной суммой EIP-55
+    digest = keccak256(hex_address.encode()).hex()
+    return "0x" + "".join(
+        char.upper() if char.isalpha() and int(nibble, 16) >= 8 else char
+        for char, nibble in zip(hex_address, digest)
+    )
+
+
+def _ton_address() -> str:
+    payload = random.choice((b"\x11", b"\x51")) + b"\x00" + os.urandom(32)
+    raw = payload + binascii.crc_hqx(payload, 0).to_bytes(2, "big")
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _invalid_address() -> str:
+    return random.choice((
+        "T" + os.urandom(17).hex()[:33],
+        "0x" + os.urandom(19).hex(),
+        "not-an-address",
+        "",
+    ))
+
+
+def _make_corpus(count: int, unique: int) -> list[str]:
+    """Смешанный набор: по четверти TRON/EVM/TON, остальное — некорректные адреса"""
+    generators = (_tron_address, _evm_address, _ton_address, _invalid_address)
+    pool = [generators[index % len(generators)]() for index in range(unique)]
+    return [random.choice(pool) for _ in range(count)]
+
+
+def _linear_scan(matcher: WalletAddressMatcher):
+    """Прежняя схема: перебор всех сетей, отдельно для match и для get_network_fee"""
+    networks = matcher._networks
+
+    def lookup(address: str):
+        name = next((config.name for config in networks if config.validator(address)), None)
+        fee = next((config.fee for config in networks if config.validator(address)), None)
+        return name, fee
+    return lookup
+
+
+def _measure(name: str, lookup, corpus: list[str]) -> float:
+    started = time.perf_counter()
+    for address in corpus:
+        lookup(address)
+    elapsed = time.perf_counter() - started
+    rate = len(corpus) / elapsed
+    print(f"{name:<16} {rate:>14,.0f} lookups/s")
+    return rate
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Сравнение перебора сетей и диспетчеризации по формату адреса.")
+    parser.add_argument("--count", type=int, default=50_000, help="Количество проверок (по умолчанию: 50000).")
+    parser.add_argument("--unique", type=int, default=2_000, help="Количество разных адресов (по умолчанию: 2000).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed генератора (по умолчанию: 0).")
+    args = parser.parse_args(argv or sys.argv[1:])
+
+    random.seed(args.seed)
+    corpus = _make_corpus(args.count, args.unique)
+    matcher = WalletAddressMatcher(NETWORKS)
+
+    # Диспетчеризация должна давать тот же результат, что и перебор
+    scan = _linear_scan(matcher)
+    for address in set(corpus):
+        config = matcher._resolve(address)
+        assert scan(address) == ((config.name, config.fee) if config else (None, None)), address
+
+    scan_rate = _measure("linear scan", scan, corpus)
+    dispatch_rate = _measure("dispatch", matcher._resolve, corpus)
+    cached_rate = _measure("dispatch+cache", matcher.resolve, corpus)
+    print(f"dispatch x{dispatch_rate / scan_rate:.2f}, with cache x{cached_rate / scan_rate:.2f}")
+
+    matched = sum(matcher.resolve(address) is not None for address in corpus)
+    print(f"matched {matched:,} of {len(corpus):,}; networks: {', '.join(NETWORK_SPECS)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import itertools
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import text
+
+from core.config import settings
+from infra.postgres.pg import create_engine
+
+DEFAULT_QUERY = "SELECT operation_id FROM operation ORDER BY created_at DESC LIMIT 20"
+
+
+async def _worker(engine, query, deadline: float, latencies: list[float]) -> None:
+    statement = text(query)
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        async with engine.connect() as conn:
+            await conn.execute(statement)
+        latencies.append(time.perf_counter() - started)
+
+
+async def _run_case(query: str, concurrency: int, duration: float) -> tuple[float, float, float]:
+    engine = create_engine(settings.POSTGRES_URL, "bench")
+    try:
+        # Прогрев: открываем соединения и наполняем кэш подготовленных выражений
+        await asyncio.gather(*(_worker(engine, query, time.perf_counter() + 0.5, []) for _ in range(concurrency)))
+
+        latencies: list[float] = []
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(*(_worker(engine, query, deadline, latencies) for _ in range(concurrency)))
+    finally:
+        await engine.dispose()
+
+    if not latencies:
+        return 0.0, 0.0, 0.0
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [latencies[0]] * 99
+    return len(latencies) / duration, quantiles[49] * 1000, quantiles[94] * 1000
+
+
+async def _main(args: argparse.Namespace) -> None:
+    print(f"{'pool':>5} {'overflow':>8} {'cache':>6} {'pre_ping':>8} {'pgbouncer':>9} {'ops/s':>10} {'p50 ms':>8} {'p95 ms':>8}")
+    for pool_size, cache_size, pre_ping, pgbouncer in itertools.product(
+        args.pool_sizes, args.cache_sizes, args.pre_ping, args.pgbouncer
+    ):
+        settings.postgres_pool_size = pool_size
+        settings.postgres_max_overflow = args.max_overflow
+        settings.postgres_statement_cache_size = cache_size
+        settings.postgres_pool_pre_ping = pre_ping
+        settings.postgres_pgbouncer = pgbouncer
+
+        throughput, p50, p95 = await _run_case(args.query, args.concurrency, args.duration)
+        print(
+            f"{pool_size:>5} {args.max_overflow:>8} {cache_size:>6} {str(pre_ping):>8} {str(pgbouncer):>9} "
+            f"{throughput:>10,.0f} {p50:>8.2f} {p95:>8.2f}"
+        )
+
+
+def _bool_list(value: str) -> list[bool]:
+    return [item.strip().lower() in ("1", "true", "yes") for item in value.split(",")]
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",")]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Пропускная способность пула соединений Postgres при разных настройках.")
+    parser.add_argument("--query", default=DEFAULT_QUERY, help="SQL-запрос для нагрузки.")
+    parser.add_argument("--concurrency", type=int, default=50, help="Количество одновременных клиентов (по умолчанию: 50).")
+    parser.add_argument("--duration", type=float, default=10.0, help="Длительность каждого прогона в секундах (по умолчанию: 10).")
+    parser.add_argument("--pool-sizes", type=_int_list, default=[5, 10, 20], help="Размеры пула через запятую.")
+    parser.add_argument("--max-overflow", type=int, default=0, help="max_overflow для всех прогонов (по умолчанию: 0).")
+    parser.add_argument("--cache-sizes", type=_int_list, default=[0, 100], help="Размеры кэша выражений через запятую.")
+    parser.add_argument("--pre-ping", type=_bool_list, default=[False], help="Значения pre_ping через запятую.")
+    parser.add_argument("--pgbouncer", type=_bool_list, default=[False], help="Режим PgBouncer через запятую.")
+    args = parser.parse_args(argv or sys.argv[1:])
+
+    asyncio.run(_main(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+import argparse
+import random
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.money import MICROS, format_micros, mul_div, to_micros
+
+NETWORK_FEE = Decimal("2.75")
+NETWORK_FEE_MICROS = 2_750_000
+
+
+def _decimal_withdraw(balance: Decimal, amount: Decimal) -> Decimal:
+    """Прежний расчет вывода: Decimal, перевод в микро-единицы и обратно через float"""
+    units = int((amount + NETWORK_FEE) * 1_000_000)
+    total = Decimal(units / 1_000_000)
+    if balance < total:
+        return balance
+    return balance - total
+
+
+def _micros_withdraw(balance: int, amount: int) -> int:
+    total = amount + NETWORK_FEE_MICROS
+    if balance < total:
+        return balance
+    return balance - total
+
+
+def _decimal_sbp(kopecks: int, exchange: Decimal) -> Decimal:
+    return (Decimal(kopecks) / 100) / exchange
+
+
+def _micros_sbp(kopecks: int, exchange: int) -> int:
+    return mul_div(kopecks * (MICROS // 100), MICROS, exchange)
+
+
+def _decimal_reward(balance: int, commission: Decimal) -> int:
+    reward = commission * Decimal("0.30")
+    return balance + int(reward * Decimal("1000000"))
+
+
+def _micros_reward(balance: int, commission: int) -> int:
+    return balance + mul_div(commission, 30, 100)
+
+
+def _measure(name: str, func, inputs: list[tuple], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for args in inputs:
+            func(*args)
+    elapsed = time.perf_counter() - started
+    rate = len(inputs) * rounds / elapsed
+    print(f"{name:<24} {rate:>14,.0f} ops/s")
+    return rate
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Сравнение расчетов сумм в Decimal и в целых микро-единицах (core.money)."
+    )
+    parser.add_argument("--count", type=int, default=1000, help="Количество сумм в наборе (по умолчанию: 1000).")
+    parser.add_argument("--rounds", type=int, default=200, help="Количество проходов по набору (по умолчанию: 200).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed генератора сумм (по умолчанию: 0).")
+    args = parser.parse_args(argv or sys.argv[1:])
+
+    random.seed(args.seed)
+    amounts = [f"{random.lognormvariate(3.5, 1.0):.2f}" for _ in range(args.count)]
+    balances = [f"{random.lognormvariate(5, 1.0):.6f}" for _ in range(args.count)]
+    kopecks = [random.randint(10_000, 10_000_000) for _ in range(args.count)]
+    exchange = "95.37"
+
+    # Обе реализации должны давать одинаковый результат
+    for amount, balance, rub in zip(amounts, balances, kopecks):
+        assert to_micros(_decimal_withdraw(Decimal(balance), Decimal(amount)), exact=False) == \
+            _micros_withdraw(to_micros(balance), to_micros(amount))
+        assert to_micros(_decimal_sbp(rub, Decimal(exchange)), exact=False) == _micros_sbp(rub, to_micros(exchange))
+
+    paths = (
+        (
+            "withdraw",
+            (_decimal_withdraw, [(Decimal(b), Decimal(a)) for a, b in zip(amounts, balances)]),
+            (_micros_withdraw, [(to_micros(b), to_micros(a)) for a, b in zip(amounts, balances)]),
+        ),
+        (
+            "sbp payment",
+            (_decimal_sbp, [(rub, Decimal(exchange)) for rub in kopecks]),
+            (_micros_sbp, [(rub, to_micros(exchange)) for rub in kopecks]),
+        ),
+        (
+            "referral reward",
+            (_decimal_reward, [(0, Decimal(a) / 100) for a in amounts]),
+            (_micros_reward, [(0, to_micros(a) // 100) for a in amounts]),
+        ),
+    )
+    for name, (decimal_func, decimal_inputs), (micros_func, micros_inputs) in paths:
+        decimal_rate = _measure(f"{name} decimal", decimal_func, decimal_inputs, args.rounds)
+        micros_rate = _measure(f"{name} micros", micros_func, micros_inputs, args.rounds)
+        print(f"{'':<24} x{micros_rate / decimal_rate:.2f}")
+
+    print(f"sample: {amounts[0]} USDT -> {to_micros(amounts[0])} micros -> {format_micros(to_micros(amounts[0]), 2)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+import argparse
+import json
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from api.v1.notification.codec import encode_notification, decode_notification
+
+
+def _make_notifications(count: int) -> list[dict]:
+    """Набор уведомлений в том виде, в котором их формирует BaseService._send_notification"""
+    samples = []
+    for index in range(count):
+        base = {
+            "notification_id": str(uuid.uuid4()),
+            "created_at": datetime.utcnow().isoformat(),
+            "read": index % 3 == 0,
+            "image_url": None,
+            "detail_image_url": None,
+        }
+        kind = index % 3
+        if kind == 0:
+            operation_id = str(uuid.uuid4())
+            samples.append({
+                **base,
+                "type": "operation_status",
+                "title": "Статус операции изменен",
+                "message": f"Статус операции {operation_id[:8]} изменен на confirmed на сумму 101.5 USDt",
+                "operation_id": operation_id,
+                "operation_status": "confirmed",
+                "amount": 101.5,
+            })
+        elif kind == 1:
+            samples.append({
+                **base,
+                "type": "referral_deposit",
+                "title": "Начисление на реферальный баланс",
+                "message": "Начислено 5.0 USDt от реферала 123456789",
+                "amount": 5.0,
+                "source_referral_id": 123456789,
+                "source_username": None,
+            })
+        else:
+            samples.append({
+                **base,
+                "type": "referral_join",
+                "title": "Новый реферал",
+                "message": "К вам присоединился новый реферал 987654321",
+                "referral_id": 987654321,
+                "referral_username": None,
+            })
+    return samples
+
+
+def _measure(name: str, encode, decode, notifications: list[dict], rounds: int) -> None:
+    encoded = [encode(n) for n in notifications]
+    size = sum(len(raw.encode("utf-8")) for raw in encoded)
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for notification in notifications:
+            encode(notification)
+    encode_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for raw in encoded:
+            decode(raw)
+    decode_elapsed = time.perf_counter() - started
+
+    total = len(notifications) * rounds
+    print(
+        f"{name:<8} {size / len(notifications):>10.1f} B/notif "
+        f"{total / encode_elapsed:>12,.0f} enc/s "
+        f"{total / decode_elapsed:>12,.0f} dec/s"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Сравнение форматов хранения уведомлений в Redis.")
+    parser.add_argument("--count", type=int, default=100, help="Количество уведомлений в наборе (по умолчанию: 100).")
+    parser.add_argument("--rounds", type=int, default=200, help="Количество проходов по набору (по умолчанию: 200).")
+    args = parser.parse_args(argv or sys.argv[1:])
+
+    notifications = _make_notifications(args.count)
+    _measure("json", json.dumps, json.loads, notifications, args.rounds)
+    _measure("compact", encode_notification, decode_notification, notifications, args.rounds)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+import argparse
+import asyncio
+import sys
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import func, select
+
+from api.v1.webhook.schemas import CryptocurrencyReplenishmentCreate
+from api.v1.webhook.service import WebhookService
+from core.money import Money, format_micros
+from infra.postgres.models import CryptocurrencyReplenishment, Operation, Wallet, WalletAddress
+from infra.postgres.pg import async_session_factory, engine
+from infra.postgres.uow import PostgresUnitOfWork
+
+
+async def _wallet_balance(address: str) -> Money:
+    async with async_session_factory() as db:
+        stmt = (
+            select(Wallet.balance)
+            .join(WalletAddress, WalletAddress.wallet_id == Wallet.wallet_id)
+            .where(WalletAddress.address == address)
+        )
+        balance = (await db.execute(stmt)).scalar_one_or_none()
+    if balance is None:
+        raise SystemExit(f"Wallet with address {address} is not found")
+    return balance
+
+
+async def _deliver(deposit: CryptocurrencyReplenishmentCreate, start: asyncio.Event) -> None:
+    uow = PostgresUnitOfWork(session_factory=async_session_factory)
+    await start.wait()
+    try:
+        await WebhookService(uow=uow).apply_deposits([deposit])
+        await uow.release()
+    except Exception:
+        await uow.release(commit=False)
+        raise
+
+
+async def _run(address: str, amount: Decimal, duplicates: int) -> bool:
+    deposit = CryptocurrencyReplenishmentCreate(
+        tx_id=f"dedup-check-{uuid4().hex}",
+        from_address="dedup-check",
+        to_address=address,
+        amount=amount,
+        crypto_type="USDT",
+        type="refill",
+    )
+    try:
+        balance_before = await _wallet_balance(address)
+
+        # Все доставки стартуют одновременно и конкурируют за вставку одного tx_id
+        start = asyncio.Event()
+        tasks = [asyncio.create_task(_deliver(deposit, start)) for _ in range(duplicates)]
+        await asyncio.sleep(0.1)
+        start.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        errors = [result for result in results if isinstance(result, Exception)]
+
+        balance_after = await _wallet_balance(address)
+        async with async_session_factory() as db:
+            replenishments = (await db.execute(
+                select(func.count()).where(CryptocurrencyReplenishment.tx_id == deposit.tx_id)
+            )).scalar_one()
+            operations = (await db.execute(
+                select(func.count())
+                .select_from(Operation)
+                .join(CryptocurrencyReplenishment, CryptocurrencyReplenishment.operation_id == Operation.operation_id)
+                .where(CryptocurrencyReplenishment.tx_id == deposit.tx_id)
+            )).scalar_one()
+            credited = (await db.execute(
+                select(Operation.amount)
+                .join(CryptocurrencyReplenishment, CryptocurrencyReplenishment.operation_id == Operation.operation_id)
+                .where(CryptocurrencyReplenishment.tx_id == deposit.tx_id)
+            )).scalar_one()
+    finally:
+        await engine.dispose()
+
+    print(f"duplicates:      {duplicates}")
+    print(f"errors:          {len(errors)} {errors[:1]}")
+    print(f"replenishments:  {replenishments}")
+    print(f"operations:      {operations}")
+    print(f"balance delta:   {format_micros(balance_after - balance_before)} (expected {format_micros(credited)})")
+    return not errors and replenishments == 1 and operations == 1 and balance_after - balance_before == credited
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Проверка однократного зачисления при параллельной доставке одного вебхука."
+    )
+    parser.add_argument("--address", required=True, help="Депозитный адрес существующего тестового кошелька.")
+    parser.add_argument("--amount", type=Decimal, default=Decimal("10"), help="Сумма пополнения (по умолчанию: 10).")
+    parser.add_argument("--duplicates", type=int, default=20, help="Количество параллельных доставок (по умолчанию: 20).")
+    args = parser.parse_args(argv or sys.argv[1:])
+
+    ok = asyncio.run(_run(args.address, args.amount, args.duplicates))
+    print("OK: credited exactly once" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
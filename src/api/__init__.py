@@ -12,6 +12,8 @@ from api.v1 import (
     rapira_router,
 )
 from api.v1.notification.router import router as notification_router
+from api.v1.admin.router import router as admin_router
+from api.v1.home.router import router as home_router
 
 
 v1_router = APIRouter(prefix="/api/v1", tags=["v1"])
@@ -24,6 +26,8 @@ v1_router.include_router(payment_router)
 v1_router.include_router(referral_router)
 v1_router.include_router(rapira_router)
 v1_router.include_router(notification_router)
+v1_router.include_router(admin_router)
+v1_router.include_router(home_router)
 
 
 __all__ = [
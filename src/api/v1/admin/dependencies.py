@@ -0,0 +1,16 @@
+import hmac
+from typing import Annotated
+
+from fastapi import Depends, Header, HTTPException, status
+
+from core.config import settings
+
+
+async def verify_admin_token(x_admin_token: Annotated[str, Header()] = "") -> None:
+    if not settings.admin_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if not hmac.compare_digest(x_admin_token.encode(), settings.admin_token.encode()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden access.")
+
+
+AdminDep = Annotated[None, Depends(verify_admin_token)]
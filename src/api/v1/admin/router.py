@@ -0,0 +1,19 @@
+from fastapi import APIRouter, status
+
+from api.v1.admin.dependencies import AdminDep
+from api.v1.admin.schemas import SlowQueryResponse
+from infra.postgres.slow_queries import slow_query_recorder
+
+router = APIRouter(prefix="/admin", tags=["Admin"], include_in_schema=False)
+
+
+@router.get(
+    "/slow-queries",
+    status_code=status.HTTP_200_OK,
+    response_model=list[SlowQueryResponse],
+    summary="Последние медленные SQL-запросы",
+    description="Кольцевой буфер медленных запросов текущего процесса (новые первыми). "
+                "Требует заголовок `X-Admin-Token`.",
+)
+async def get_slow_queries(_admin: AdminDep):
+    return slow_query_recorder.recent()
@@ -0,0 +1,14 @@
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SlowQueryResponse(BaseModel):
+    statement: str = Field(..., description="SQL-запрос с плейсхолдерами")
+    parameters: Any = Field(None, description="Типы параметров (значения скрыты)")
+    duration_ms: float = Field(..., description="Длительность выполнения в миллисекундах")
+    engine: str = Field(..., description="Пул, на котором выполнялся запрос (primary/replica)")
+    recorded_at: str = Field(..., description="Время фиксации (UTC)")
+    plan: Any = Field(None, description="План EXPLAIN (ANALYZE, BUFFERS) в JSON, если снимался")
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,58 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from telegram_webapp_auth.auth import WebAppInitData
+
+
+@dataclass
+class CachedInitData:
+    init_data: WebAppInitData
+    expires_at: float
+    registered: bool = False
+
+
+class InitDataCache:
+    """
+    Ограниченный LRU-кэш провалидированных initData в памяти процесса.
+
+    Ключ — sha256 от исходной строки, поэтому повторная HMAC-проверка и разбор
+    initData выполняются только для новых строк. Запись живёт не дольше ttl
+    и не дольше auth_date + max_age (если max_age задан).
+    """
+
+    def __init__(self, maxsize: int, ttl: int, max_age: int = 0):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._max_age = max_age
+        self._entries: OrderedDict[bytes, CachedInitData] = OrderedDict()
+
+    @staticmethod
+    def _key(raw_init_data: str) -> bytes:
+        return hashlib.sha256(raw_init_data.encode()).digest()
+
+    def get(self, raw_init_data: str) -> CachedInitData | None:
+        key = self._key(raw_init_data)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, raw_init_data: str, init_data: WebAppInitData) -> CachedInitData:
+        expires_at = time.time() + self._ttl
+        if self._max_age:
+            expires_at = min(expires_at, init_data.auth_date + self._max_age)
+
+        entry = CachedInitData(init_data=init_data, expires_at=expires_at)
+        if self._maxsize <= 0:
+            return entry
+
+        self._entries[self._key(raw_init_data)] = entry
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return entry
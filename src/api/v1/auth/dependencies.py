@@ -1,15 +1,21 @@
 import logging
 from dataclasses import dataclass
+from datetime import timedelta
+from functools import lru_cache
 from typing import AsyncIterator, Annotated
 
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security.http import HTTPAuthorizationCredentials, HTTPBase
 from telegram_webapp_auth.auth import TelegramAuthenticator, generate_secret_key, WebAppUser
-from telegram_webapp_auth.errors import InvalidInitDataError
+from telegram_webapp_auth.errors import InvalidInitDataError, ExpiredInitDataError
 
+from api.v1.auth.cache import InitDataCache, CachedInitData
+from api.v1.auth.session import session_tokens, session_deny_list, SessionClaims
 from api.v1.auth.service import RegisterService, LoginService
 from core.config import settings
-from crypto_processing.client import CryptoProcessingClient
+from crypto_processing.dependencies import CryptoProcessingClientDep
+from infra.postgres.routing import current_user_id
 from infra.postgres.uow import PostgresUnitOfWorkDep
 from infra.redis.dependencies import RedisDep
 
@@ -17,6 +23,15 @@ logger = logging.getLogger(__name__)
 
 telegram_authentication_schema = HTTPBase(scheme="Bearer")
 
+init_data_cache = InitDataCache(
+    maxsize=settings.telegram_init_data_cache_size,
+    ttl=settings.telegram_init_data_cache_ttl,
+    max_age=settings.telegram_init_data_max_age,
+)
+init_data_max_age = (
+    timedelta(seconds=settings.telegram_init_data_max_age) if settings.telegram_init_data_max_age else None
+)
+
 
 @dataclass(frozen=True)
 class AuthUserContext:
@@ -24,16 +39,21 @@ class AuthUserContext:
     is_new_user: bool
 
 
+@lru_cache
 def get_telegram_authenticator() -> TelegramAuthenticator:
     secret_key = generate_secret_key(settings.telegram_bot_token)
     return TelegramAuthenticator(secret_key)
 
 
-async def get_register_service(uow: PostgresUnitOfWorkDep, redis: RedisDep) -> AsyncIterator[RegisterService]:
+async def get_register_service(
+    uow: PostgresUnitOfWorkDep,
+    redis: RedisDep,
+    crypto_processing_client: CryptoProcessingClientDep,
+) -> AsyncIterator[RegisterService]:
     yield RegisterService(
         uow=uow,
         redis=redis,
-        crypto_processing_client=CryptoProcessingClient(),
+        crypto_processing_client=crypto_processing_client,
     )
 
 
@@ -44,24 +64,27 @@ async def get_login_service(uow: PostgresUnitOfWorkDep, redis: RedisDep) -> Asyn
     )
 
 
-async def _build_auth_user_context(
-    service: RegisterService,
+def _validate_init_data(
     auth_cred: HTTPAuthorizationCredentials,
     telegram_authenticator: TelegramAuthenticator,
-) -> AuthUserContext:
+) -> CachedInitData:
+    cached = init_data_cache.get(auth_cred.credentials)
+    if cached is not None:
+        return cached
+
     try:
-        init_data = telegram_authenticator.validate(auth_cred.credentials)
-    except InvalidInitDataError as e:
+        init_data = telegram_authenticator.validate(auth_cred.credentials, expr_in=init_data_max_age)
+    except (InvalidInitDataError, ExpiredInitDataError) as e:
         preview = auth_cred.credentials[:64] + "..." if auth_cred.credentials else "<empty>"
         logger.warning(
             "Telegram initData validation failed: %s (len=%s, preview=%s)",
-            str(e),
+            str(e) or e.__class__.__name__,
             len(auth_cred.credentials) if auth_cred.credentials else 0,
             preview,
         )
         detail = "Forbidden access."
         if getattr(settings, "DEBUG", False):
-            detail = f"Forbidden access. Invalid initData: {str(e)}"
+            detail = f"Forbidden access. Invalid initData: {str(e) or e.__class__.__name__}"
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
     except Exception:
         logger.exception("Unexpected error during Telegram initData validation")
@@ -70,12 +93,49 @@ async def _build_auth_user_context(
     if init_data.user is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User not found in initData.")
 
-    tg_user = init_data.user
-    user_exists = await service.exist(tg_user.id)
-    if not user_exists:
-        referral_code = getattr(init_data, 'start_param', None)
-        await service.register_user(tg_user.id, referral_code=referral_code)
+    return init_data_cache.put(auth_cred.credentials, init_data)
+
+
+async def _decode_session_token(service: RegisterService, token: str) -> SessionClaims:
+    try:
+        claims = session_tokens.decode(token)
+    except jwt.InvalidTokenError:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired session token.")
+
+    if session_deny_list.is_stale():
+        await session_deny_list.refresh(service.redis)
+    if session_deny_list.is_revoked(claims.jti):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Session revoked.")
+    return claims
+
+
+async def _register_if_needed(service: RegisterService, cached: CachedInitData, user_exists: bool) -> None:
+    if user_exists:
+        # Пользователь уже был в БД до этого запроса — повторно проверять не нужно
+        cached.registered = True
+        return
+
+    referral_code = getattr(cached.init_data, 'start_param', None)
+    await service.register_user(cached.init_data.user.id, referral_code=referral_code)
+
+
+async def _build_auth_user_context(
+    service: RegisterService,
+    auth_cred: HTTPAuthorizationCredentials,
+    telegram_authenticator: TelegramAuthenticator,
+) -> AuthUserContext:
+    if session_tokens.looks_like_token(auth_cred.credentials):
+        # Сессионный токен выдается только зарегистрированному пользователю
+        claims = await _decode_session_token(service, auth_cred.credentials)
+        return AuthUserContext(user=claims.user, is_new_user=False)
+
+    cached = _validate_init_data(auth_cred, telegram_authenticator)
+    tg_user = cached.init_data.user
+    if cached.registered:
+        return AuthUserContext(user=tg_user, is_new_user=False)
 
+    user_exists = await service.exist(tg_user.id)
+    await _register_if_needed(service, cached, user_exists)
     return AuthUserContext(user=tg_user, is_new_user=not user_exists)
 
 
@@ -84,23 +144,79 @@ async def get_current_user_with_registration_status(
     auth_cred: Annotated[HTTPAuthorizationCredentials, Depends(telegram_authentication_schema)],
     telegram_authenticator: Annotated[TelegramAuthenticator, Depends(get_telegram_authenticator)],
 ) -> AuthUserContext:
-    return await _build_auth_user_context(service, auth_cred, telegram_authenticator)
+    context = await _build_auth_user_context(service, auth_cred, telegram_authenticator)
+    # Регистрация фиксируется сразу, соединение не удерживается до конца запроса
+    await service.uow.release()
+    current_user_id.set(context.user.id)
+    return context
 
 
-async def get_current_user(
+async def get_current_session(
+    service: Annotated[RegisterService, Depends(get_register_service)],
+    auth_cred: Annotated[HTTPAuthorizationCredentials, Depends(telegram_authentication_schema)],
+) -> SessionClaims:
+    if not session_tokens.looks_like_token(auth_cred.credentials):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Session token required.")
+    return await _decode_session_token(service, auth_cred.credentials)
+
+
+async def get_current_user_by_init_data(
     service: Annotated[RegisterService, Depends(get_register_service)],
     auth_cred: Annotated[HTTPAuthorizationCredentials, Depends(telegram_authentication_schema)],
     telegram_authenticator: Annotated[TelegramAuthenticator, Depends(get_telegram_authenticator)],
 ) -> WebAppUser:
-    auth_context = await _build_auth_user_context(service, auth_cred, telegram_authenticator)
-    if not await service.is_login(auth_context.user.id):
+    cached = _validate_init_data(auth_cred, telegram_authenticator)
+    tg_user = cached.init_data.user
+
+    if cached.registered:
+        logged_in = await service.is_login(tg_user.id)
+    else:
+        user_exists, logged_in = await service.get_auth_state(tg_user.id)
+        await _register_if_needed(service, cached, user_exists)
+        if not user_exists:
+            logged_in = await service.is_login(tg_user.id)
+
+    if not logged_in:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="need to log in.")
 
-    return auth_context.user
+    await service.uow.release()
+    current_user_id.set(tg_user.id)
+    return tg_user
+
+
+async def get_registered_user_by_init_data(
+    service: Annotated[RegisterService, Depends(get_register_service)],
+    auth_cred: Annotated[HTTPAuthorizationCredentials, Depends(telegram_authentication_schema)],
+    telegram_authenticator: Annotated[TelegramAuthenticator, Depends(get_telegram_authenticator)],
+) -> WebAppUser:
+    """Проверяет initData и регистрирует пользователя без проверки входа: код входа проверяет обработчик"""
+    cached = _validate_init_data(auth_cred, telegram_authenticator)
+    tg_user = cached.init_data.user
+    if not cached.registered:
+        await _register_if_needed(service, cached, await service.exist(tg_user.id))
+
+    await service.uow.release()
+    current_user_id.set(tg_user.id)
+    return tg_user
+
+
+async def get_current_user(
+    service: Annotated[RegisterService, Depends(get_register_service)],
+    auth_cred: Annotated[HTTPAuthorizationCredentials, Depends(telegram_authentication_schema)],
+    telegram_authenticator: Annotated[TelegramAuthenticator, Depends(get_telegram_authenticator)],
+) -> WebAppUser:
+    if session_tokens.looks_like_token(auth_cred.credentials):
+        # Подпись токена проверяется локально: ни HMAC initData, ни Redis, ни БД на каждый запрос
+        claims = await _decode_session_token(service, auth_cred.credentials)
+        current_user_id.set(claims.user.id)
+        return claims.user
+    return await get_current_user_by_init_data(service, auth_cred, telegram_authenticator)
 
 
 LoginServiceDep = Annotated[LoginService, Depends(get_login_service)]
 UserAuthDep = Annotated[WebAppUser, Depends(get_current_user)]
+InitDataUserDep = Annotated[WebAppUser, Depends(get_registered_user_by_init_data)]
+SessionDep = Annotated[SessionClaims, Depends(get_current_session)]
 UserWithRegistrationStatusDep = Annotated[
     AuthUserContext,
     Depends(get_current_user_with_registration_status),
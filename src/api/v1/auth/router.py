@@ -1,7 +1,7 @@
 from fastapi import APIRouter, status
 
-from api.v1.auth.schemas import UserLogin
-from api.v1.auth.dependencies import LoginServiceDep
+from api.v1.auth.schemas import UserLogin, SessionCreate, SessionTokenResponse
+from api.v1.auth.dependencies import LoginServiceDep, InitDataUserDep, SessionDep
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
@@ -71,3 +71,49 @@ async def login_user(data: UserLogin, service: LoginServiceDep):
     После успешной аутентификации пользователь получает доступ к защищенным эндпоинтам API.
     """
     await service.login_by_code(data)
+
+
+@router.post(
+    "/session",
+    response_model=SessionTokenResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Получить сессионный токен",
+    description="Обмен Telegram initData на короткоживущий подписанный токен.\n\n"
+                "Токен передается в заголовке `Authorization: Bearer <token>` вместо initData: "
+                "он проверяется локально по подписи, без повторной валидации initData и запросов в Redis/БД.\n\n"
+                "**Требования:**\n"
+                "- В заголовке передается initData (не сессионный токен)\n"
+                "- Если у пользователя установлен код входа и вход еще не выполнен, нужно передать `entry_code`\n",
+    responses={
+        201: {"description": "Токен выдан"},
+        401: {
+            "description": "Неверный или отсутствующий код входа",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "error": "Invalid entry code for user with telegram_id 123456789",
+                        "type": "InvalidEntryCodeError"
+                    }
+                }
+            }
+        },
+    }
+)
+async def create_session(user: InitDataUserDep, service: LoginServiceDep, data: SessionCreate | None = None):
+    """Выдать сессионный токен по initData"""
+    return await service.create_session(user, entry_code=data.entry_code if data else None)
+
+
+@router.delete(
+    "/session",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Завершить сессию",
+    description="Отзыв текущего сессионного токена. Токен попадает в список отозванных до истечения срока действия.",
+    responses={
+        204: {"description": "Сессия завершена"},
+        401: {"description": "Токен недействителен или уже отозван"},
+    }
+)
+async def revoke_session(session: SessionDep, service: LoginServiceDep):
+    """Отозвать текущий сессионный токен"""
+    await service.revoke_session(session)
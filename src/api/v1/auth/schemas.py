@@ -17,3 +17,19 @@ class UserLogin(UserBase):
         description="Уникальный идентификатор пользователя в Telegram",
         examples=[123456789, 987654321, 555666777]
     )
+
+
+class SessionCreate(BaseModel):
+    entry_code: str | None = Field(
+        None,
+        description="4-значный код входа (обязателен, если у пользователя установлен код и вход еще не выполнен)",
+        min_length=4,
+        max_length=4,
+        examples=["1234"]
+    )
+
+
+class SessionTokenResponse(BaseModel):
+    access_token: str = Field(..., description="Подписанный сессионный токен для заголовка Authorization")
+    token_type: str = Field("Bearer", description="Тип токена")
+    expires_at: int = Field(..., description="Время истечения токена (unix timestamp)")
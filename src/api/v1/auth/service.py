@@ -1,9 +1,12 @@
 from logging import getLogger
 from uuid import uuid4
 
+from telegram_webapp_auth.auth import WebAppUser
+
 from api.v1.base.service import BaseService
-from api.v1.auth.schemas import UserLogin
-from infra.postgres.models import User, Referral, Wallet, WalletCurrency
+from api.v1.auth.schemas import UserLogin, SessionTokenResponse
+from api.v1.auth.session import session_tokens, session_deny_list, SessionClaims
+from infra.postgres.models import User, Referral, Wallet, WalletCurrency, WalletAddress
 from api.v1.auth.exceptions import InvalidEntryCodeError
 
 logger = getLogger(__name__)
@@ -18,27 +21,43 @@ class RegisterService(BaseService):
 
     async def exist(self, telegram_id: int) -> bool:
         key = f"{self.USER_REDIS_SPACENAME}:{telegram_id}"
-        if await self.redis.exists(key):
-            await self.redis.set(key, "", self.USER_REDIS_EXPIRE)
-            return True
-
-        user_exist = await self.uow.user.exists(telegram_id)
-        if user_exist:
-            await self.redis.set(key, "", self.USER_REDIS_EXPIRE)
+        if await self.redis.getex(key, self.USER_REDIS_EXPIRE) is not None:
             return True
-        return False
+        return await self._load_exist(telegram_id)
 
     async def is_login(self, telegram_id: int) -> bool:
         key = f"{self.USER_LOGIN_REDIS_SPACENAME}:{telegram_id}"
-        if await self.redis.exists(key):
-            await self.redis.set(key, "", self.USER_LOGIN_REDIS_EXPIRE)
+        if await self.redis.getex(key, self.USER_LOGIN_REDIS_EXPIRE) is not None:
             return True
+        return await self._load_is_login(telegram_id)
+
+    async def get_auth_state(self, telegram_id: int) -> tuple[bool, bool]:
+        """Проверяет регистрацию и вход пользователя одним запросом в Redis"""
+        user_cached, login_cached = await self.redis.getex_many([
+            (f"{self.USER_REDIS_SPACENAME}:{telegram_id}", self.USER_REDIS_EXPIRE),
+            (f"{self.USER_LOGIN_REDIS_SPACENAME}:{telegram_id}", self.USER_LOGIN_REDIS_EXPIRE),
+        ])
+        user_exists = user_cached is not None or await self._load_exist(telegram_id)
+        if not user_exists:
+            return False, False
+
+        logged_in = login_cached is not None or await self._load_is_login(telegram_id)
+        return True, logged_in
+
+    async def _load_exist(self, telegram_id: int) -> bool:
+        user_exist = await self.uow.user.exists(telegram_id)
+        if user_exist:
+            await self.redis.set(f"{self.USER_REDIS_SPACENAME}:{telegram_id}", "", self.USER_REDIS_EXPIRE)
+        return user_exist
 
+    async def _load_is_login(self, telegram_id: int) -> bool:
         has_entry_code = await self.uow.user.has_entry_code(telegram_id)
-        if not has_entry_code:
-            return True
+        if has_entry_code:
+            return False
 
-        return False
+        # Без кода входа пользователь считается вошедшим: кэшируем, чтобы не ходить в БД на каждый запрос
+        await self.redis.set(f"{self.USER_LOGIN_REDIS_SPACENAME}:{telegram_id}", "", self.USER_LOGIN_REDIS_EXPIRE)
+        return True
 
     async def register_user(self, telegram_id: int, referral_code: str | None = None) -> None:
         await self._create_user(telegram_id)
@@ -74,16 +93,21 @@ class RegisterService(BaseService):
             )
 
     async def _create_wallet(self, telegram_id: int) -> None:
-        async with self.crypto_processing_client as client:
-            address = await client.register_client()
+        address = await self.uow.deposit_address.claim()
+        if address is None:
+            logger.warning("Deposit address pool is empty, registering address for user %s directly", telegram_id)
+            address = (await self.crypto_processing_client.register_client()).trxAddress
 
-        await self.uow.wallet.add(
+        wallet = await self.uow.wallet.add(
             Wallet(
                 telegram_id=telegram_id,
                 currency=WalletCurrency.USDT,
-                addresses=[address.trxAddress],
+                addresses=[address],
             )
         )
+        await self.uow.wallet_address.add(
+            WalletAddress(address=address, wallet_id=wallet.wallet_id, network="TRC20")
+        )
 
     @staticmethod
     def __generate_referral_code() -> str:
@@ -107,3 +131,16 @@ class LoginService(BaseService):
         if not checked:
             raise InvalidEntryCodeError(f"Invalid entry code for user with telegram_id {login_data.telegram_id}")
         await self.redis.set(key, "", self.USER_LOGIN_REDIS_EXPIRE)
+
+    async def create_session(self, user: WebAppUser, entry_code: str | None = None) -> SessionTokenResponse:
+        """Выдает сессионный токен после проверки initData и, при необходимости, кода входа"""
+        if entry_code is not None:
+            await self.login_by_code(UserLogin(telegram_id=user.id, entry_code=entry_code))
+        elif not await RegisterService(uow=self.uow, redis=self.redis).is_login(user.id):
+            raise InvalidEntryCodeError(f"Entry code required for user with telegram_id {user.id}")
+
+        token, expires_at = session_tokens.issue(user)
+        return SessionTokenResponse(access_token=token, expires_at=expires_at)
+
+    async def revoke_session(self, session: SessionClaims) -> None:
+        await session_deny_list.revoke(self.redis, session.jti, session.expires_at)
@@ -0,0 +1,97 @@
+import dataclasses
+import hashlib
+import hmac
+import time
+from uuid import uuid4
+
+import jwt
+from telegram_webapp_auth.auth import WebAppUser
+
+from core.config import settings
+from infra.redis.redis_api import RedisAPI
+
+
+@dataclasses.dataclass(frozen=True)
+class SessionClaims:
+    user: WebAppUser
+    jti: str
+    expires_at: int
+
+
+class SessionTokenManager:
+    """Выпуск и проверка подписанных сессионных токенов (проверка выполняется без обращения к Redis и БД)"""
+    ALGORITHM = "HS256"
+
+    def __init__(self, secret: bytes, ttl: int):
+        self._secret = secret
+        self._ttl = ttl
+
+    @staticmethod
+    def looks_like_token(credentials: str) -> bool:
+        """initData — это query-строка, а JWT — три base64url-сегмента через точку"""
+        return credentials.count(".") == 2 and "=" not in credentials and "&" not in credentials
+
+    def issue(self, user: WebAppUser) -> tuple[str, int]:
+        now = int(time.time())
+        expires_at = now + self._ttl
+        payload = {
+            "sub": str(user.id),
+            "iat": now,
+            "exp": expires_at,
+            "jti": uuid4().hex,
+            "usr": {k: v for k, v in dataclasses.asdict(user).items() if v is not None},
+        }
+        return jwt.encode(payload, self._secret, algorithm=self.ALGORITHM), expires_at
+
+    def decode(self, token: str) -> SessionClaims:
+        """Raises jwt.InvalidTokenError, если токен поддельный или истёк"""
+        payload = jwt.decode(
+            token,
+            self._secret,
+            algorithms=[self.ALGORITHM],
+            options={"require": ["sub", "exp", "jti"]},
+        )
+        user_data = {"first_name": "", **(payload.get("usr") or {}), "id": int(payload["sub"])}
+        user = WebAppUser(**user_data)
+        return SessionClaims(user=user, jti=payload["jti"], expires_at=payload["exp"])
+
+
+class SessionDenyList:
+    """
+    Список отозванных токенов.
+
+    Хранится в Redis (sorted set jti -> exp), в каждом процессе держится локальная копия,
+    которая обновляется не чаще раза в REFRESH_INTERVAL секунд.
+    """
+    REDIS_KEY = "session:denylist"
+    REFRESH_INTERVAL = 10
+
+    def __init__(self):
+        self._revoked: set[str] = set()
+        self._refreshed_at: float = 0.0
+
+    def is_revoked(self, jti: str) -> bool:
+        return jti in self._revoked
+
+    def is_stale(self) -> bool:
+        return time.monotonic() - self._refreshed_at >= self.REFRESH_INTERVAL
+
+    async def refresh(self, redis: RedisAPI) -> None:
+        now = int(time.time())
+        await redis.zremrangebyscore(self.REDIS_KEY, "-inf", now)
+        self._revoked = set(await redis.zrange(self.REDIS_KEY, 0, -1))
+        self._refreshed_at = time.monotonic()
+
+    async def revoke(self, redis: RedisAPI, jti: str, expires_at: int) -> None:
+        await redis.zadd(self.REDIS_KEY, {jti: expires_at})
+        self._revoked.add(jti)
+
+
+def _session_secret() -> bytes:
+    if settings.session_secret_key:
+        return settings.session_secret_key.encode()
+    return hmac.new(b"ereon-session", settings.telegram_bot_token.encode(), hashlib.sha256).digest()
+
+
+session_tokens = SessionTokenManager(secret=_session_secret(), ttl=settings.session_token_ttl)
+session_deny_list = SessionDenyList()
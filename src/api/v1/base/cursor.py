@@ -0,0 +1,23 @@
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from api.v1.base.exceptions import InvalidCursorError
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, obj_id: UUID) -> str:
+    """Непрозрачный курсор по ключу сортировки (created_at, id)"""
+    raw = f"{created_at.isoformat()}|{obj_id.hex}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, obj_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(hex=obj_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor}")
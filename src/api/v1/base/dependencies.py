@@ -7,8 +7,9 @@ from api.v1.base.schemas import PaginationParams
 def pagination_params(
     limit: int | None = Query(None, ge=1, le=100),
     offset: int | None = Query(None, ge=0),
+    cursor: str | None = Query(None),
 ) -> PaginationParams:
-    return PaginationParams(limit=limit, offset=offset)
+    return PaginationParams(limit=limit, offset=offset, cursor=cursor)
 
 
 PaginationDep = Annotated[PaginationParams, Depends(pagination_params)]
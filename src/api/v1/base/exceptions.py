@@ -0,0 +1,6 @@
+class InvalidCursorError(Exception):
+    """Некорректный курсор пагинации"""
+
+    def __init__(self, message: str = "Invalid pagination cursor"):
+        self.message = message
+        super().__init__(self.message)
@@ -1,19 +1,43 @@
-from decimal import Decimal
 from typing import Annotated
 
 from fastapi import Query
-from pydantic import BaseModel
+from pydantic import BaseModel, BeforeValidator, WithJsonSchema
 from pydantic.functional_serializers import PlainSerializer
 
-DisplayDecimal = Annotated[
-    Decimal,
-    PlainSerializer(
-        lambda v: str(v.quantize(Decimal("0.01"))),
-        return_type=str,
-    ),
+from core.money import Money, format_micros, to_float, to_micros
+
+# Суммы в USDT внутри приложения — int в микро-единицах (core.money).
+# Входящие значения из запросов задаются в USDT и переводятся в микро-единицы при валидации;
+# значения из моделей БД уже в микро-единицах и только форматируются при сериализации в JSON.
+
+MoneyAmount = Annotated[
+    Money,
+    BeforeValidator(to_micros),
+    PlainSerializer(format_micros, return_type=str, when_used="json"),
+    WithJsonSchema({"type": "string", "format": "decimal"}),
+]
+"""Сумма из запроса в USDT (строка или число, не более 6 знаков после запятой)"""
+
+MoneyDecimal = Annotated[
+    Money,
+    PlainSerializer(format_micros, return_type=str, when_used="json"),
+]
+"""Сумма в микро-единицах, в JSON — строка с 6 знаками после запятой"""
+
+DisplayMoney = Annotated[
+    Money,
+    PlainSerializer(lambda v: format_micros(v, places=2), return_type=str, when_used="json"),
+]
+"""Сумма в микро-единицах, в JSON — строка с 2 знаками после запятой"""
+
+FloatMoney = Annotated[
+    Money,
+    PlainSerializer(to_float, return_type=float, when_used="json"),
 ]
+"""Сумма в микро-единицах, в JSON — число в USDT"""
 
 
 class PaginationParams(BaseModel):
     limit: int | None = Query(None, ge=1, le=100, description="Количество элементов на странице")
     offset: int | None = Query(None, ge=0, description="Смещение от начала списка")
+    cursor: str | None = Query(None, description="Курсор следующей страницы (значение заголовка X-Next-Cursor)")
@@ -4,10 +4,14 @@ from datetime import datetime
 from logging import getLogger
 from typing import Literal
 
+from api.v1.notification.codec import decode_notification, encode_notification
+from api.v1.wallet.cache import wallet_cache
+from core.config import settings
 from crypto_processing.client import CryptoProcessingClient
 from infra.postgres.uow import PostgresUnitOfWork
 from infra.redis.redis_api import RedisAPI
 from banking.abstractions import IBankPaymentClient
+from telegram_bot.push import enqueue_push
 
 logger = getLogger(__name__)
 
@@ -19,6 +23,15 @@ class BaseService:
     redis: RedisAPI | None = None
     bank_client: IBankPaymentClient | None = None
 
+    async def _safe_invalidate_wallets(self, *telegram_ids: int) -> None:
+        """Сбрасывает кэш кошельков после коммита изменения баланса; без Redis ничего не делает"""
+        if not self.redis:
+            return
+        try:
+            await wallet_cache.invalidate(self.redis, telegram_ids)
+        except Exception as e:
+            logger.error("Ошибка при сбросе кэша кошельков: %s", e, exc_info=True)
+
     async def _send_notification(
         self,
         telegram_id: int,
@@ -50,17 +63,31 @@ class BaseService:
         }
 
         notification_key = f"notifications:{telegram_id}"
-        await self.redis.lpush_json(notification_key, notification_data)
+        await self.redis.lpush(notification_key, encode_notification(notification_data))
 
         unread_key = f"notifications:unread:{telegram_id}"
         await self.redis.incr(unread_key)
 
+        if settings.notification_ttl:
+            await self.redis.expire(notification_key, settings.notification_ttl)
+            await self.redis.expire(unread_key, settings.notification_ttl)
+
         length = await self.redis.llen(notification_key)
         if length > max_notifications:
+            dropped = await self.redis.lrange(notification_key, max_notifications, -1)
             await self.redis.ltrim(notification_key, 0, max_notifications - 1)
+            await self._drop_unread(unread_key, [decode_notification(raw) for raw in dropped])
+
+        await enqueue_push(self.redis, telegram_id, f"{title}\n\n{message}")
 
         return notification_data
 
+    async def _drop_unread(self, unread_key: str, dropped: list[dict]) -> None:
+        """Уменьшает счетчик непрочитанных на число непрочитанных среди удаленных уведомлений"""
+        count = sum(1 for notification in dropped if not notification.get("read", False))
+        if count and await self.redis.decrby(unread_key, count) < 0:
+            await self.redis.set(unread_key, "0", settings.notification_ttl)
+
     async def _safe_notify_operation_status(
         self,
         telegram_id: int,
@@ -0,0 +1,15 @@
+from typing import AsyncIterator, Annotated
+
+from fastapi import Depends
+
+from api.v1.home.service import HomeService
+from infra.postgres.uow import PrimaryReadOnlyUnitOfWorkDep
+from infra.redis.dependencies import RedisDep
+
+
+async def get_home_service(uow: PrimaryReadOnlyUnitOfWorkDep, redis: RedisDep) -> AsyncIterator[HomeService]:
+    # Кошельки при промахе попадают в кэш, поэтому чтение с primary, как и в WalletReadServiceDep
+    yield HomeService(uow=uow, redis=redis)
+
+
+HomeServiceDep = Annotated[HomeService, Depends(get_home_service)]
@@ -0,0 +1,79 @@
+from fastapi import APIRouter, Query, status
+
+from api.v1.home.schemas import HomeResponse
+from api.v1.home.dependencies import HomeServiceDep
+from api.v1.auth.dependencies import UserAuthDep
+
+router = APIRouter(prefix="/home", tags=["Home"])
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    response_model=HomeResponse,
+    summary="Получить данные главного экрана",
+    description="Возвращает одним ответом все данные, нужные мини-приложению при открытии.\n\n"
+               "**Возвращаемая информация:**\n"
+               "- Кошельки пользователя с балансами и адресами\n"
+               "- Последние операции пользователя\n"
+               "- Количество непрочитанных уведомлений\n"
+               "- Информация о реферальной программе\n\n"
+               "**Параметры запроса:**\n"
+               "- `operations_limit` - количество последних операций (по умолчанию: 10)\n\n"
+               "**Требования:**\n"
+               "- Пользователь должен быть авторизован\n\n"
+               "**Особенности:**\n"
+               "- Заменяет отдельные запросы к `/wallet`, `/user/operations`, `/notifications` и `/referral`\n"
+               "- `referral` равен null, если пользователь не участвует в реферальной программе",
+    responses={
+        200: {
+            "description": "Данные главного экрана успешно получены",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "wallets": [
+                            {
+                                "wallet_id": "550e8400-e29b-41d4-a716-446655440000",
+                                "currency": "USDT",
+                                "balance": "1000.50",
+                                "addresses": [
+                                    {
+                                        "network": "TRC20",
+                                        "address": "TQn9Y2khDD95J42FQtQTdwVVRqQjKJ7iqG"
+                                    }
+                                ],
+                                "icon": "https://assets.coingecko.com/coins/images/325/large/Tether-logo.png"
+                            }
+                        ],
+                        "operations": [
+                            {
+                                "operation_id": "550e8400-e29b-41d4-a716-446655440001",
+                                "wallet_id": "550e8400-e29b-41d4-a716-446655440000",
+                                "operation_type": "DEPOSIT",
+                                "status": "CONFIRMED",
+                                "amount": "100.00",
+                                "fee": "0.00",
+                                "total_amount": "100.00",
+                                "created_at": "2024-01-15T10:30:00"
+                            }
+                        ],
+                        "unread_notifications": 2,
+                        "referral": None
+                    }
+                }
+            }
+        }
+    }
+)
+async def get_home(
+    user: UserAuthDep,
+    service: HomeServiceDep,
+    operations_limit: int = Query(10, ge=1, le=50, description="Количество последних операций"),
+):
+    """
+    Получить данные главного экрана.
+
+    Кошельки, последние операции, счетчик уведомлений и реферальная информация
+    за одну авторизацию и одну сессию БД.
+    """
+    return await service.get_home(user.id, operations_limit)
@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+
+from api.v1.operation.schemas import OperationBase
+from api.v1.referral.schemas import ReferralInfo
+from api.v1.wallet.schemas import WalletResponse
+
+
+class HomeResponse(BaseModel):
+    wallets: list[WalletResponse] = Field(..., description="Кошельки пользователя")
+    operations: list[OperationBase] = Field(..., description="Последние операции пользователя, от новых к старым")
+    unread_notifications: int = Field(..., description="Количество непрочитанных уведомлений")
+    referral: ReferralInfo | None = Field(None, description="Информация о реферальной программе (None, если пользователь не участвует)")
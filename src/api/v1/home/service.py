@@ -0,0 +1,69 @@
+import asyncio
+from typing import Awaitable
+
+from api.v1.base.service import BaseService
+from api.v1.home.schemas import HomeResponse
+from api.v1.notification.service import NotificationService
+from api.v1.operation.schemas import OperationBase
+from api.v1.operation.service import OperationService
+from api.v1.referral.exceptions import ReferralNotFoundError
+from api.v1.referral.schemas import ReferralInfo
+from api.v1.referral.service import ReferralService
+from api.v1.wallet.cache import wallet_cache
+from api.v1.wallet.schemas import WalletResponse
+
+
+class HomeService(BaseService):
+    async def get_home(self, telegram_id: int, operations_limit: int) -> HomeResponse:
+        """
+        Данные главного экрана мини-приложения одним ответом.
+
+        Redis (кэш кошельков, счетчик уведомлений) опрашивается параллельно с БД;
+        запросы к БД идут последовательно в одной сессии. Кошельки читаются из БД только при промахе кэша.
+        """
+        redis_read = asyncio.create_task(self._read_redis(telegram_id))
+        try:
+            operations, referral, wallets = await self._read_db(telegram_id, operations_limit, redis_read)
+        finally:
+            redis_read.cancel()
+        await self.uow.release()
+        cache_version, cached_wallets, unread_count = redis_read.result()
+
+        if wallets is not None:
+            cached_wallets = wallets
+            if wallet_cache.enabled:
+                await wallet_cache.set(self.redis, telegram_id, cache_version, wallets)
+
+        return HomeResponse(
+            wallets=[WalletResponse.model_validate(wallet) for wallet in cached_wallets],
+            operations=operations,
+            unread_notifications=unread_count,
+            referral=referral,
+        )
+
+    async def _read_redis(self, telegram_id: int) -> tuple[int, list[dict] | None, int]:
+        version, wallets = 0, None
+        if wallet_cache.enabled:
+            version, wallets = await wallet_cache.get(self.redis, telegram_id)
+        unread_count = await NotificationService(uow=self.uow, redis=self.redis).get_unread_count(telegram_id)
+        return version, wallets, unread_count
+
+    async def _read_db(
+        self,
+        telegram_id: int,
+        operations_limit: int,
+        redis_read: Awaitable[tuple[int, list[dict] | None, int]],
+    ) -> tuple[list[OperationBase], ReferralInfo | None, list[dict] | None]:
+        operations = await OperationService(uow=self.uow).get_recent_operations(telegram_id, operations_limit)
+        try:
+            referral = await ReferralService(uow=self.uow).get_referral_info(telegram_id)
+        except ReferralNotFoundError:
+            referral = None
+
+        # Версия кэша прочитана до запроса кошельков в БД
+        _, cached_wallets, _ = await redis_read
+        if cached_wallets is not None:
+            return operations, referral, None
+        # Сериализация до release: откат транзакции сбрасывает загруженные объекты
+        wallets = await self.uow.wallet.get_user_wallets(telegram_id)
+        return operations, referral, [wallet_cache.dump(wallet) for wallet in wallets]
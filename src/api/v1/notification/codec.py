@@ -0,0 +1,132 @@
+import json
+from datetime import datetime, timezone
+from uuid import UUID
+
+CODEC_VERSION = 1
+
+# Короткие ключи компактного формата
+FIELD_ALIASES: dict[str, str] = {
+    "notification_id": "i",
+    "type": "t",
+    "title": "h",
+    "message": "m",
+    "created_at": "c",
+    "read": "r",
+    "image_url": "im",
+    "detail_image_url": "di",
+    "action_url": "au",
+    "action_label": "al",
+    "operation_id": "oi",
+    "operation_status": "os",
+    "amount": "a",
+    "source_referral_id": "sr",
+    "source_username": "su",
+    "referral_id": "ri",
+    "referral_username": "ru",
+}
+FIELD_NAMES: dict[str, str] = {alias: name for name, alias in FIELD_ALIASES.items()}
+
+# Интернированные значения: тип уведомления и типовые заголовки хранятся числом
+TYPE_IDS: dict[str, int] = {
+    "operation_status": 1,
+    "referral_deposit": 2,
+    "referral_join": 3,
+}
+TYPE_NAMES: dict[int, str] = {type_id: name for name, type_id in TYPE_IDS.items()}
+
+TITLE_IDS: dict[str, int] = {
+    "Статус операции изменен": 1,
+    "Начисление на реферальный баланс": 2,
+    "Новый реферал": 3,
+}
+TITLE_NAMES: dict[int, str] = {title_id: title for title, title_id in TITLE_IDS.items()}
+
+_VERSION_KEY = "v"
+_TITLE_ID_KEY = "hi"
+
+
+def _to_epoch(created_at: str) -> int:
+    value = datetime.fromisoformat(created_at)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _from_epoch(created_at: int) -> str:
+    return datetime.fromtimestamp(created_at, tz=timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _compact_id(notification_id: str) -> str:
+    try:
+        return UUID(notification_id).hex
+    except ValueError:
+        return notification_id
+
+
+def _expand_id(notification_id: str) -> str:
+    if len(notification_id) != 32:
+        return notification_id
+    try:
+        return str(UUID(hex=notification_id))
+    except ValueError:
+        return notification_id
+
+
+def encode_notification(notification: dict) -> str:
+    """Сериализует уведомление в компактный JSON (короткие ключи, без null, epoch-время)"""
+    packed: dict = {_VERSION_KEY: CODEC_VERSION}
+    for name, value in notification.items():
+        if value is None:
+            continue
+
+        if name == "notification_id":
+            value = _compact_id(value)
+        elif name == "type" and value in TYPE_IDS:
+            value = TYPE_IDS[value]
+        elif name == "title" and value in TITLE_IDS:
+            packed[_TITLE_ID_KEY] = TITLE_IDS[value]
+            continue
+        elif name == "created_at" and isinstance(value, str):
+            value = _to_epoch(value)
+        elif name == "read":
+            if not value:
+                continue
+            value = 1
+
+        packed[FIELD_ALIASES.get(name, name)] = value
+
+    return json.dumps(packed, ensure_ascii=False, separators=(",", ":"))
+
+
+def decode_notification(raw: str) -> dict:
+    """Десериализует уведомление; старые записи в полном JSON возвращаются как есть"""
+    data = json.loads(raw)
+    if _VERSION_KEY not in data:
+        return data
+
+    notification: dict = {
+        "read": False,
+        "image_url": None,
+        "detail_image_url": None,
+    }
+    for key, value in data.items():
+        if key == _VERSION_KEY:
+            continue
+        if key == _TITLE_ID_KEY:
+            notification["title"] = TITLE_NAMES.get(value, "")
+            continue
+
+        name = FIELD_NAMES.get(key, key)
+        if name == "notification_id":
+            value = _expand_id(value)
+        elif name == "type" and isinstance(value, int):
+            value = TYPE_NAMES.get(value, value)
+        elif name == "created_at" and isinstance(value, int):
+            value = _from_epoch(value)
+        elif name == "read":
+            value = bool(value)
+
+        notification[name] = value
+
+    return notification
+
@@ -1,10 +1,13 @@
+from datetime import datetime, timedelta
 from typing import Literal
 
 from api.v1.base.service import BaseService
+from api.v1.notification.codec import decode_notification, encode_notification
 from api.v1.notification.schemas import (
     NotificationBase,
     NotificationResponse
 )
+from core.config import settings
 
 
 class NotificationService(BaseService):
@@ -142,9 +145,10 @@ class NotificationService(BaseService):
             )
 
         notification_key = await self._get_notification_key(telegram_id)
-        
+        unread_key = await self._get_unread_count_key(telegram_id)
+
         # Получаем все уведомления
-        all_notifications = await self.redis.lrange_json(notification_key)
+        all_notifications = await self._get_all_notifications(notification_key, unread_key)
         total = len(all_notifications)
 
         # Применяем пагинацию
@@ -161,7 +165,6 @@ class NotificationService(BaseService):
         unread_count = sum(1 for n in all_notifications if not n.get("read", False))
         
         # Обновляем счетчик непрочитанных
-        unread_key = await self._get_unread_count_key(telegram_id)
         await self.redis.set(unread_key, str(unread_count))
 
         return NotificationResponse(
@@ -172,13 +175,21 @@ class NotificationService(BaseService):
             offset=offset
         )
 
+    async def get_unread_count(self, telegram_id: int) -> int:
+        """Счетчик непрочитанных уведомлений без чтения самого списка"""
+        if not self.redis:
+            return 0
+        unread = await self.redis.get(await self._get_unread_count_key(telegram_id))
+        return int(unread) if unread else 0
+
     async def mark_as_read(self, telegram_id: int, notification_ids: list[str]) -> int:
         """Отметить уведомления как прочитанные"""
         if not self.redis:
             return 0
 
         notification_key = await self._get_notification_key(telegram_id)
-        all_notifications = await self._get_all_notifications(notification_key)
+        unread_key = await self._get_unread_count_key(telegram_id)
+        all_notifications = await self._get_all_notifications(notification_key, unread_key)
         
         marked_count = 0
         notification_ids_set = set(notification_ids)
@@ -194,7 +205,6 @@ class NotificationService(BaseService):
             await self._update_notifications(notification_key, all_notifications)
             
             # Обновляем счетчик непрочитанных
-            unread_key = await self._get_unread_count_key(telegram_id)
             current_unread = await self.redis.get(unread_key)
             if current_unread:
                 new_unread = max(0, int(current_unread) - marked_count)
@@ -202,11 +212,32 @@ class NotificationService(BaseService):
 
         return marked_count
 
-    async def _get_all_notifications(self, notification_key: str) -> list[dict]:
-        """Получить все уведомления из Redis"""
+    async def _get_all_notifications(self, notification_key: str, unread_key: str) -> list[dict]:
+        """Получить все уведомления из Redis (старые записи отбрасываются при заданном TTL вместе с их счетчиком)"""
         if not self.redis:
             return []
-        return await self.redis.lrange_json(notification_key)
+        notifications = [decode_notification(raw) for raw in await self.redis.lrange(notification_key)]
+
+        if settings.notification_ttl:
+            expired_index = self._find_first_expired(notifications, settings.notification_ttl)
+            if expired_index is not None:
+                notifications, expired = notifications[:expired_index], notifications[expired_index:]
+                await self._drop_unread(unread_key, expired)
+                if notifications:
+                    await self.redis.ltrim(notification_key, 0, expired_index - 1)
+                else:
+                    await self.redis.delete(notification_key)
+        return notifications
+
+    @staticmethod
+    def _find_first_expired(notifications: list[dict], ttl: int) -> int | None:
+        """Индекс первого устаревшего уведомления (список упорядочен от новых к старым)"""
+        expire_before = datetime.utcnow() - timedelta(seconds=ttl)
+        for index, notification in enumerate(notifications):
+            created_at = notification.get("created_at")
+            if created_at and datetime.fromisoformat(created_at) < expire_before:
+                return index
+        return None
 
     async def _update_notifications(self, notification_key: str, notifications: list[dict]):
         """Обновить список уведомлений в Redis"""
@@ -218,5 +249,8 @@ class NotificationService(BaseService):
         
         # Добавляем обновленные уведомления
         for notification in reversed(notifications):  # Сохраняем порядок (новые в начале)
-            await self.redis.lpush_json(notification_key, notification)
+            await self.redis.lpush(notification_key, encode_notification(notification))
+
+        if settings.notification_ttl:
+            await self.redis.expire(notification_key, settings.notification_ttl)
 
@@ -3,10 +3,10 @@ from typing import AsyncIterator, Annotated
 from fastapi import Depends
 
 from api.v1.operation.service import OperationService
-from infra.postgres.uow import PostgresUnitOfWorkDep
+from infra.postgres.uow import ReadOnlyUnitOfWorkDep
 
 
-async def get_operation_service(uow: PostgresUnitOfWorkDep) -> AsyncIterator[OperationService]:
+async def get_operation_service(uow: ReadOnlyUnitOfWorkDep) -> AsyncIterator[OperationService]:
     yield OperationService(uow=uow)
 
 
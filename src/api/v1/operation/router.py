@@ -1,10 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
 
 from api.v1.operation.schemas import OperationBase
 from api.v1.operation.dependencies import OperationServiceDep
 from api.v1.base.dependencies import PaginationDep
+from api.v1.base.cursor import NEXT_CURSOR_HEADER
 from api.v1.auth.dependencies import UserAuthDep
 
 router = APIRouter(tags=["Operation"])
@@ -25,7 +26,9 @@ router = APIRouter(tags=["Operation"])
                 "- Операции включают все типы: пополнение, вывод, перевод\n"
                 "- Сортировка по дате создания (новые сначала)\n"
                 "- Возвращает базовую информацию об операциях\n"
-                "- Поддержка лимитов",
+                "- Поддержка лимитов\n"
+                "- Если есть следующая страница, её курсор возвращается в заголовке `X-Next-Cursor`; "
+                "передайте его в параметре `cursor` вместе с тем же `limit`",
     responses={
         200: {
             "description": "Список операций пользователя",
@@ -63,11 +66,15 @@ async def get_user_operations_handler(
     user: UserAuthDep,
     params: PaginationDep,
     service: OperationServiceDep,
+    response: Response,
 ):
-    return await service.get_operations_by_user(
+    operations, next_cursor = await service.get_operations_by_user(
         telegram_id=user.id,
         params=params
     )
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return operations
 
 
 @router.get(
@@ -86,7 +93,9 @@ async def get_user_operations_handler(
                 "- Операции включают все типы для данного кошелька\n"
                 "- Сортировка по дате создания (новые сначала)\n"
                 "- Возвращает базовую информацию об операциях\n"
-                "- Поддержка лимитов для оптимизации производительности",
+                "- Поддержка лимитов для оптимизации производительности\n"
+                "- Если есть следующая страница, её курсор возвращается в заголовке `X-Next-Cursor`; "
+                "передайте его в параметре `cursor` вместе с тем же `limit`",
     responses={
         200: {
             "description": "Список операций кошелька",
@@ -136,11 +145,15 @@ async def get_wallet_operations_handler(
     wallet_id: UUID,
     params: PaginationDep,
     service: OperationServiceDep,
+    response: Response,
 ):
-    return await service.get_operations_by_wallet(
+    operations, next_cursor = await service.get_operations_by_wallet(
         wallet_id=wallet_id,
         params=params
     )
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return operations
 
 
 @router.get(
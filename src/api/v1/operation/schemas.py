@@ -3,7 +3,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from api.v1.base.schemas import DisplayDecimal
+from api.v1.base.schemas import DisplayMoney
 from infra.postgres.models import OperationType, OperationStatus
 
 
@@ -15,9 +15,9 @@ class OperationBase(BaseModel):
     wallet_id: UUID = Field(..., description="ID кошелька, к которому относится операция")
     operation_type: OperationType = Field(..., description="Тип операции")
     status: OperationStatus = Field(..., description="Статус операции")
-    amount: DisplayDecimal = Field(..., description="Сумма операции")
-    fee: DisplayDecimal = Field(..., description="Комиссия за операцию")
-    total_amount: DisplayDecimal = Field(..., description="Общая сумма (сумма + комиссия)")
+    amount: DisplayMoney = Field(..., description="Сумма операции")
+    fee: DisplayMoney = Field(..., description="Комиссия за операцию")
+    total_amount: DisplayMoney = Field(..., description="Общая сумма (сумма + комиссия)")
     created_at: datetime = Field(..., description="Дата и время создания операции")
     tx_id: str | None = Field(None, description="Хэш транзакции в сети (для пополнения)")
     network: str | None = Field(None, description="Сеть (например TRC20)")
@@ -3,6 +3,7 @@ from uuid import UUID
 
 from api.v1.base.service import BaseService
 from api.v1.base.schemas import PaginationParams
+from api.v1.base.cursor import encode_cursor, decode_cursor
 from api.v1.operation.schemas import OperationBase, TRONSCAN_TX_URL
 from infra.postgres.models import Operation
 
@@ -23,28 +24,57 @@ class OperationService(BaseService):
             self,
             wallet_id: UUID,
             params: PaginationParams,
-    ) -> Sequence[OperationBase]:
+    ) -> tuple[Sequence[OperationBase], str | None]:
         operations = await self.uow.operation.get_wallet_operations(
             wallet_id=wallet_id,
-            limit=params.limit,
-            offset=params.offset,
+            **self._page_kwargs(params),
         )
-        return [self._to_operation_base(op) for op in operations]
+        # Ответ собирается до release: откат транзакции сбрасывает загруженные объекты
+        page = self._to_page(operations, params)
+        await self.uow.release()
+        return page
 
     async def get_operations_by_user(
             self,
             telegram_id: int,
             params: PaginationParams,
-    ) -> Sequence[OperationBase]:
+    ) -> tuple[Sequence[OperationBase], str | None]:
         operations = await self.uow.operation.get_user_operations(
             telegram_id=telegram_id,
-            limit=params.limit,
-            offset=params.offset,
+            **self._page_kwargs(params),
         )
+        page = self._to_page(operations, params)
+        await self.uow.release()
+        return page
+
+    @staticmethod
+    def _page_kwargs(params: PaginationParams) -> dict:
+        # Запрашиваем на одну запись больше, чтобы понять, есть ли следующая страница
+        return {
+            "limit": params.limit + 1 if params.limit is not None else None,
+            "offset": params.offset,
+            "after": decode_cursor(params.cursor) if params.cursor else None,
+        }
+
+    def _to_page(
+            self,
+            operations: Sequence[Operation],
+            params: PaginationParams,
+    ) -> tuple[Sequence[OperationBase], str | None]:
+        next_cursor = None
+        if params.limit is not None and len(operations) > params.limit:
+            operations = operations[:params.limit]
+            last = operations[-1]
+            next_cursor = encode_cursor(last.created_at, last.operation_id)
+        return [self._to_operation_base(op) for op in operations], next_cursor
+
+    async def get_recent_operations(self, telegram_id: int, limit: int) -> list[OperationBase]:
+        """Последние операции пользователя; транзакцию не завершает — для составных ответов"""
+        operations = await self.uow.operation.get_user_operations(telegram_id=telegram_id, limit=limit)
         return [self._to_operation_base(op) for op in operations]
 
     async def get_operation(self, operation_id: UUID) -> OperationBase | None:
         op = await self.uow.operation.get_operation(operation_id)
-        if op is None:
-            return None
-        return self._to_operation_base(op)
+        operation = self._to_operation_base(op) if op is not None else None
+        await self.uow.release()
+        return operation
@@ -3,6 +3,8 @@ from datetime import datetime
 from decimal import Decimal
 from pydantic import BaseModel, Field, field_validator, HttpUrl
 
+from api.v1.base.schemas import MoneyDecimal
+
 
 class SbpPaymentCreate(BaseModel):
     sbp_url: HttpUrl = Field(
@@ -14,7 +16,8 @@ class SbpPaymentCreate(BaseModel):
         ]
     )
     exchange: Decimal = Field(
-        ..., 
+        ...,
+        gt=0,
         description="Курс обмена (рубли за единицу криптовалюты)",
         examples=[100000, 50000, 75000]
     )
@@ -45,9 +48,9 @@ class SbpPaymentResponse(BaseModel):
     rub_amount: int = Field(..., description="Сумма в копейках")
     fee_rub: int = Field(..., description="Комиссия в копейках")
     total_amount_rub: int = Field(..., description="Общая сумма в копейках")
-    crypto_amount: Decimal = Field(..., description="Сумма в криптовалюте")
-    fee_crypto: Decimal = Field(..., description="Комиссия в криптовалюте")
-    total_amount_crypto: Decimal = Field(..., description="Общая сумма в криптовалюте")
+    crypto_amount: MoneyDecimal = Field(..., description="Сумма в криптовалюте")
+    fee_crypto: MoneyDecimal = Field(..., description="Комиссия в криптовалюте")
+    total_amount_crypto: MoneyDecimal = Field(..., description="Общая сумма в криптовалюте")
     exchange: Decimal = Field(..., description="Курс обмена")
     status: str = Field(..., description="Статус платежа")
     created_at: datetime = Field(..., description="Дата создания")
@@ -1,6 +1,5 @@
 import asyncio
 import time
-from decimal import Decimal
 from uuid import UUID
 from logging import getLogger
 
@@ -8,19 +7,23 @@ from api.v1.base.service import BaseService
 from api.v1.payment.schemas import SbpPaymentCreate
 from banking.providers.alfa import PaymentStatus, AlfaApiError
 from infra.postgres.models import (
+    LedgerAccount,
     Operation,
     OperationStatus,
     OperationType,
     SbpPayment,
     SbpPaymentStatus,
+    Wallet,
     ReferralType,
     ReferralOperation,
     ReferralOperationType,
     ReferralOperationStatus,
 )
+from infra.postgres.storage.ledger import debit_entries
 from api.v1.payment.exceptions import PaymentProcessingError, PaymentLinkError
 from api.v1.wallet.exceptions import WalletNotFoundError, InsufficientFundsError
-from api.v1.referral.levels import get_revenue_share_percentage
+from api.v1.referral.levels import CPA_REWARD, CPA_THRESHOLD, get_revenue_share_percentage
+from core.money import MICROS, Money, format_micros, mul_div, to_float, to_micros
 
 logger = getLogger(__name__)
 
@@ -48,10 +51,14 @@ class PaymentService(BaseService):
         except AlfaApiError:
             raise PaymentLinkError("Getting payment link failed")
 
-        crypto_amount = (Decimal(payment_link_data.amount) / 100) / Decimal(payment_data.exchange)
+        exchange = to_micros(payment_data.exchange, exact=False)
+        crypto_amount = self._rub_to_micros(payment_link_data.amount, exchange)
 
-        if wallet.balance < crypto_amount:
-            raise InsufficientFundsError(f"Insufficient funds. Required: {crypto_amount}, available: {wallet.balance}")
+        balance = await self.uow.ledger.get_balance(wallet_id)
+        if balance < crypto_amount:
+            raise InsufficientFundsError(
+                f"Insufficient funds. Required: {format_micros(crypto_amount)}, available: {format_micros(balance)}"
+            )
 
         try:
             payment_result = await self.bank_client.process_payment(payment_link_data)
@@ -59,7 +66,7 @@ class PaymentService(BaseService):
             raise PaymentProcessingError("Payment processing failed")
 
         # TODO add our commission
-        crypto_fee = (Decimal(payment_result.commission) / 100) / Decimal(payment_data.exchange)
+        crypto_fee = self._rub_to_micros(payment_result.commission, exchange)
         total_crypto_amount = crypto_fee + crypto_amount
 
         status_tuple = self.status_map.get(payment_result.status)
@@ -96,15 +103,15 @@ class PaymentService(BaseService):
         )
 
         if payment_result.status == PaymentStatus.COMPLETE.value:
-            wallet.balance -= total_crypto_amount
             operation.status = OperationStatus.CONFIRMED
             sbp_payment.status = SbpPaymentStatus.CONFIRMED
+            await self._debit(wallet, operation)
 
             await self._safe_notify_operation_status(
                 telegram_id=wallet.telegram_id,
                 operation_id=str(operation.operation_id),
                 operation_status="confirmed",
-                amount=float(total_crypto_amount),
+                amount=to_float(total_crypto_amount),
             )
 
             try:
@@ -125,20 +132,20 @@ class PaymentService(BaseService):
                 telegram_id=wallet.telegram_id,
                 operation_id=str(operation.operation_id),
                 operation_status="cancelled",
-                amount=float(total_crypto_amount),
+                amount=to_float(total_crypto_amount),
             )
 
             return sbp_payment
 
-        wallet.balance -= total_crypto_amount
         operation.status = OperationStatus.CONFIRMED
         sbp_payment.status = SbpPaymentStatus.CONFIRMED
+        await self._debit(wallet, operation)
 
         await self._safe_notify_operation_status(
             telegram_id=wallet.telegram_id,
             operation_id=str(operation.operation_id),
             operation_status="confirmed",
-            amount=float(total_crypto_amount),
+            amount=to_float(total_crypto_amount),
         )
 
         try:
@@ -148,6 +155,30 @@ class PaymentService(BaseService):
 
         return sbp_payment
 
+    async def _debit(self, wallet: Wallet, operation: Operation) -> None:
+        """
+        Списывает оплату с заблокированного кошелька проводками журнала и фиксирует транзакцию.
+
+        Кэш кошельков сбрасывается только после коммита, иначе его успеет заполнить старый баланс.
+        """
+        await self.uow.ledger.post(
+            operation.operation_id,
+            debit_entries(
+                operation.wallet_id,
+                LedgerAccount.SBP_PAYOUTS,
+                operation.amount,
+                operation.fee,
+                LedgerAccount.PAYMENT_FEES,
+            ),
+        )
+        await self.uow.release()
+        await self._safe_invalidate_wallets(wallet.telegram_id)
+
+    @staticmethod
+    def _rub_to_micros(kopecks: int, exchange: Money) -> Money:
+        """Переводит сумму в копейках в микро-единицы USDT по курсу (рубли за USDT, в микро-единицах)"""
+        return mul_div(kopecks * (MICROS // 100), MICROS, exchange)
+
     async def is_payment_completed(self, payment_id: str) -> bool:
         now = time.perf_counter()
 
@@ -171,27 +202,7 @@ class PaymentService(BaseService):
 
         return False
 
-    def _get_revenue_share_percentage(self, referral_count: int) -> Decimal:
-        """
-        Возвращает процент Revenue Share в зависимости от количества рефералов:
-        - Меньше 3 рефералов: 20%
-        - Меньше 5 рефералов: 30%
-        - Меньше 8 рефералов: 40%
-        - Меньше 10 рефералов: 50%
-        - 10 и более: 50%
-        """
-        if referral_count < 3:
-            return Decimal("0.20")  # 20%
-        elif referral_count < 5:
-            return Decimal("0.30")  # 30%
-        elif referral_count < 8:
-            return Decimal("0.40")  # 40%
-        elif referral_count < 10:
-            return Decimal("0.50")  # 50%
-        else:
-            return Decimal("0.50")  # 50%
-
-    async def _process_referral_rewards(self, telegram_id: int, commission: Decimal) -> None:
+    async def _process_referral_rewards(self, telegram_id: int, commission: Money) -> None:
         """
         Обрабатывает реферальные начисления после успешной операции.
         
@@ -227,9 +238,6 @@ class PaymentService(BaseService):
         Обрабатывает CPA начисление (5 USDt за каждого пользователя, потратившего >= 150 USDt).
         Начисляет бонус только один раз за каждого пользователя, достигшего порога.
         """
-        CPA_THRESHOLD = Decimal("150.0")  # 150 USDt
-        CPA_REWARD = Decimal("5.0")  # 5 USDt
-        
         # Проверяем общую сумму потраченных средств пользователем
         total_spending = await self.uow.operation.get_user_total_spending(user_id)
         
@@ -271,7 +279,7 @@ class PaymentService(BaseService):
         self,
         referrer_id: int,
         source_referral_id: int,
-        commission: Decimal,
+        commission: Money,
         referral_count: int,
     ) -> None:
         """
@@ -284,7 +292,9 @@ class PaymentService(BaseService):
         if percentage <= 0:
             return
 
-        reward_amount = commission * percentage
+        reward_amount = mul_div(commission, percentage, 100)
+        if reward_amount <= 0:
+            return
 
         await self._add_referral_reward(
             referrer_id,
@@ -296,7 +306,7 @@ class PaymentService(BaseService):
     async def _add_referral_reward(
         self, 
         referrer_id: int, 
-        amount: Decimal, 
+        amount: Money,
         operation_type: ReferralOperationType,
         source_referral_id: int | None = None
     ) -> None:
@@ -319,19 +329,15 @@ class PaymentService(BaseService):
         )
         await self.uow.referral_operation.add(referral_operation)
         
-        # Обновляем баланс реферала (balance хранится как int, конвертируем Decimal в int)
-        # Предполагаем, что balance хранится в минимальных единицах (например, центах)
-        # Для USDt: 1 USDt = 1000000 (6 знаков после запятой)
+        # Обновляем баланс реферала (balance, как и amount, в микро-единицах USDT)
         referrer_referral = await self.uow.referral.get_by_id(referrer_id)
         if referrer_referral:
-            # Конвертируем Decimal в int (умножаем на 1000000 для 6 знаков после запятой)
-            amount_int = int(amount * Decimal("1000000"))
-            new_balance = referrer_referral.balance + amount_int
+            new_balance = referrer_referral.balance + amount
             await self.uow.referral.update(referrer_id, balance=new_balance)
             
             if operation_type == ReferralOperationType.DEPOSIT:
                 await self._safe_notify_referral_deposit(
                     telegram_id=referrer_id,
-                    amount=float(amount),
+                    amount=to_float(amount),
                     source_referral_id=source_referral_id,
                 )
@@ -3,11 +3,21 @@ from typing import AsyncIterator, Annotated
 from fastapi import Depends
 
 from api.v1.referral.service import ReferralService
-from infra.postgres.uow import PostgresUnitOfWorkDep
+from infra.postgres.uow import PostgresUnitOfWorkDep, ReadOnlyUnitOfWorkDep, ReportUnitOfWorkDep
 
 
 async def get_referral_service(uow: PostgresUnitOfWorkDep) -> AsyncIterator[ReferralService]:
     yield ReferralService(uow=uow)
 
 
+async def get_referral_read_service(uow: ReadOnlyUnitOfWorkDep) -> AsyncIterator[ReferralService]:
+    yield ReferralService(uow=uow)
+
+
+async def get_referral_report_service(uow: ReportUnitOfWorkDep) -> AsyncIterator[ReferralService]:
+    yield ReferralService(uow=uow)
+
+
 ReferralServiceDep = Annotated[ReferralService, Depends(get_referral_service)]
+ReferralReadServiceDep = Annotated[ReferralService, Depends(get_referral_read_service)]
+ReferralReportServiceDep = Annotated[ReferralService, Depends(get_referral_report_service)]
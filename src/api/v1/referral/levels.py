@@ -1,8 +1,12 @@
-from decimal import Decimal
+from core.money import MICROS
 
 
 LEVEL_THRESHOLDS = [0, 3, 5, 8, 10]
 
+# CPA (FIXED_INCOME): бонус за каждого реферала, потратившего не меньше порога, в микро-единицах USDT
+CPA_THRESHOLD = 150 * MICROS
+CPA_REWARD = 5 * MICROS
+
 
 def get_revenue_share_level(referral_count: int) -> int:
     """
@@ -19,19 +23,19 @@ def get_revenue_share_level(referral_count: int) -> int:
     return 1
 
 
-def get_revenue_share_percentage(referral_count: int) -> Decimal:
+def get_revenue_share_percentage(referral_count: int) -> int:
     """
-    Возвращает процент реферальной программы по количеству рефералов.
+    Возвращает процент реферальной программы (0–50) по количеству рефералов.
     """
     if referral_count >= 10:
-        return Decimal("0.50")
+        return 50
     if referral_count >= 8:
-        return Decimal("0.40")
+        return 40
     if referral_count >= 5:
-        return Decimal("0.30")
+        return 30
     if referral_count >= 3:
-        return Decimal("0.20")
-    return Decimal("0.00")
+        return 20
+    return 0
 
 
 def get_next_level_referrals_needed(referral_count: int) -> int | None:
@@ -7,7 +7,7 @@ from api.v1.referral.schemas import (
     ReferralStatsResponse,
     ReferralDepositOperationsResponse
 )
-from api.v1.referral.dependencies import ReferralServiceDep
+from api.v1.referral.dependencies import ReferralServiceDep, ReferralReadServiceDep, ReferralReportServiceDep
 from api.v1.auth.dependencies import UserAuthDep
 from api.v1.base.dependencies import PaginationDep
 
@@ -143,7 +143,7 @@ async def set_referral_type(
 )
 async def get_referral_info(
     user: UserAuthDep,
-    service: ReferralServiceDep
+    service: ReferralReadServiceDep
 ):
     """
     Получить полную информацию о реферале.
@@ -220,7 +220,7 @@ async def get_referral_info(
 )
 async def get_referral_operations(
     user: UserAuthDep,
-    service: ReferralServiceDep,
+    service: ReferralReadServiceDep,
     pagination: PaginationDep
 ):
     """
@@ -303,7 +303,7 @@ async def get_referral_operations(
 )
 async def get_referrals_stats(
     user: UserAuthDep,
-    service: ReferralServiceDep,
+    service: ReferralReportServiceDep,
     pagination: PaginationDep
 ):
     """
@@ -382,7 +382,7 @@ async def get_referrals_stats(
 )
 async def get_deposit_operations(
     user: UserAuthDep,
-    service: ReferralServiceDep,
+    service: ReferralReadServiceDep,
     pagination: PaginationDep
 ):
     """
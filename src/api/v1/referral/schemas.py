@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field
 from typing import List
 from uuid import UUID
 
+from api.v1.base.schemas import FloatMoney
 from infra.postgres.models import ReferralType, ReferralOperationType, ReferralOperationStatus
 
 
@@ -19,9 +20,9 @@ class ReferralInfo(BaseModel):
     code: str = Field(..., description="Код для приглашения")
     active: bool = Field(..., description="Активен ли реферал")
     referral_type: ReferralType | None = Field(None, description="Тип реферальной программы")
-    referral_spending: float = Field(..., description="Денег потрачено при фиксированном типе реферальной программы")
+    referral_spending: FloatMoney = Field(..., description="Денег потрачено при фиксированном типе реферальной программы")
     referral_count: int = Field(..., description="Количество приглашенных людей")
-    balance: int = Field(..., description="Баланс реферала")
+    balance: int = Field(..., description="Баланс реферала в микро-единицах USDT")
     referred_users: List[int] = Field(..., description="Список ID приглашенных пользователей")
     level: int = Field(..., description="Текущий уровень пользователя в реферальной программе (1–5)")
     level_percentage: float = Field(..., description="Процент ревшера для текущего уровня (0, 20, 30, 40, 50)")
@@ -35,7 +36,7 @@ class ReferralOperationInfo(BaseModel):
     referral_operation_id: UUID = Field(..., description="ID операции")
     status: ReferralOperationStatus = Field(..., description="Статус операции")
     operation_type: ReferralOperationType = Field(..., description="Тип операции")
-    amount: float = Field(..., description="Сумма операции")
+    amount: FloatMoney = Field(..., description="Сумма операции")
     created_at: str = Field(..., description="Дата создания")
 
 
@@ -50,7 +51,7 @@ class ReferralStatsInfo(BaseModel):
     telegram_id: int = Field(..., description="ID приглашенного пользователя")
     username: str | None = Field(None, description="Username пользователя в Telegram (если доступен)")
     avatar_url: str | None = Field(None, description="URL фото профиля пользователя в Telegram (если доступен)")
-    earned_amount: float = Field(..., description="Сумма, полученная от этого реферала")
+    earned_amount: FloatMoney = Field(..., description="Сумма, полученная от этого реферала")
     percentage: float | None = Field(None, description="Процент от 150 USDt для FIXED_INCOME (сколько осталось до порога), None для PERCENTAGE_INCOME")
     level: int = Field(..., description="Уровень реферала в программе (1–5)")
 
@@ -59,7 +60,7 @@ class ReferralStatsResponse(BaseModel):
     referrals: List[ReferralStatsInfo] = Field(..., description="Список приглашенных рефералов со статистикой")
     referral_type: ReferralType | None = Field(None, description="Тип реферальной программы")
     total: int = Field(..., description="Общее количество рефералов")
-    total_earned: float = Field(..., description="Общая сумма, полученная от всех рефералов")
+    total_earned: FloatMoney = Field(..., description="Общая сумма, полученная от всех рефералов")
     limit: int | None = Field(None, description="Лимит на страницу")
     offset: int | None = Field(None, description="Смещение")
 
@@ -67,7 +68,7 @@ class ReferralStatsResponse(BaseModel):
 class ReferralDepositOperationInfo(BaseModel):
     referral_operation_id: UUID = Field(..., description="ID операции")
     status: ReferralOperationStatus = Field(..., description="Статус операции")
-    amount: float = Field(..., description="Сумма операции")
+    amount: FloatMoney = Field(..., description="Сумма операции")
     created_at: str = Field(..., description="Дата создания")
     source_referral_id: int | None = Field(None, description="ID реферала, который начислил эту сумму")
     source_username: str | None = Field(None, description="Username реферала, который начислил")
@@ -12,6 +12,7 @@ from api.v1.referral.schemas import (
     ReferralDepositOperationsResponse,
 )
 from api.v1.referral.levels import (
+    CPA_THRESHOLD,
     get_revenue_share_level,
     get_revenue_share_percentage,
     get_next_level_referrals_needed,
@@ -103,7 +104,7 @@ class ReferralService(BaseService):
 
         referral_count = referral.referral_count or 0
         level = get_revenue_share_level(referral_count)
-        level_percentage = float(get_revenue_share_percentage(referral_count) * 100)
+        level_percentage = float(get_revenue_share_percentage(referral_count))
         next_level_needed = get_next_level_referrals_needed(referral_count)
 
         return ReferralInfo(
@@ -142,7 +143,7 @@ class ReferralService(BaseService):
                 referral_operation_id=op.referral_operation_id,
                 status=op.status,
                 operation_type=op.operation_type,
-                amount=float(op.amount),
+                amount=op.amount,
                 created_at=op.created_at.isoformat()
             )
             for op in operations
@@ -180,40 +181,44 @@ class ReferralService(BaseService):
         
         # Получаем общую сумму, полученную от всех рефералов
         total_earned = await self.uow.referral_operation.get_referrer_total_earned(telegram_id)
-        total_earned_float = float(total_earned)
         
         # Формируем статистику для каждого реферала
-        referrals_stats = []
+        db_stats = []
         for referred_user in referred_users:
             # Получаем сумму, полученную от этого реферала
             earned_amount = await self.uow.referral_operation.get_referral_total_earned(
                 telegram_id, 
                 referred_user.telegram_id
             )
-            earned_amount_float = float(earned_amount)
-            
+
             percentage: float | None = None
             if referral.type == ReferralType.FIXED_INCOME:
-                CPA_THRESHOLD = 150.0
                 user_spending = await self.uow.operation.get_user_total_spending(referred_user.telegram_id)
-                user_spending_float = float(user_spending)
 
-                if user_spending_float >= CPA_THRESHOLD:
+                if user_spending >= CPA_THRESHOLD:
                     percentage = 100.0
                 else:
-                    percentage = (user_spending_float / CPA_THRESHOLD) * 100
+                    percentage = user_spending * 100 / CPA_THRESHOLD
 
             level = get_revenue_share_level(referred_user.referral_count or 0)
+            db_stats.append((referred_user.telegram_id, earned_amount, percentage, level))
+
+        # Данные из БД собраны — возвращаем соединение в пул до запросов к Telegram;
+        # после release объекты ORM сброшены, поэтому нужные поля прочитаны заранее
+        referral_type = referral.type
+        await self.uow.release()
 
+        referrals_stats = []
+        for referred_id, earned_amount, percentage, level in db_stats:
             # Получаем username и avatar_url через Telegram Bot API
-            username, avatar_url = await self._get_telegram_user_info(referred_user.telegram_id)
+            username, avatar_url = await self._get_telegram_user_info(referred_id)
 
             referrals_stats.append(
                 ReferralStatsInfo(
-                    telegram_id=referred_user.telegram_id,
+                    telegram_id=referred_id,
                     username=username,
                     avatar_url=avatar_url,
-                    earned_amount=earned_amount_float,
+                    earned_amount=earned_amount,
                     percentage=round(percentage, 2) if percentage is not None else None,
                     level=level,
                 )
@@ -221,9 +226,9 @@ class ReferralService(BaseService):
         
         return ReferralStatsResponse(
             referrals=referrals_stats,
-            referral_type=referral.type,
+            referral_type=referral_type,
             total=total_referrals,
-            total_earned=total_earned_float,
+            total_earned=total_earned,
             limit=limit,
             offset=offset
         )
@@ -250,24 +255,30 @@ class ReferralService(BaseService):
         # Получаем суммарное количество приглашенных пользователей
         referred_users = await self.uow.referral.get_referred_users(telegram_id)
         total_referrals = len(referred_users)
+        # После release объекты ORM сброшены, поэтому поля читаются до него
+        db_operations = [
+            (op.referral_operation_id, op.status, op.amount, op.created_at, op.source_referral_id)
+            for op in operations
+        ]
+        await self.uow.release()
         
         # Формируем информацию об операциях с данными о рефералах
         operation_infos = []
-        for op in operations:
+        for referral_operation_id, status, amount, created_at, source_referral_id in db_operations:
             source_username = None
             source_avatar_url = None
             
             # Получаем информацию о реферале, который начислил (если есть source_referral_id)
-            if op.source_referral_id:
-                source_username, source_avatar_url = await self._get_telegram_user_info(op.source_referral_id)
+            if source_referral_id:
+                source_username, source_avatar_url = await self._get_telegram_user_info(source_referral_id)
             
             operation_infos.append(
                 ReferralDepositOperationInfo(
-                    referral_operation_id=op.referral_operation_id,
-                    status=op.status,
-                    amount=float(op.amount),
-                    created_at=op.created_at.isoformat(),
-                    source_referral_id=op.source_referral_id,
+                    referral_operation_id=referral_operation_id,
+                    status=status,
+                    amount=amount,
+                    created_at=created_at.isoformat(),
+                    source_referral_id=source_referral_id,
                     source_username=source_username,
                     source_avatar_url=source_avatar_url
                 )
@@ -4,10 +4,11 @@ from fastapi import Depends
 
 from api.v1.user.service import UserService
 from infra.postgres.uow import PostgresUnitOfWorkDep
+from infra.redis.dependencies import RedisDep
 
 
-async def get_user_service(uow: PostgresUnitOfWorkDep) -> AsyncIterator[UserService]:
-    yield UserService(uow=uow)
+async def get_user_service(uow: PostgresUnitOfWorkDep, redis: RedisDep) -> AsyncIterator[UserService]:
+    yield UserService(uow=uow, redis=redis)
 
 
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
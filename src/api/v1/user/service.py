@@ -1,3 +1,4 @@
+from api.v1.auth.service import RegisterService
 from api.v1.base.service import BaseService
 from api.v1.user.schemas import UserEmail, UserChangeCode, UserSetCode
 from api.v1.user.exceptions import EntryCodeUpdateError
@@ -21,6 +22,9 @@ class UserService(BaseService):
         if not updated:
             raise EntryCodeUpdateError("Failed to update entry code.")
 
+        # Вход без кода был закэширован — после установки кода требуется войти заново
+        await self.redis.delete(f"{RegisterService.USER_LOGIN_REDIS_SPACENAME}:{telegram_id}")
+
     async def delete_entry_code(self, telegram_id: int, user_code: UserSetCode):
         is_code_correct = await self.uow.user.check_user_code(telegram_id, entry_code=user_code.code)
         if not is_code_correct:
@@ -0,0 +1,73 @@
+import json
+from typing import Iterable, Sequence
+
+from core.config import settings
+from infra.postgres.models import Wallet
+from infra.redis.redis_api import RedisAPI
+
+
+class WalletCache:
+    """
+    Кэш кошельков пользователя в Redis.
+
+    Запись хранит номер версии, при которой она была прочитана из БД. Изменение баланса
+    после коммита увеличивает версию, поэтому запись, заполненная параллельно
+    со сбросом по старым данным, не совпадет с версией и не будет отдана.
+    Версия и запись читаются одним MGET.
+    """
+    KEY_PREFIX = "wallets"
+
+    def __init__(self, ttl: int):
+        self._ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def _version_key(self, telegram_id: int) -> str:
+        return f"{self.KEY_PREFIX}:version:{telegram_id}"
+
+    def _data_key(self, telegram_id: int) -> str:
+        return f"{self.KEY_PREFIX}:{telegram_id}"
+
+    @staticmethod
+    def dump(wallet: Wallet) -> dict:
+        return {
+            "wallet_id": str(wallet.wallet_id),
+            "currency": wallet.currency.value,
+            "balance": wallet.balance,
+            "addresses": list(wallet.addresses),
+        }
+
+    async def get(self, redis: RedisAPI, telegram_id: int) -> tuple[int, list[dict] | None]:
+        """Возвращает текущую версию и кошельки (None, если записи нет или она устарела)"""
+        version, data = await redis.mget([self._version_key(telegram_id), self._data_key(telegram_id)])
+        version = int(version or 0)
+        if data is None:
+            return version, None
+        entry = json.loads(data)
+        if entry["version"] != version:
+            return version, None
+        return version, entry["wallets"]
+
+    async def set(self, redis: RedisAPI, telegram_id: int, version: int, wallets: Sequence[dict]) -> None:
+        """
+        Сохраняет кошельки (результат dump) с версией, прочитанной до запроса в БД.
+
+        dump вызывается до release единицы работы: откат транзакции сбрасывает загруженные объекты.
+        """
+        await redis.set(self._data_key(telegram_id), json.dumps({"version": version, "wallets": wallets}), self._ttl)
+        # Версия должна жить не меньше записи, иначе после ее истечения старая запись совпадет с версией 0
+        await redis.expire(self._version_key(telegram_id), self._ttl)
+        return dumped
+
+    async def invalidate(self, redis: RedisAPI, telegram_ids: Iterable[int]) -> None:
+        """Вызывается после коммита изменения баланса"""
+        if not self.enabled:
+            return
+        keys = [self._version_key(telegram_id) for telegram_id in set(telegram_ids)]
+        if keys:
+            await redis.incr_many(keys, self._ttl)
+
+
+wallet_cache = WalletCache(ttl=settings.wallet_cache_ttl)
@@ -3,15 +3,27 @@ from typing import AsyncIterator, Annotated
 from fastapi import Depends
 
 from api.v1.wallet.service import WalletService
-from crypto_processing.client import CryptoProcessingClient
-from infra.postgres.uow import PostgresUnitOfWorkDep
+from crypto_processing.dependencies import CryptoProcessingClientDep
+from infra.postgres.uow import PostgresUnitOfWorkDep, PrimaryReadOnlyUnitOfWorkDep
+from infra.redis.dependencies import RedisDep
 
 
-async def get_wallet_service(uow: PostgresUnitOfWorkDep) -> AsyncIterator[WalletService]:
+async def get_wallet_service(
+    uow: PostgresUnitOfWorkDep,
+    crypto_processing_client: CryptoProcessingClientDep,
+    redis: RedisDep,
+) -> AsyncIterator[WalletService]:
     yield WalletService(
         uow=uow,
-        crypto_processing_client=CryptoProcessingClient()
+        crypto_processing_client=crypto_processing_client,
+        redis=redis,
     )
 
 
+async def get_wallet_read_service(uow: PrimaryReadOnlyUnitOfWorkDep, redis: RedisDep) -> AsyncIterator[WalletService]:
+    # Прочитанные кошельки попадают в кэш, поэтому чтение с primary, а не с отстающей реплики
+    yield WalletService(uow=uow, redis=redis)
+
+
 WalletServiceDep = Annotated[WalletService, Depends(get_wallet_service)]
+WalletReadServiceDep = Annotated[WalletService, Depends(get_wallet_read_service)]
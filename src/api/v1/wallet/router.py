@@ -3,7 +3,7 @@ from uuid import UUID
 from fastapi import APIRouter
 
 from api.v1.operation.schemas import OperationBase
-from api.v1.wallet.dependencies import WalletServiceDep
+from api.v1.wallet.dependencies import WalletServiceDep, WalletReadServiceDep
 from api.v1.wallet.schemas import WalletResponse, WalletCurrencyList, WithdrawRequest
 from api.v1.auth.dependencies import UserAuthDep
 
@@ -72,7 +72,7 @@ def get_currencies(wallet_service: WalletServiceDep) -> WalletCurrencyList:
                             "addresses": [
                                 {
                                     "network": "TRC20",
-                                    "address": "TQn9Y2khDD95J42FQtQTdwVVRqQjKCz9JQ"
+                                    "address": "TQn9Y2khDD95J42FQtQTdwVVRqQjKJ7iqG"
                                 }
                             ]
                         }
@@ -95,7 +95,7 @@ def get_currencies(wallet_service: WalletServiceDep) -> WalletCurrencyList:
 )
 async def get_all_wallets(
     user: UserAuthDep,
-    wallet_service: WalletServiceDep
+    wallet_service: WalletReadServiceDep
 ):
     """
     Получить все кошельки пользователя.
@@ -134,7 +134,7 @@ async def get_all_wallets(
                         "addresses": [
                             {
                                 "network": "TRC20",
-                                "address": "TQn9Y2khDD95J42FQtQTdwVVRqQjKCz9JQ"
+                                "address": "TQn9Y2khDD95J42FQtQTdwVVRqQjKJ7iqG"
                             }
                         ]
                     }
@@ -157,7 +157,7 @@ async def get_all_wallets(
 async def get_wallet(
         user: UserAuthDep,
         wallet_id: UUID,
-        wallet_service: WalletServiceDep
+        wallet_service: WalletReadServiceDep
 ):
     """
     Получить конкретный кошелек.
@@ -165,7 +165,7 @@ async def get_wallet(
     Возвращает детальную информацию о кошельке по его ID,
     включая баланс, валюту и адреса для пополнения.
     """
-    return await wallet_service.get_wallet(wallet_id)
+    return await wallet_service.get_wallet(wallet_id, user.id)
 
 
 @router.post(
@@ -176,8 +176,8 @@ async def get_wallet(
                "**Процесс вывода:**\n"
                "1. Система проверяет достаточность средств на кошельке\n"
                "2. Рассчитывается комиссия сети для указанного адреса\n"
-               "3. Создается операция вывода средств\n"
-               "4. Средства отправляются на указанный адрес через криптопроцессинг\n\n"
+               "3. Средства резервируются, создается операция вывода со статусом PENDING\n"
+               "4. Заявка отправляется в криптопроцессинг фоновым обработчиком\n\n"
                "**Параметры пути:**\n"
                "- `wallet_id` - уникальный идентификатор кошелька (UUID)\n\n"
                "**Параметры тела запроса:**\n"
@@ -190,16 +190,17 @@ async def get_wallet(
                "**Особенности:**\n"
                "- Комиссия сети рассчитывается автоматически\n"
                "- Общая сумма списания = сумма вывода + комиссия сети\n"
-               "- Операция создается со статусом CONFIRMED при успешном выводе",
+               "- Ответ возвращается сразу, операция имеет статус PENDING\n"
+               "- После обработки статус меняется на CONFIRMED или CANCELLED (средства возвращаются на кошелек)",
     responses={
         200: {
-            "description": "Средства успешно выведены",
+            "description": "Заявка на вывод принята",
             "content": {
                 "application/json": {
                     "example": {
                         "operation_id": "550e8400-e29b-41d4-a716-446655440000",
                         "wallet_id": "550e8400-e29b-41d4-a716-446655440001",
-                        "status": "CONFIRMED",
+                        "status": "PENDING",
                         "operation_type": "WITHDRAW",
                         "amount": "100.00",
                         "fee": "1.00",
@@ -224,7 +225,7 @@ async def get_wallet(
                         "NetworkFeeError": {
                             "summary": "Ошибка получения комиссии сети",
                             "value": {
-                                "error": "Failed to get network fee for address TQn9Y2khDD95J42FQtQTdwVVRqQjKCz9JQ",
+                                "error": "Failed to get network fee for address TQn9Y2khDD95J42FQtQTdwVVRqQjKJ7iqG",
                                 "type": "NetworkFeeError"
                             }
                         }
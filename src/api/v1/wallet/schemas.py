@@ -1,22 +1,21 @@
-from decimal import Decimal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, field_validator, Field, model_validator
 
-from api.v1.base.schemas import DisplayDecimal
+from api.v1.base.schemas import DisplayMoney, MoneyAmount
 from infra.postgres.models import WalletCurrency
 from crypto_processing.network import matcher
 
 
 class Address(BaseModel):
     network: str = Field(..., description="Название сети криптовалюты", examples=["TRC20"])
-    address: str = Field(..., description="Адрес кошелька в указанной сети", examples=["TQn9Y2khDD95J42FQtQTdwVVRqQjKCz9JQ"])
+    address: str = Field(..., description="Адрес кошелька в указанной сети", examples=["TQn9Y2khDD95J42FQtQTdwVVRqQjKJ7iqG"])
 
 
 class WalletResponse(BaseModel):
     wallet_id: UUID = Field(..., description="Уникальный идентификатор кошелька")
     currency: WalletCurrency = Field(..., description="Тип криптовалюты кошелька", examples=["USDT"])
-    balance: DisplayDecimal = Field(..., description="Текущий баланс кошелька в основной валюте")
+    balance: DisplayMoney = Field(..., description="Текущий баланс кошелька в основной валюте")
     addresses: list[Address] = Field(..., description="Список адресов для пополнения кошелька")
     icon: str = Field("")
 
@@ -47,5 +46,5 @@ class WalletCurrencyList(BaseModel):
 
 
 class WithdrawRequest(BaseModel):
-    address: str = Field(..., description="Адрес для вывода средств (автоматически определяется сеть)", examples=["TQn9Y2khDD95J42FQtQTdwVVRqQjKCz9JQ"])
-    amount: Decimal = Field(..., description="Сумма для вывода в основной валюте кошелька", examples=["100.00", "50.50", "1000.00"])
+    address: str = Field(..., description="Адрес для вывода средств (автоматически определяется сеть)", examples=["TQn9Y2khDD95J42FQtQTdwVVRqQjKJ7iqG"])
+    amount: MoneyAmount = Field(..., gt=0, description="Сумма для вывода в основной валюте кошелька", examples=["100.00", "50.50", "1000.00"])
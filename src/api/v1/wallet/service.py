@@ -1,63 +1,222 @@
-from decimal import Decimal
-from uuid import UUID
+from datetime import timedelta
+from logging import getLogger
+from uuid import UUID, uuid4
+
+from sqlalchemy import func
 
 from api.v1.base.service import BaseService
-from api.v1.wallet.schemas import WalletCurrencyList, WithdrawRequest
+from api.v1.wallet.cache import wallet_cache
+from api.v1.wallet.schemas import WalletCurrencyList, WalletResponse, WithdrawRequest
+from core.money import format_micros, to_float
 from crypto_processing.network import matcher
-from infra.postgres.models import WalletCurrency, Wallet, Operation, OperationStatus, OperationType
+from infra.postgres.models import (
+    LedgerAccount,
+    WalletCurrency,
+    Operation,
+    OperationStatus,
+    OperationType,
+    Withdrawal,
+    WithdrawalStatus,
+)
+from infra.postgres.storage.ledger import LedgerEntry, debit_entries, reversal_entries
 from api.v1.wallet.exceptions import WalletNotFoundError, NetworkNotFoundError, InsufficientFundsError
 
+logger = getLogger(__name__)
+
 
 class WalletService(BaseService):
     _cached_currencies: WalletCurrencyList | None = None
 
-    async def get_wallet(self, wallet_id: UUID) -> Wallet:
+    async def get_wallet(self, wallet_id: UUID, telegram_id: int) -> WalletResponse:
+        for wallet in await self._get_user_wallets(telegram_id):
+            if wallet.wallet_id == wallet_id:
+                return wallet
+
         wallet = await self.uow.wallet.get_by_id(wallet_id)
-        if not wallet:
+        response = WalletResponse.model_validate(wallet) if wallet else None
+        await self.uow.release()
+        if response is None:
             raise WalletNotFoundError(f"Wallet with id {wallet_id} not found")
-        return wallet
+        return response
 
-    async def get_wallets(self, telegram_id: int) -> list[Wallet]:
-        wallets = await self.uow.wallet.get_user_wallets(telegram_id)
+    async def get_wallets(self, telegram_id: int) -> list[WalletResponse]:
+        wallets = await self._get_user_wallets(telegram_id)
         if not wallets:
             raise WalletNotFoundError(f"No wallets found for user with telegram_id {telegram_id}")
         return wallets
 
+    async def _get_user_wallets(self, telegram_id: int) -> list[WalletResponse]:
+        """Кошельки пользователя из кэша; при промахе — из БД с заполнением кэша"""
+        if not (self.redis and wallet_cache.enabled):
+            wallets = await self.uow.wallet.get_user_wallets(telegram_id)
+            wallets = [WalletResponse.model_validate(wallet) for wallet in wallets]
+            await self.uow.release()
+            return wallets
+
+        version, cached = await wallet_cache.get(self.redis, telegram_id)
+        if cached is None:
+            # Сериализация до release: откат транзакции сбрасывает загруженные объекты
+            wallets = await self.uow.wallet.get_user_wallets(telegram_id)
+            cached = [wallet_cache.dump(wallet) for wallet in wallets]
+            await self.uow.release()
+            await wallet_cache.set(self.redis, telegram_id, version, cached)
+        return [WalletResponse.model_validate(wallet) for wallet in cached]
+
     async def withdraw_funds(self, wallet_id: UUID, user_id: UUID, data: WithdrawRequest) -> Operation:
+        """
+        Первая фаза вывода: резервирует средства и создает PENDING-операцию с заявкой в короткой транзакции.
+
+        Отправку в крипто-процессинг выполняет crypto_processing.withdrawal_worker,
+        итог (подтверждение или возврат средств) фиксирует complete_withdrawal.
+        """
         wallet = await self.uow.wallet.get_wallet_by_id_for_update(wallet_id, user_id)
         if not wallet:
             raise WalletNotFoundError(f"Wallet with id {wallet_id} not found for user {user_id}")
 
-        fee = matcher.get_network_fee(data.address)
-        if not fee:
+        network = matcher.resolve(data.address)
+        if network is None:
             raise NetworkNotFoundError(f"Network not found for address {data.address}")
 
-        amount = int((data.amount + fee) * 1_000_000)
-        total_decimal_amount = Decimal(amount / 1_000_000)
-
-        if wallet.balance < total_decimal_amount:
-            raise InsufficientFundsError(f"Insufficient funds. Required: {total_decimal_amount}, available: {wallet.balance}")
-
-        withdraw_accepted = await self.crypto_processing_client.withdraw_funds(
-            address=data.address,
-            amount=amount
-        )
+        fee = network.fee
+        total_amount = data.amount + fee
+        balance = await self.uow.ledger.get_balance(wallet_id)
+        if balance < total_amount:
+            raise InsufficientFundsError(
+                f"Insufficient funds. Required: {format_micros(total_amount)}, available: {format_micros(balance)}"
+            )
 
         operation = Operation(
+            operation_id=uuid4(),
             wallet_id=wallet_id,
-            status=OperationStatus.CONFIRMED,
+            status=OperationStatus.PENDING,
             operation_type=OperationType.WITHDRAW,
             amount=data.amount,
             fee=fee,
-            total_amount=total_decimal_amount,
+            total_amount=total_amount,
         )
         await self.uow.operation.add(operation)
-        if not withdraw_accepted:
+        await self.uow.withdrawal.add(
+            Withdrawal(
+                operation_id=operation.operation_id,
+                wallet_id=wallet_id,
+                address=data.address,
+                amount=total_amount,
+            )
+        )
+        await self.uow.ledger.post(operation.operation_id, self._withdrawal_entries(operation))
+        await self.uow.release()
+        await self._safe_invalidate_wallets(wallet.telegram_id)
+        return operation
+
+    async def claim_withdrawals(self, limit: int) -> list[Withdrawal]:
+        """Забирает заявки на отправку и фиксирует их как SUBMITTING до обращения к крипто-процессингу"""
+        withdrawals = list(await self.uow.withdrawal.claim(limit))
+        for withdrawal in withdrawals:
+            withdrawal.status = WithdrawalStatus.SUBMITTING
+            withdrawal.attempts += 1
+        await self.uow.release()
+        return withdrawals
+
+    async def expire_stale_withdrawals(self, limit: int, stale_after: float) -> int:
+        """
+        Переводит заявки, зависшие в SUBMITTING, в UNKNOWN.
+
+        Запрос мог дойти до крипто-процессинга, поэтому заявка не отправляется повторно
+        и средства остаются зарезервированными до ручной сверки (resolve_withdrawal).
+        """
+        withdrawals = await self.uow.withdrawal.claim_stale(limit, stale_after)
+        for withdrawal in withdrawals:
+            withdrawal.status = WithdrawalStatus.UNKNOWN
+            withdrawal.last_error = "Submission interrupted"
+            logger.error("Withdrawal %s stuck in SUBMITTING, needs manual review", withdrawal.withdrawal_id)
+        await self.uow.release()
+        return len(withdrawals)
+
+    async def complete_withdrawal(
+        self,
+        withdrawal_id: UUID,
+        status: WithdrawalStatus,
+        error: str | None = None,
+        retry_delay: float = 0,
+        max_attempts: int = 0,
+    ) -> None:
+        """
+        Вторая фаза вывода: фиксирует результат отправки.
+
+        SUBMITTED подтверждает операцию, REJECTED отменяет ее и возвращает средства,
+        QUEUED (запрос не был отправлен) ставит заявку на повтор, UNKNOWN оставляет средства
+        зарезервированными до ручной сверки.
+        """
+        withdrawal = await self.uow.withdrawal.get_for_update(withdrawal_id)
+        if withdrawal is None or withdrawal.status is not WithdrawalStatus.SUBMITTING:
+            return await self.uow.release()
+
+        if status is WithdrawalStatus.QUEUED and withdrawal.attempts >= max_attempts:
+            status = WithdrawalStatus.REJECTED
+        withdrawal.status = status
+        withdrawal.last_error = error
+        if status is WithdrawalStatus.QUEUED:
+            withdrawal.next_attempt_at = self._next_attempt_at(withdrawal, retry_delay)
+            return await self.uow.release()
+        if status is WithdrawalStatus.UNKNOWN:
+            logger.error("Withdrawal %s has unknown outcome, funds stay reserved: %s", withdrawal_id, error)
+            return await self.uow.release()
+
+        await self._finish_withdrawal(withdrawal, status)
+
+    async def resolve_withdrawal(self, withdrawal_id: UUID, status: WithdrawalStatus) -> bool:
+        """
+        Ручная сверка заявки в UNKNOWN по данным крипто-процессинга.
+
+        SUBMITTED подтверждает операцию, REJECTED отменяет ее и возвращает средства.
+        Возвращает False, если заявка не найдена или уже не в UNKNOWN.
+        """
+        if status not in (WithdrawalStatus.SUBMITTED, WithdrawalStatus.REJECTED):
+            raise ValueError(f"Withdrawal can only be resolved as SUBMITTED or REJECTED, got {status.name}")
+        withdrawal = await self.uow.withdrawal.get_for_update(withdrawal_id)
+        if withdrawal is None or withdrawal.status is not WithdrawalStatus.UNKNOWN:
+            await self.uow.release()
+            return False
+
+        withdrawal.status = status
+        withdrawal.last_error = f"Resolved manually as {status.name}"
+        await self._finish_withdrawal(withdrawal, status)
+        return True
+
+    async def _finish_withdrawal(self, withdrawal: Withdrawal, status: WithdrawalStatus) -> None:
+        """Подтверждает или отменяет операцию вывода с возвратом средств; завершает транзакцию"""
+        operation = await self.uow.operation.get_by_id(withdrawal.operation_id)
+        wallet = await self.uow.wallet.get_by_id(withdrawal.wallet_id)
+        if status is WithdrawalStatus.SUBMITTED:
+            operation.status = OperationStatus.CONFIRMED
+        else:
+            # Возврат средств — зачисление, блокировка кошелька не нужна
             operation.status = OperationStatus.CANCELLED
-            return operation
+            await self.uow.ledger.post(operation.operation_id, reversal_entries(self._withdrawal_entries(operation)))
+        await self.uow.release()
+        if operation.status is OperationStatus.CANCELLED:
+            await self._safe_invalidate_wallets(wallet.telegram_id)
 
-        wallet.balance -= total_decimal_amount
-        return operation
+        await self._safe_notify_operation_status(
+            telegram_id=wallet.telegram_id,
+            operation_id=str(operation.operation_id),
+            operation_status=operation.status.value,
+            amount=to_float(operation.amount),
+        )
+
+    @staticmethod
+    def _next_attempt_at(withdrawal: Withdrawal, retry_delay: float):
+        return func.now() + timedelta(seconds=retry_delay * 2 ** min(withdrawal.attempts - 1, 10))
+
+    @staticmethod
+    def _withdrawal_entries(operation: Operation) -> list[LedgerEntry]:
+        return debit_entries(
+            operation.wallet_id,
+            LedgerAccount.WITHDRAWALS,
+            operation.amount,
+            operation.fee,
+            LedgerAccount.NETWORK_FEES,
+        )
 
     @classmethod
     def get_currencies(cls) -> WalletCurrencyList:
@@ -4,10 +4,11 @@ from fastapi import Depends
 
 from api.v1.webhook.service import WebhookService
 from infra.postgres.uow import PostgresUnitOfWorkDep
+from infra.redis.dependencies import RedisDep
 
 
-async def get_webhook_service(uow: PostgresUnitOfWorkDep) -> AsyncIterator[WebhookService]:
-    yield WebhookService(uow=uow)
+async def get_webhook_service(uow: PostgresUnitOfWorkDep, redis: RedisDep) -> AsyncIterator[WebhookService]:
+    yield WebhookService(uow=uow, redis=redis)
 
 
 WebhookServiceDep = Annotated[WebhookService, Depends(get_webhook_service)]
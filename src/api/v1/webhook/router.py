@@ -1,7 +1,10 @@
-from fastapi import APIRouter, status
+from typing import Annotated
+
+from fastapi import APIRouter, Body, status
 
 from api.v1.webhook.dependencies import WebhookServiceDep
-from api.v1.webhook.schemas import CryptocurrencyReplenishmentCreate
+from api.v1.webhook.schemas import CryptocurrencyReplenishmentCreate, WebhookBatchResponse
+from core.config import settings
 
 router = APIRouter(prefix="/webhook", tags=["webhook"])
 
@@ -9,5 +12,23 @@ router = APIRouter(prefix="/webhook", tags=["webhook"])
 @router.post("", status_code=status.HTTP_200_OK)
 async def get_webhook(data: CryptocurrencyReplenishmentCreate, webhook_service: WebhookServiceDep):
     if data.type == "refill":
-        await webhook_service.add_balance(data)
+        await webhook_service.enqueue(data)
     return {"status": "ok"}
+
+
+@router.post(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    response_model=WebhookBatchResponse,
+    summary="Пакетная доставка пополнений",
+    description="Принимает массив пополнений (например, при догоняющей синхронизации после простоя) "
+                "и зачисляет их в одной транзакции. Возвращает статус каждого элемента.",
+)
+async def get_webhook_batch(
+    data: Annotated[
+        list[CryptocurrencyReplenishmentCreate],
+        Body(min_length=1, max_length=settings.webhook_batch_max_size),
+    ],
+    webhook_service: WebhookServiceDep,
+):
+    return WebhookBatchResponse(items=await webhook_service.apply_batch(data))
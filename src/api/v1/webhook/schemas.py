@@ -1,13 +1,35 @@
+from enum import Enum
 from typing import Literal
 
 from pydantic import BaseModel, Field
-from decimal import Decimal
+
+from api.v1.base.schemas import MoneyAmount
 
 
 class CryptocurrencyReplenishmentCreate(BaseModel):
     tx_id: str = Field(..., description="ID транзакции")
     from_address: str = Field(..., description="Адрес отправителя (base58)")
     to_address: str = Field(..., description="Адрес получателя (base58)")
-    amount: Decimal = Field(..., description="Сумма в USDT")
+    amount: MoneyAmount = Field(..., description="Сумма в USDT")
     crypto_type: str = Field(..., description="Тип криптовалюты (например, USDT)")
     type: Literal["refill", "withdraw"] = Field(..., description="Тип операции")
+
+
+class WebhookItemStatus(str, Enum):
+    CREDITED = "credited"
+    DUPLICATE = "duplicate"
+    QUEUED = "queued"
+    SKIPPED = "skipped"
+
+
+class WebhookBatchItemResult(BaseModel):
+    tx_id: str = Field(..., description="ID транзакции")
+    status: WebhookItemStatus = Field(
+        ...,
+        description="credited — зачислено; duplicate — уже было зачислено; "
+                    "queued — кошелек не найден, поставлено на повтор; skipped — не пополнение",
+    )
+
+
+class WebhookBatchResponse(BaseModel):
+    items: list[WebhookBatchItemResult] = Field(..., description="Статусы элементов в порядке запроса")
@@ -1,40 +1,114 @@
-from decimal import Decimal
+from dataclasses import dataclass, field
+from uuid import uuid4
 
 from api.v1.base.service import BaseService
-from api.v1.webhook.schemas import CryptocurrencyReplenishmentCreate
-from infra.postgres.models import CryptocurrencyReplenishment, Operation, OperationStatus, OperationType
+from api.v1.webhook.schemas import CryptocurrencyReplenishmentCreate, WebhookBatchItemResult, WebhookItemStatus
+from infra.postgres.models import LedgerAccount, Operation, OperationStatus, OperationType
+from infra.postgres.storage.ledger import credit_entries
 from crypto_processing.network import matcher
-from api.v1.webhook.exceptions import TransactionAlreadyExistsError
-from api.v1.wallet.exceptions import WalletNotFoundError
+
+
+@dataclass
+class DepositBatchResult:
+    credited: set[str] = field(default_factory=set)
+    duplicates: set[str] = field(default_factory=set)
+    telegram_ids: set[int] = field(default_factory=set)
+    unmatched: list[CryptocurrencyReplenishmentCreate] = field(default_factory=list)
 
 
 class WebhookService(BaseService):
-    async def add_balance(self, webhook_data: CryptocurrencyReplenishmentCreate):
-        transaction = await self.uow.cryptocurrency_replenishment.get_by_id(webhook_data.tx_id)
-        if transaction is not None:
-            raise TransactionAlreadyExistsError(f"Transaction with tx_id {webhook_data.tx_id} already exists")
-
-        wallet = await self.uow.wallet.get_wallet_by_address_for_update(webhook_data.to_address)
-        if not wallet:
-            raise WalletNotFoundError(f"Wallet with address {webhook_data.to_address} is not found")
-
-        fee = matcher.get_network_fee(webhook_data.to_address)
-        net_amount = max(Decimal("0"), webhook_data.amount - fee)
-
-        operation = Operation(
-            wallet_id=wallet.wallet_id,
-            status=OperationStatus.CONFIRMED,
-            operation_type=OperationType.DEPOSIT,
-            amount=net_amount,
-            fee=fee,
-            total_amount=webhook_data.amount,
+    async def enqueue(self, webhook_data: CryptocurrencyReplenishmentCreate) -> None:
+        """Сохраняет пополнение во входящую очередь; зачисление выполняет crypto_processing.deposit_worker"""
+        await self.uow.webhook_inbox.push(webhook_data.tx_id, webhook_data.model_dump(mode="json"))
+        # Процессинг получает 200 только после фиксации записи
+        await self.uow.release()
+
+    async def apply_batch(self, deposits: list[CryptocurrencyReplenishmentCreate]) -> list[WebhookBatchItemResult]:
+        """
+        Зачисляет пачку пополнений в одной транзакции и возвращает статус каждого элемента.
+
+        Пополнения на неизвестные адреса не теряются, а попадают во входящую очередь на повтор.
+        """
+        result = await self.apply_deposits([deposit for deposit in deposits if deposit.type == "refill"])
+        await self.uow.webhook_inbox.push_many(
+            [(deposit.tx_id, deposit.model_dump(mode="json")) for deposit in result.unmatched]
         )
-        await self.uow.operation.add(operation)
+        await self.uow.release()
+        await self._safe_invalidate_wallets(*result.telegram_ids)
+
+        items = []
+        seen: set[str] = set()
+        for deposit in deposits:
+            if deposit.type != "refill":
+                status = WebhookItemStatus.SKIPPED
+            elif deposit.tx_id in seen:
+                status = WebhookItemStatus.DUPLICATE
+            elif deposit.tx_id in result.credited:
+                status = WebhookItemStatus.CREDITED
+            elif deposit.tx_id in result.duplicates:
+                status = WebhookItemStatus.DUPLICATE
+            else:
+                status = WebhookItemStatus.QUEUED
+            seen.add(deposit.tx_id)
+            items.append(WebhookBatchItemResult(tx_id=deposit.tx_id, status=status))
+        return items
 
-        replenishment = CryptocurrencyReplenishment(
-            operation_id=operation.operation_id,
-            **webhook_data.model_dump(exclude={"type"})
+    async def apply_deposits(self, deposits: list[CryptocurrencyReplenishmentCreate]) -> DepositBatchResult:
+        """
+        Зачисляет пачку пополнений: один запрос на поиск кошельков, многострочные вставки операций
+        и проводок журнала. Кошельки не блокируются, поэтому параллельные зачисления не ждут друг друга.
+
+        Повторы отсекает уникальность tx_id (INSERT ... ON CONFLICT DO NOTHING RETURNING):
+        операция и проводки создаются только для реально вставленных транзакций.
+        """
+        unique: dict[str, CryptocurrencyReplenishmentCreate] = {}
+        for deposit in deposits:
+            unique.setdefault(deposit.tx_id, deposit)
+
+        wallets = await self.uow.wallet.get_wallets_by_addresses(
+            list({deposit.to_address for deposit in unique.values()})
         )
-        await self.uow.cryptocurrency_replenishment.add(replenishment)
 
-        wallet.balance += net_amount
+        result = DepositBatchResult()
+        operations: dict[str, Operation] = {}
+        replenishments = []
+        for deposit in unique.values():
+            wallet = wallets.get(deposit.to_address)
+            if wallet is None:
+                result.unmatched.append(deposit)
+                continue
+
+            fee = matcher.get_network_fee(deposit.to_address)
+            operations[deposit.tx_id] = Operation(
+                operation_id=uuid4(),
+                wallet_id=wallet.wallet_id,
+                status=OperationStatus.CONFIRMED,
+                operation_type=OperationType.DEPOSIT,
+                amount=max(0, deposit.amount - fee),
+                fee=fee,
+                total_amount=deposit.amount,
+            )
+            replenishments.append({
+                "operation_id": operations[deposit.tx_id].operation_id,
+                **deposit.model_dump(exclude={"type"}),
+            })
+
+        result.credited = await self.uow.cryptocurrency_replenishment.insert_new(replenishments)
+        result.duplicates = set(operations) - result.credited
+        credited = [operation for tx_id, operation in operations.items() if tx_id in result.credited]
+        result.telegram_ids = {wallets[unique[tx_id].to_address].telegram_id for tx_id in result.credited}
+        await self.uow.operation.add_all(credited)
+        await self.uow.ledger.post_many(
+            (
+                operation.operation_id,
+                credit_entries(
+                    operation.wallet_id,
+                    LedgerAccount.DEPOSITS,
+                    operation.total_amount,
+                    operation.amount,
+                    LedgerAccount.NETWORK_FEES,
+                ),
+            )
+            for operation in credited
+        )
+        return result
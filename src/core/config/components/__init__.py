@@ -4,6 +4,8 @@ from core.config.components.redis import RedisConfig
 from core.config.components.external_api import ExternalApiConfig
 from core.config.components.telegram_bot import TelegramBotConfig
 from core.config.components.alfa import AlfaApiConfig
+from core.config.components.notification import NotificationConfig
+from core.config.components.auth import AuthConfig
 
 
 class ComponentsConfig(
@@ -13,6 +15,8 @@ class ComponentsConfig(
     ExternalApiConfig,
     TelegramBotConfig,
     AlfaApiConfig,
+    NotificationConfig,
+    AuthConfig,
 ):
     pass
 
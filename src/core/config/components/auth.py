@@ -0,0 +1,15 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from core.config.constants import ENV_FILE_PATH
+
+
+class AuthConfig(BaseSettings):
+    session_secret_key: str = Field(default="", description="Ключ подписи сессионных токенов (по умолчанию выводится из токена бота)")
+    session_token_ttl: int = Field(default=900, description="Время жизни сессионного токена в секундах")
+    admin_token: str = Field(default="", description="Токен служебных эндпоинтов /admin (пусто — эндпоинты отключены)")
+
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE_PATH,
+        env_file_encoding='utf-8',
+    )
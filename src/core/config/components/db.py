@@ -11,6 +11,32 @@ class DatabaseConfig(BaseSettings):
     postgres_password: str = Field(default='postgres')
     postgres_db: str = Field(default='postgres')
 
+    postgres_pool_size: int = Field(default=5, description="Постоянный размер пула соединений на процесс")
+    postgres_max_overflow: int = Field(default=10, description="Дополнительные соединения сверх pool_size при пиковой нагрузке")
+    postgres_pool_timeout: float = Field(default=30.0, description="Ожидание свободного соединения из пула в секундах")
+    postgres_pool_recycle: int = Field(default=3600, description="Максимальный возраст соединения в секундах")
+    postgres_pool_recycle_jitter: float = Field(default=0.1, description="Доля случайного разброса возраста соединения, чтобы пул не переоткрывался разом")
+    postgres_pool_pre_ping: bool = Field(default=False, description="Проверять соединение перед выдачей из пула")
+    postgres_statement_cache_size: int = Field(default=100, description="Размер кэша подготовленных выражений asyncpg на соединение")
+    postgres_statement_timeout: int = Field(default=30000, description="statement_timeout в миллисекундах")
+    postgres_pgbouncer: bool = Field(default=False, description="Подключение через PgBouncer в режиме transaction pooling")
+    postgres_repeated_query_threshold: int = Field(default=10, description="Сколько раз один запрос может выполниться за HTTP-запрос до предупреждения о N+1")
+    postgres_query_stats_header: bool = Field(default=False, description="Добавлять в ответы заголовки с количеством и временем SQL-запросов")
+    postgres_slow_query_threshold: float = Field(default=500, description="Порог медленного запроса в миллисекундах (0 — не записывать)")
+    postgres_slow_query_explain_sample_rate: float = Field(default=0.1, description="Доля медленных SELECT, для которых снимается EXPLAIN (ANALYZE, BUFFERS)")
+    postgres_slow_query_buffer_size: int = Field(default=100, description="Сколько последних медленных запросов хранится в памяти процесса")
+    postgres_partition_months_ahead: int = Field(default=3, description="На сколько месяцев вперед заранее создаются секции таблиц операций")
+    postgres_partition_maintenance_interval: float = Field(default=3600.0, description="Интервал проверки и создания секций таблиц операций в секундах")
+    postgres_ledger_snapshot_interval: float = Field(default=60.0, description="Интервал обновления снимков балансов из журнала проводок в секундах")
+    postgres_ledger_snapshot_lag: float = Field(default=300.0, description="Возраст проводок в секундах, после которого они переносятся в снимки (больше самой долгой транзакции)")
+    postgres_ledger_snapshot_batch_size: int = Field(default=100_000, description="Сколько проводок переносится в снимки за один проход")
+
+    postgres_replica_host: str = Field(default='', description="Хост реплики для чтения (пусто — чтение с primary)")
+    postgres_replica_port: int = Field(default=5432, description="Порт реплики для чтения")
+    postgres_replica_max_lag: float = Field(default=5.0, description="Допустимое отставание реплики в секундах")
+    postgres_replica_check_interval: float = Field(default=5.0, description="Интервал проверки состояния реплики в секундах")
+    postgres_read_your_writes_ttl: int = Field(default=10, description="Сколько секунд после записи чтение пользователя идет с primary")
+
     model_config = SettingsConfigDict(
         env_file=ENV_FILE_PATH,
         env_file_encoding='utf-8',
@@ -21,3 +47,11 @@ class DatabaseConfig(BaseSettings):
         return (f'postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}@'
                 f'{self.postgres_host}:{self.postgres_port}/{self.postgres_db}'
                 f'?async_fallback=True')
+
+    @computed_field(return_type=str | None)
+    def POSTGRES_REPLICA_URL(self): # noqa
+        if not self.postgres_replica_host:
+            return None
+        return (f'postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}@'
+                f'{self.postgres_replica_host}:{self.postgres_replica_port}/{self.postgres_db}'
+                f'?async_fallback=True')
@@ -7,6 +7,35 @@ from core.config.constants import ENV_FILE_PATH
 class ExternalApiConfig(BaseSettings):
     crypto_processing_base_url: str = Field(default="", description="Базовый URL сервиса по крипто-процессингу")
     crypto_processing_token: str = Field(default="", description="Токен для аутентификации на сервисе крипто-процессинга")
+    crypto_processing_timeout: float = Field(default=10, description="Таймаут запросов к крипто-процессингу в секундах")
+    crypto_processing_withdraw_timeout: float = Field(default=30, description="Таймаут запроса на вывод средств в секундах")
+    crypto_processing_max_retries: int = Field(default=3, description="Повторов безопасных запросов при временных ошибках")
+    crypto_processing_retry_backoff: float = Field(default=0.5, description="Базовая задержка между повторами в секундах")
+    crypto_processing_connection_limit: int = Field(default=20, description="Размер пула соединений к крипто-процессингу")
+
+    crypto_networks: list[str] = Field(
+        default=["TRC20"],
+        description="Включенные сети для адресов (TRC20, ERC20, BEP20, TON); при совпадении формата побеждает первая",
+    )
+
+    deposit_address_pool_min_size: int = Field(default=50, description="Порог пула депозитных адресов, ниже которого запускается пополнение")
+    deposit_address_pool_target_size: int = Field(default=200, description="Размер, до которого пополняется пул депозитных адресов")
+    deposit_address_pool_check_interval: int = Field(default=30, description="Интервал проверки пула депозитных адресов в секундах")
+    deposit_address_pool_concurrency: int = Field(default=5, description="Количество параллельных запросов при пополнении пула")
+
+    webhook_batch_max_size: int = Field(default=1000, description="Максимальное количество пополнений в одном пакетном вебхуке")
+    webhook_inbox_batch_size: int = Field(default=500, description="Сколько пополнений из входящей очереди применяется за одну транзакцию")
+    webhook_inbox_poll_interval: float = Field(default=1.0, description="Интервал опроса пустой входящей очереди вебхуков в секундах")
+    webhook_inbox_max_attempts: int = Field(default=10, description="Попыток применения пополнения, после которых запись остается в очереди для разбора")
+    webhook_inbox_retry_delay: float = Field(default=5.0, description="Базовая задержка повторной обработки пополнения в секундах (растет экспоненциально)")
+
+    withdrawal_worker_batch_size: int = Field(default=20, description="Сколько заявок на вывод забирается за раз")
+    withdrawal_worker_concurrency: int = Field(default=5, description="Количество одновременных запросов на вывод к крипто-процессингу")
+    withdrawal_worker_poll_interval: float = Field(default=1.0, description="Интервал опроса очереди выводов в секундах")
+    withdrawal_max_attempts: int = Field(default=5, description="Попыток отправки вывода при ошибках соединения, после которых средства возвращаются")
+    withdrawal_retry_delay: float = Field(default=10.0, description="Базовая задержка повторной отправки вывода в секундах (растет экспоненциально)")
+    withdrawal_reconcile_interval: float = Field(default=60.0, description="Интервал поиска выводов, зависших в SUBMITTING, в секундах")
+    withdrawal_reconcile_after: float = Field(default=300.0, description="Через сколько секунд без изменений заявка в SUBMITTING переводится в UNKNOWN для ручной сверки (больше таймаута вывода)")
 
     model_config = SettingsConfigDict(
         env_file=ENV_FILE_PATH,
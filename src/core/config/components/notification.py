@@ -0,0 +1,13 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from core.config.constants import ENV_FILE_PATH
+
+
+class NotificationConfig(BaseSettings):
+    notification_ttl: int = Field(default=0, description="Время жизни уведомления в секундах (0 — без ограничения)")
+
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE_PATH,
+        env_file_encoding='utf-8',
+    )
@@ -10,6 +10,8 @@ class RedisConfig(BaseSettings):
     redis_port: int = Field(default=6379)
     redis_db: int = Field(default=0)
 
+    wallet_cache_ttl: int = Field(default=300, description="Время жизни кэша кошельков пользователя в секундах (0 — кэш отключен)")
+
     model_config = SettingsConfigDict(
         env_file=ENV_FILE_PATH,
         env_file_encoding='utf-8',
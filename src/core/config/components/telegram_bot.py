@@ -6,6 +6,15 @@ from core.config.constants import ENV_FILE_PATH
 
 class TelegramBotConfig(BaseSettings):
     telegram_bot_token: str = Field(default="", description="Токен бота телеграм, через которого запускается MiniApp")
+    telegram_init_data_max_age: int = Field(default=0, description="Максимальный возраст initData в секундах (0 — без ограничения)")
+    telegram_init_data_cache_size: int = Field(default=10_000, description="Размер кэша провалидированных initData (0 — отключить)")
+    telegram_init_data_cache_ttl: int = Field(default=300, description="Время жизни записи в кэше initData в секундах")
+
+    telegram_push_enabled: bool = Field(default=False, description="Отправлять уведомления пользователям в Telegram")
+    telegram_push_rate_limit: float = Field(default=25.0, description="Лимит сообщений в секунду на один процесс доставки")
+    telegram_push_chat_rate_limit: float = Field(default=1.0, description="Лимит сообщений в секунду в один чат")
+    telegram_push_concurrency: int = Field(default=10, description="Количество чатов, обрабатываемых одновременно")
+    telegram_push_stream_maxlen: int = Field(default=100_000, description="Максимальная длина потока push-уведомлений")
 
     model_config = SettingsConfigDict(
         env_file=ENV_FILE_PATH,
@@ -3,13 +3,14 @@ import logging
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
+from api.v1.base.exceptions import InvalidCursorError
 from api.v1.wallet.exceptions import WalletNotFoundError, NetworkNotFoundError, InsufficientFundsError
 from api.v1.payment.exceptions import PaymentProcessingError, PaymentLinkError
 from api.v1.user.exceptions import EntryCodeUpdateError
 from api.v1.auth.exceptions import InvalidEntryCodeError
-from api.v1.webhook.exceptions import TransactionAlreadyExistsError
 from api.v1.referral.exceptions import ReferralNotFoundError, ReferralTypeAlreadySetError, ReferralUpdateError
 from banking.exceptions import BankApiError, BankTokenError
+from crypto_processing.exceptions import CryptoProcessingError
 from banking.providers.alfa.exceptions import AlfaTokenError, AlfaApiError, AlfaRsaSignatureError
 
 logger = logging.getLogger(__name__)
@@ -106,19 +107,6 @@ async def invalid_entry_code_handler(request: Request, exc: InvalidEntryCodeErro
     )
 
 
-async def transaction_exists_handler(request: Request, exc: TransactionAlreadyExistsError) -> JSONResponse:
-    """Обработчик для ошибок существующих транзакций"""
-    logger.error(f"Transaction exists error: {exc.message}", extra={"path": request.url.path})
-    
-    return JSONResponse(
-        status_code=409,
-        content={
-            "error": exc.message,
-            "type": exc.__class__.__name__
-        }
-    )
-
-
 async def referral_not_found_handler(request: Request, exc: ReferralNotFoundError) -> JSONResponse:
     """Обработчик для ошибок: реферал не найден"""
     logger.error(f"Referral not found error: {exc.message}", extra={"path": request.url.path})
@@ -158,6 +146,36 @@ async def referral_update_handler(request: Request, exc: ReferralUpdateError) ->
     )
 
 
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError) -> JSONResponse:
+    """Обработчик для ошибок некорректного курсора пагинации"""
+    logger.error(f"Invalid cursor error: {exc.message}", extra={"path": request.url.path})
+    
+    return JSONResponse(
+        status_code=400,
+        content={
+            "error": exc.message,
+            "type": exc.__class__.__name__
+        }
+    )
+
+
+async def crypto_processing_exception_handler(request: Request, exc: CryptoProcessingError) -> JSONResponse:
+    """Обработчик для ошибок крипто-процессинга"""
+    logger.error(f"Crypto processing error: {exc.message}", extra={
+        "status_code": exc.status_code,
+        "response_data": exc.response_data,
+        "path": request.url.path
+    })
+
+    return JSONResponse(
+        status_code=503 if exc.is_transient else 502,
+        content={
+            "error": "Crypto processing service error",
+            "type": exc.__class__.__name__
+        }
+    )
+
+
 async def bank_exception_handler(request: Request, exc: BankApiError) -> JSONResponse:
     """Обработчик для банковских исключений"""
     logger.error(f"Bank API error: {exc.message}", extra={
@@ -250,12 +268,13 @@ def register_exception_handlers(app: FastAPI) -> None:
     app.add_exception_handler(PaymentLinkError, payment_link_handler)
     app.add_exception_handler(EntryCodeUpdateError, entry_code_update_handler)
     app.add_exception_handler(InvalidEntryCodeError, invalid_entry_code_handler)
-    app.add_exception_handler(TransactionAlreadyExistsError, transaction_exists_handler)
     app.add_exception_handler(ReferralNotFoundError, referral_not_found_handler)
     app.add_exception_handler(ReferralTypeAlreadySetError, referral_type_already_set_handler)
     app.add_exception_handler(ReferralUpdateError, referral_update_handler)
+    app.add_exception_handler(InvalidCursorError, invalid_cursor_handler)
     
     # Банковские исключения
+    app.add_exception_handler(CryptoProcessingError, crypto_processing_exception_handler)
     app.add_exception_handler(BankApiError, bank_exception_handler)
     app.add_exception_handler(BankTokenError, bank_token_exception_handler)
     
@@ -0,0 +1,59 @@
+from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
+
+# Суммы в USDT хранятся и считаются как int в микро-единицах (6 знаков после запятой)
+MICROS = 1_000_000
+DECIMAL_PLACES = 6
+
+Money = int
+
+
+def to_micros(value: Decimal | str | int | float, exact: bool = True) -> Money:
+    """
+    Переводит сумму в USDT в микро-единицы.
+
+    При exact=True сумма с более чем 6 знаками после запятой считается ошибкой,
+    иначе округляется по правилу half-up.
+    """
+    try:
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        micros = value.scaleb(DECIMAL_PLACES)
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {value!r}")
+    if not micros.is_finite():
+        raise ValueError(f"Invalid amount: {value!r}")
+
+    rounded = micros.to_integral_value(rounding=ROUND_HALF_UP)
+    if exact and rounded != micros:
+        raise ValueError(f"Amount has more than {DECIMAL_PLACES} decimal places: {value}")
+    return int(rounded)
+
+
+def from_micros(micros: Money) -> Decimal:
+    """Переводит микро-единицы в Decimal (для БД и внешних систем)"""
+    return Decimal(micros).scaleb(-DECIMAL_PLACES)
+
+
+def to_float(micros: Money) -> float:
+    """Сумма в USDT как float — только для отображения (уведомления, статистика)"""
+    return micros / MICROS
+
+
+def mul_div(micros: Money, numerator: int, denominator: int) -> Money:
+    """micros * numerator / denominator с округлением half-up в целых числах"""
+    if denominator <= 0:
+        raise ValueError("Denominator must be positive")
+    product = micros * numerator
+    if product >= 0:
+        return (2 * product + denominator) // (2 * denominator)
+    return -((-2 * product + denominator) // (2 * denominator))
+
+
+def format_micros(micros: Money, places: int = DECIMAL_PLACES) -> str:
+    """Строковое представление суммы с заданным числом знаков (half-up), без перехода через Decimal"""
+    value = mul_div(abs(micros), 1, 10 ** (DECIMAL_PLACES - places))
+    sign = "-" if micros < 0 and value else ""
+    if not places:
+        return f"{sign}{value}"
+    units, fraction = divmod(value, 10 ** places)
+    return f"{sign}{units}.{fraction:0{places}d}"
@@ -0,0 +1,86 @@
+import asyncio
+from logging import getLogger
+
+from core.config import settings
+from core.logging_config import setup_logging
+from crypto_processing.client import CryptoProcessingClient
+from infra.postgres.pg import get_db
+from infra.postgres.storage.deposit_address import DepositAddressStorage
+
+logger = getLogger(__name__)
+
+
+class DepositAddressPoolRefiller:
+    """
+    Поддерживает запас заранее зарегистрированных депозитных адресов.
+
+    Когда пул опускается ниже min_size, адреса запрашиваются в крипто-процессинге
+    до target_size, чтобы регистрация пользователя не ждала внешний сервис.
+    """
+
+    def __init__(
+        self,
+        client: CryptoProcessingClient,
+        min_size: int = settings.deposit_address_pool_min_size,
+        target_size: int = settings.deposit_address_pool_target_size,
+        check_interval: int = settings.deposit_address_pool_check_interval,
+        concurrency: int = settings.deposit_address_pool_concurrency,
+    ):
+        self._client = client
+        self._min_size = min_size
+        self._target_size = max(target_size, min_size)
+        self._check_interval = check_interval
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._stopped = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    async def run(self) -> None:
+        logger.info("Deposit address pool refiller started")
+        while not self._stopped.is_set():
+            try:
+                await self.refill()
+            except Exception:
+                logger.exception("Deposit address pool refill failed")
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=self._check_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def refill(self) -> int:
+        async with get_db() as db:
+            size = await DepositAddressStorage(db).count()
+        if size >= self._min_size:
+            return 0
+
+        missing = self._target_size - size
+        results = await asyncio.gather(*(self._register() for _ in range(missing)), return_exceptions=True)
+        addresses = [result for result in results if isinstance(result, str)]
+        failed = len(results) - len(addresses)
+        if failed:
+            logger.warning("Failed to register %s of %s deposit addresses", failed, missing)
+
+        async with get_db() as db:
+            await DepositAddressStorage(db).add_many(addresses)
+        logger.info("Deposit address pool refilled: %s -> %s", size, size + len(addresses))
+        return len(addresses)
+
+    async def _register(self) -> str:
+        async with self._semaphore:
+            response = await self._client.register_client()
+            return response.trxAddress
+
+
+async def _run() -> None:
+    async with CryptoProcessingClient() as client:
+        await DepositAddressPoolRefiller(client).run()
+
+
+def main() -> None:
+    setup_logging(log_to_file=not settings.DEBUG)
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import base64
+import binascii
+import hashlib
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BASE58_INDEX = {char: index for index, char in enumerate(BASE58_ALPHABET)}
+
+_KECCAK_ROUND_CONSTANTS = (
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+)
+_KECCAK_ROTATIONS = (
+    (0, 36, 3, 41, 18),
+    (1, 44, 10, 45, 2),
+    (62, 6, 43, 15, 61),
+    (28, 55, 25, 21, 56),
+    (27, 20, 39, 8, 14),
+)
+_KECCAK_RATE = 136
+_MASK_64 = (1 << 64) - 1
+
+
+def base58_decode(value: str) -> bytes | None:
+    """Декодирует строку Base58 (алфавит Bitcoin); None, если встречен недопустимый символ"""
+    number = 0
+    for char in value:
+        digit = _BASE58_INDEX.get(char)
+        if digit is None:
+            return None
+        number = number * 58 + digit
+
+    leading_zeros = len(value) - len(value.lstrip("1"))
+    body = number.to_bytes((number.bit_length() + 7) // 8, "big") if number else b""
+    return b"\x00" * leading_zeros + body
+
+
+def base58check_payload(value: str) -> bytes | None:
+    """Проверяет Base58Check (двойной SHA-256, 4 байта) и возвращает полезную нагрузку"""
+    raw = base58_decode(value)
+    if raw is None or len(raw) < 5:
+        return None
+    payload, checksum = raw[:-4], raw[-4:]
+    if hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4] != checksum:
+        return None
+    return payload
+
+
+def _rotate(value: int, shift: int) -> int:
+    return ((value << shift) | (value >> (64 - shift))) & _MASK_64
+
+
+def _keccak_f1600(state: list[int]) -> list[int]:
+    for round_constant in _KECCAK_ROUND_CONSTANTS:
+        c = [state[x] ^ state[x + 5] ^ state[x + 10] ^ state[x + 15] ^ state[x + 20] for x in range(5)]
+        d = [c[(x - 1) % 5] ^ _rotate(c[(x + 1) % 5], 1) for x in range(5)]
+        state = [lane ^ d[index % 5] for index, lane in enumerate(state)]
+
+        b = [0] * 25
+        for x in range(5):
+            for y in range(5):
+                b[y + 5 * ((2 * x + 3 * y) % 5)] = _rotate(state[x + 5 * y], _KECCAK_ROTATIONS[x][y])
+
+        state = [
+            b[i] ^ (~b[(i + 1) % 5 + 5 * (i // 5)] & b[(i + 2) % 5 + 5 * (i // 5)])
+            for i in range(25)
+        ]
+        state[0] ^= round_constant
+    return state
+
+
+def keccak256(data: bytes) -> bytes:
+    """
+    Keccak-256 (как в Ethereum; отличается от hashlib.sha3_256 дополнением).
+
+    Чистый Python — используется только для проверки EIP-55 у адресов в смешанном регистре.
+    """
+    padded = bytearray(data)
+    padded.append(0x01)
+    padded.extend(b"\x00" * (-len(padded) % _KECCAK_RATE))
+    padded[-1] |= 0x80
+
+    state = [0] * 25
+    for offset in range(0, len(padded), _KECCAK_RATE):
+        block = padded[offset:offset + _KECCAK_RATE]
+        for index in range(_KECCAK_RATE // 8):
+            state[index] ^= int.from_bytes(block[index * 8:index * 8 + 8], "little")
+        state = _keccak_f1600(state)
+
+    return b"".join(lane.to_bytes(8, "little") for lane in state[:4])
+
+
+def eip55_is_valid(hex_address: str) -> bool:
+    """
+    Проверяет контрольную сумму EIP-55 для 40 hex-символов адреса без префикса 0x.
+
+    Адрес целиком в одном регистре контрольной суммы не содержит и считается корректным.
+    """
+    if hex_address.islower() or hex_address.isupper():
+        return True
+    digest = keccak256(hex_address.lower().encode()).hex()
+    for char, nibble in zip(hex_address, digest):
+        if char.isalpha() and char.isupper() != (int(nibble, 16) >= 8):
+            return False
+    return True
+
+
+def ton_friendly_payload(value: str) -> bytes | None:
+    """Декодирует user-friendly адрес TON (base64/base64url, 36 байт) и проверяет CRC16-XMODEM"""
+    try:
+        raw = base64.b64decode(value.replace("-", "+").replace("_", "/"), validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    if len(raw) != 36:
+        return None
+    payload, checksum = raw[:34], raw[34:]
+    if binascii.crc_hqx(payload, 0).to_bytes(2, "big") != checksum:
+        return None
+    return payload
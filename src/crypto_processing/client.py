@@ -1,64 +1,169 @@
+import asyncio
+import random
+import time
+from logging import getLogger
+from uuid import UUID
+
 import aiohttp
 
 from core.config import settings
+from crypto_processing.exceptions import (
+    CryptoProcessingConnectionError,
+    CryptoProcessingError,
+    CryptoProcessingRejectedError,
+    CryptoProcessingUnavailableError,
+)
+from crypto_processing.metrics import CRYPTO_PROCESSING_REQUEST_DURATION
 from crypto_processing.schemas import (
     ApiKeyRefreshResponse,
     ClientRegistrationResponse,
     WebhookRegistrationResponse,
 )
 
+logger = getLogger(__name__)
+
 
 class CryptoProcessingClient:
+    """
+    Клиент крипто-процессинга с долгоживущей сессией и keep-alive пулом соединений.
+
+    В приложении один экземпляр открывается в lifespan (crypto_processing.dependencies),
+    отдельные процессы используют `async with CryptoProcessingClient() as client`.
+    Повторяются только запросы, повтор которых безопасен, и только при временных ошибках.
+    """
     BASE_URL = settings.crypto_processing_base_url
     api_key = settings.crypto_processing_token
-    timeout = aiohttp.ClientTimeout(total=10)
+    timeout = aiohttp.ClientTimeout(total=settings.crypto_processing_timeout, connect=5)
+    withdraw_timeout = aiohttp.ClientTimeout(total=settings.crypto_processing_withdraw_timeout, connect=5)
 
-    def __init__(self):
+    def __init__(
+        self,
+        connection_limit: int = settings.crypto_processing_connection_limit,
+        max_retries: int = settings.crypto_processing_max_retries,
+        retry_backoff: float = settings.crypto_processing_retry_backoff,
+    ):
+        self._connection_limit = connection_limit
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
         self.session: aiohttp.ClientSession | None = None
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(timeout=self.timeout)
+        await self.open()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def open(self) -> None:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=aiohttp.TCPConnector(limit=self._connection_limit, keepalive_timeout=60),
+            )
+
+    async def close(self) -> None:
         if self.session and not self.session.closed:
             await self.session.close()
+        self.session = None
 
-    def _headers(self) -> dict[str, str]:
-        return {
+    def _headers(self, idempotency_key: str | None = None) -> dict[str, str]:
+        headers = {
             "apikey": self.api_key,
             "Content-Type": "application/json"
         }
+        if idempotency_key is not None:
+            headers["Idempotency-Key"] = idempotency_key
+        return headers
 
-    async def _request(self, method: str, path: str, json: dict | None = None) -> dict:
-        if not self.session:
-            raise RuntimeError("Client session is not initialized. Use 'async with CryptoProcessingClient() as client'.")
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: dict | None = None,
+        idempotent: bool = False,
+        timeout: aiohttp.ClientTimeout | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict:
+        await self.open()
+        retries = self._max_retries if idempotent else 0
+        attempt = 0
+        while True:
+            try:
+                return await self._send(method, path, json, timeout, idempotency_key)
+            except CryptoProcessingError as e:
+                if not e.is_transient or attempt >= retries:
+                    raise
+                delay = self._retry_backoff * 2 ** attempt * random.uniform(0.5, 1.5)
+                attempt += 1
+                logger.warning("Crypto processing %s %s failed (attempt %s), retry in %.2fs: %s",
+                               method, path, attempt, delay, e.message)
+                await asyncio.sleep(delay)
 
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        json: dict | None,
+        timeout: aiohttp.ClientTimeout | None,
+        idempotency_key: str | None = None,
+    ) -> dict:
         url = f"{self.BASE_URL}{path}"
-        async with self.session.request(method, url, headers=self._headers(), json=json) as resp:
-            if resp.status < 200 or resp.status >= 300:
-                text = await resp.text()
-                raise Exception(f"Request failed [{resp.status}]: {url} — {text}")
-            return await resp.json()
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            async with self.session.request(
+                method, url, headers=self._headers(idempotency_key), json=json, timeout=timeout or self.timeout
+            ) as resp:
+                outcome = str(resp.status)
+                if resp.status < 200 or resp.status >= 300:
+                    text = await resp.text()
+                    error_cls = CryptoProcessingUnavailableError if resp.status >= 500 else CryptoProcessingRejectedError
+                    raise error_cls(f"Request failed [{resp.status}]: {path}", status_code=resp.status, response_data=text)
+                try:
+                    return await resp.json()
+                except ValueError as e:
+                    # Тело не JSON: запрос мог быть выполнен, результат неизвестен
+                    outcome = "invalid_response"
+                    raise CryptoProcessingUnavailableError(f"Invalid response [{resp.status}]: {path} — {e!r}") from e
+        except aiohttp.ClientConnectorError as e:
+            outcome = "connection_error"
+            raise CryptoProcessingConnectionError(f"Connection failed: {path} — {e!r}") from e
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            outcome = "timeout" if isinstance(e, asyncio.TimeoutError) else "connection_error"
+            raise CryptoProcessingUnavailableError(f"Request failed: {path} — {e!r}") from e
+        finally:
+            CRYPTO_PROCESSING_REQUEST_DURATION.labels(endpoint=path, outcome=outcome).observe(
+                time.perf_counter() - started
+            )
 
     async def refresh_api_key(self) -> ApiKeyRefreshResponse:
+        # Старый ключ инвалидируется, повтор небезопасен
         payload = {"oldApiKey": self.api_key}
         raw = await self._request("POST", "/account/refresh-api-key", json=payload)
         return ApiKeyRefreshResponse.model_validate(raw)
 
     async def register_client(self) -> ClientRegistrationResponse:
-        raw = await self._request("POST", "/client", json={})
+        # Повтор в худшем случае оставит неиспользованный адрес
+        raw = await self._request("POST", "/client", json={}, idempotent=True)
         return ClientRegistrationResponse.model_validate(raw)
 
     async def register_webhook(self, webhook_url: str) -> WebhookRegistrationResponse:
         payload = {"webhookAddress": webhook_url}
-        raw = await self._request("POST", "/webhook", json=payload)
+        raw = await self._request("POST", "/webhook", json=payload, idempotent=True)
         return WebhookRegistrationResponse.model_validate(raw)
 
-    async def withdraw_funds(self, address: str, amount: int) -> bool:
-        payload = {"amount": amount, "address": address}
-        try:
-            raw = await self._request("POST", "/withdrawal", json=payload)
-        except Exception:
-            return False
-        return True
+    async def withdraw_funds(self, withdrawal_id: UUID, address: str, amount: int) -> None:
+        """
+        Отправляет вывод; withdrawal_id передается как ключ идемпотентности и ссылка для сверки.
+
+        Не повторяется, чтобы не выполнить вывод дважды: дедупликация по ключу
+        на стороне крипто-процессинга не подтверждена. Повторы можно включить только после этого.
+        """
+        payload = {"amount": amount, "address": address, "externalId": str(withdrawal_id)}
+        await self._request(
+            "POST",
+            "/withdrawal",
+            json=payload,
+            timeout=self.withdraw_timeout,
+            idempotency_key=str(withdrawal_id),
+        )
@@ -0,0 +1,15 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from crypto_processing.client import CryptoProcessingClient
+
+# Общий клиент приложения: сессия открывается и закрывается в lifespan
+crypto_processing_client = CryptoProcessingClient()
+
+
+def get_crypto_processing_client() -> CryptoProcessingClient:
+    return crypto_processing_client
+
+
+CryptoProcessingClientDep = Annotated[CryptoProcessingClient, Depends(get_crypto_processing_client)]
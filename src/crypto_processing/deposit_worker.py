@@ -0,0 +1,130 @@
+import asyncio
+from logging import getLogger
+
+from api.v1.webhook.schemas import CryptocurrencyReplenishmentCreate
+from api.v1.wallet.cache import wallet_cache
+from api.v1.webhook.service import WebhookService
+from core.config import settings
+from core.logging_config import setup_logging
+from infra.postgres.pg import async_session_factory
+from infra.postgres.uow import PostgresUnitOfWork
+from infra.redis.redis_api import RedisAPI
+
+logger = getLogger(__name__)
+
+
+class DepositInboxWorker:
+    """
+    Применяет пополнения из входящей очереди вебхуков (таблица webhook_inbox) пачками.
+
+    Несколько процессов могут работать параллельно: записи забираются через SKIP LOCKED.
+    Если пачка падает целиком, ее записи повторяются по одной, чтобы одна сбойная запись
+    не задерживала остальные.
+    """
+
+    def __init__(
+        self,
+        redis: RedisAPI | None = None,
+        batch_size: int = settings.webhook_inbox_batch_size,
+        poll_interval: float = settings.webhook_inbox_poll_interval,
+        max_attempts: int = settings.webhook_inbox_max_attempts,
+        retry_delay: float = settings.webhook_inbox_retry_delay,
+    ):
+        self._redis = redis
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._stopped = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    async def run(self) -> None:
+        logger.info("Deposit inbox worker started")
+        while not self._stopped.is_set():
+            try:
+                processed = await self.process_batch()
+            except Exception:
+                logger.exception("Deposit inbox batch failed")
+                processed = 0
+            # Полная пачка — в очереди, вероятно, есть еще записи
+            if processed >= self._batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=self._poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def process_batch(self, inbox_ids: list[int] | None = None) -> int:
+        uow = PostgresUnitOfWork(session_factory=async_session_factory)
+        claimed: list[int] = []
+        try:
+            entries = await uow.webhook_inbox.claim(self._batch_size, self._max_attempts, inbox_ids)
+            claimed = [entry.inbox_id for entry in entries]
+            if not entries:
+                await uow.release()
+                return 0
+
+            deposits = {
+                entry.inbox_id: CryptocurrencyReplenishmentCreate.model_validate(entry.payload) for entry in entries
+            }
+            result = await WebhookService(uow=uow).apply_deposits(list(deposits.values()))
+            unmatched_tx_ids = {deposit.tx_id for deposit in result.unmatched}
+            postponed = [inbox_id for inbox_id, deposit in deposits.items() if deposit.tx_id in unmatched_tx_ids]
+
+            await uow.webhook_inbox.delete_many([inbox_id for inbox_id in claimed if inbox_id not in postponed])
+            await uow.webhook_inbox.postpone(postponed, "Wallet not found", self._retry_delay)
+            await uow.release()
+        except Exception as e:
+            await uow.release(commit=False)
+            if len(claimed) > 1:
+                logger.warning("Deposit batch of %s failed, retrying one by one: %s", len(claimed), e)
+                for inbox_id in claimed:
+                    await self.process_batch([inbox_id])
+                return len(claimed)
+            if claimed:
+                logger.exception("Deposit inbox entry %s failed", claimed[0])
+                await self._postpone(claimed, str(e) or e.__class__.__name__)
+                return 1
+            raise
+
+        await self._invalidate_wallets(result.telegram_ids)
+        if postponed:
+            logger.warning("Wallet not found for %s deposits, postponed", len(postponed))
+        logger.info("Applied %s deposits from inbox", len(claimed) - len(postponed))
+        return len(claimed)
+
+    async def _invalidate_wallets(self, telegram_ids: set[int]) -> None:
+        if self._redis is None:
+            return
+        try:
+            await wallet_cache.invalidate(self._redis, telegram_ids)
+        except Exception:
+            logger.exception("Wallet cache invalidation failed")
+
+    async def _postpone(self, inbox_ids: list[int], error: str) -> None:
+        uow = PostgresUnitOfWork(session_factory=async_session_factory)
+        try:
+            await uow.webhook_inbox.postpone(inbox_ids, error, self._retry_delay)
+            await uow.release()
+        except Exception:
+            await uow.release(commit=False)
+            raise
+
+
+async def _run() -> None:
+    redis = RedisAPI()
+    try:
+        await DepositInboxWorker(redis).run()
+    finally:
+        await redis.close()
+
+
+def main() -> None:
+    setup_logging(log_to_file=not settings.DEBUG)
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
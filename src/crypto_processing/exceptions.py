@@ -0,0 +1,24 @@
+class CryptoProcessingError(Exception):
+    """Ошибка при обращении к сервису крипто-процессинга"""
+
+    def __init__(self, message: str, status_code: int | None = None, response_data: str | None = None):
+        self.message = message
+        self.status_code = status_code
+        self.response_data = response_data
+        super().__init__(self.message)
+
+    @property
+    def is_transient(self) -> bool:
+        return self.status_code is None or self.status_code == 429 or self.status_code >= 500
+
+
+class CryptoProcessingRejectedError(CryptoProcessingError):
+    """Запрос отклонен крипто-процессингом (4xx): повтор не поможет"""
+
+
+class CryptoProcessingUnavailableError(CryptoProcessingError):
+    """Сервис недоступен: таймаут, ошибка соединения или 5xx; результат запроса неизвестен"""
+
+
+class CryptoProcessingConnectionError(CryptoProcessingUnavailableError):
+    """Не удалось установить соединение: запрос точно не был отправлен"""
@@ -0,0 +1,7 @@
+from prometheus_client import Histogram
+
+CRYPTO_PROCESSING_REQUEST_DURATION = Histogram(
+    "crypto_processing_request_duration_seconds",
+    "Длительность запросов к крипто-процессингу",
+    ["endpoint", "outcome"],
+)
@@ -1,15 +1,39 @@
-import re
-from typing import Iterator, Callable
-from decimal import Decimal
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator
 
+from core.config import settings
+from core.money import Money
+from crypto_processing.checksum import base58check_payload, eip55_is_valid, ton_friendly_payload
 
-@dataclass
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+@dataclass(frozen=True)
+class NetworkSpec:
+    """Формат адресов сети: допустимые (префикс, длина) и комиссия вывода по умолчанию"""
+    shapes: tuple[tuple[str, int], ...]
+    fee: Money  # микро-единицы USDT
+
+
+# Сети с одинаковым форматом адреса (ERC20/BEP20) различаются только порядком в settings.crypto_networks:
+# адрес относится к первой включенной сети
+NETWORK_SPECS: dict[str, NetworkSpec] = {
+    "TRC20": NetworkSpec(shapes=(("T", 34),), fee=2_750_000),
+    "ERC20": NetworkSpec(shapes=(("0x", 42),), fee=5_000_000),
+    "BEP20": NetworkSpec(shapes=(("0x", 42),), fee=500_000),
+    "TON": NetworkSpec(shapes=(("EQ", 48), ("UQ", 48), ("0:", 66)), fee=500_000),
+}
+
+
+@dataclass(frozen=True)
 class NetworkConfig:
     """Конфигурация сети с валидатором и комиссией"""
     name: str
     validator: Callable[[str], bool]
-    fee: Decimal
+    fee: Money  # микро-единицы USDT
+    shapes: tuple[tuple[str, int], ...] = ()
 
     def __post_init__(self):
         if self.fee < 0:
@@ -17,16 +41,36 @@ class NetworkConfig:
 
 
 class WalletAddressMatcher:
+    """
+    Определяет сеть адреса за один поиск.
+
+    Кандидаты выбираются по префиксу и длине адреса из словаря, поэтому проверяется
+    только валидатор подходящей по формату сети, а не все сети по очереди.
+    Результаты кэшируются: одни и те же адреса приходят в каждом вебхуке и запросе кошелька.
+    """
     _validators: dict[str, Callable[[str], bool]] = {}
 
-    def __init__(self):
-        self._networks: list[NetworkConfig] = [
-            NetworkConfig(
-                name="TRC20",
-                validator=self._validators.get("TRC20", lambda x: False),
-                fee=Decimal("2.75")
-            ),
-        ]
+    def __init__(self, networks: Iterable[str] = settings.crypto_networks, cache_size: int = 4096):
+        self._networks: list[NetworkConfig] = []
+        for name in networks:
+            spec = NETWORK_SPECS.get(name)
+            if spec is None:
+                raise ValueError(f"Неизвестная сеть: {name}")
+            self._networks.append(
+                NetworkConfig(
+                    name=name,
+                    validator=self._validators.get(name, lambda x: False),
+                    fee=spec.fee,
+                    shapes=spec.shapes,
+                )
+            )
+
+        self._dispatch: dict[tuple[str, int], list[NetworkConfig]] = defaultdict(list)
+        for config in self._networks:
+            for prefix, length in config.shapes:
+                self._dispatch[(prefix, length)].append(config)
+        self._prefix_lengths = sorted({len(prefix) for prefix, _ in self._dispatch})
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
 
     @classmethod
     def validator(cls, network_name: str):
@@ -36,31 +80,60 @@ class WalletAddressMatcher:
             return func
         return decorator
 
+    def _resolve(self, address: str) -> NetworkConfig | None:
+        length = len(address)
+        for prefix_length in self._prefix_lengths:
+            for config in self._dispatch.get((address[:prefix_length], length), ()):
+                if config.validator(address):
+                    return config
+        return None
+
     def iter_matched(self, addresses: list[str]) -> Iterator[tuple[str, str]]:
         """Итератор по всем совпавшим адресам с их сетями"""
         for address in addresses:
-            if (network := self.match(address)) is not None:
-                yield network, address
+            if (config := self.resolve(address)) is not None:
+                yield config.name, address
 
     def match(self, address: str) -> str | None:
         """Определяет сеть для данного адреса"""
-        for config in self._networks:
-            if config.validator(address):
-                return config.name
-        return None
+        config = self.resolve(address)
+        return config.name if config is not None else None
 
-    def get_network_fee(self, address: str) -> Decimal | None:
-        """Определяет сеть для адреса и возвращает комиссию в Decimal"""
-        for config in self._networks:
-            if config.validator(address):
-                return config.fee
-        return None
+    def get_network_fee(self, address: str) -> Money | None:
+        """Определяет сеть для адреса и возвращает комиссию в микро-единицах"""
+        config = self.resolve(address)
+        return config.fee if config is not None else None
 
 
 @WalletAddressMatcher.validator("TRC20")
 def validate_trc20(address: str) -> bool:
-    """Валидация адреса TRC20 (TRON)"""
-    return bool(re.fullmatch(r"T[1-9A-HJ-NP-Za-km-z]{33}", address))
+    """Адрес TRON: Base58Check, 21 байт с префиксом 0x41"""
+    payload = base58check_payload(address)
+    return payload is not None and len(payload) == 21 and payload[0] == 0x41
+
+
+def _validate_evm(address: str) -> bool:
+    """Адрес EVM-сетей: 0x + 40 hex-символов, контрольная сумма EIP-55 в смешанном регистре"""
+    if len(address) != 42 or not address.startswith("0x"):
+        return False
+    hex_address = address[2:]
+    return _HEX_DIGITS.issuperset(hex_address) and eip55_is_valid(hex_address)
+
+
+WalletAddressMatcher.validator("ERC20")(_validate_evm)
+WalletAddressMatcher.validator("BEP20")(_validate_evm)
+
+
+@WalletAddressMatcher.validator("TON")
+def validate_ton(address: str) -> bool:
+    """Адрес TON: raw (0:<hex>) или user-friendly с CRC16 в основной сети (workchain 0)"""
+    if address.startswith("0:"):
+        return len(address) == 66 and _HEX_DIGITS.issuperset(address[2:])
+    if len(address) != 48:
+        return False
+    payload = ton_friendly_payload(address)
+    # Флаги 0x11 (bounceable) и 0x51 (non-bounceable) без бита testnet, workchain 0
+    return payload is not None and payload[0] in (0x11, 0x51) and payload[1] == 0x00
 
 
 matcher = WalletAddressMatcher()
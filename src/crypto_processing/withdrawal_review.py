@@ -0,0 +1,73 @@
+import argparse
+import asyncio
+from uuid import UUID
+
+from api.v1.wallet.service import WalletService
+from core.config import settings
+from core.money import format_micros
+from core.logging_config import setup_logging
+from infra.postgres.models import WithdrawalStatus
+from infra.postgres.pg import async_session_factory, engine
+from infra.postgres.uow import PostgresUnitOfWork
+from infra.redis.redis_api import RedisAPI
+
+
+async def _list(limit: int) -> None:
+    uow = PostgresUnitOfWork(session_factory=async_session_factory)
+    try:
+        for withdrawal in await uow.withdrawal.get_unknown(limit):
+            print(
+                f"{withdrawal.withdrawal_id} {withdrawal.updated_at:%Y-%m-%d %H:%M:%S} "
+                f"{format_micros(withdrawal.amount)} {withdrawal.address} {withdrawal.last_error or ''}"
+            )
+    finally:
+        await uow.release(commit=False)
+
+
+async def _resolve(withdrawal_id: UUID, status: WithdrawalStatus) -> None:
+    uow = PostgresUnitOfWork(session_factory=async_session_factory)
+    redis = RedisAPI()
+    try:
+        resolved = await WalletService(uow=uow, redis=redis).resolve_withdrawal(withdrawal_id, status)
+    except Exception:
+        await uow.release(commit=False)
+        raise
+    finally:
+        await redis.close()
+    print(f"Withdrawal {withdrawal_id} {'resolved as ' + status.name if resolved else 'is not in UNKNOWN'}")
+
+
+async def _run(args: argparse.Namespace) -> None:
+    try:
+        if args.command == "list":
+            await _list(args.limit)
+        else:
+            await _resolve(args.withdrawal_id, WithdrawalStatus[args.status.upper()])
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Ручная сверка выводов с неизвестным результатом (UNKNOWN) по данным крипто-процессинга."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="Показать заявки в UNKNOWN.")
+    list_parser.add_argument("--limit", type=int, default=100, help="Сколько заявок показать.")
+
+    resolve_parser = commands.add_parser("resolve", help="Зафиксировать результат заявки.")
+    resolve_parser.add_argument("withdrawal_id", type=UUID, help="Идентификатор заявки (externalId в крипто-процессинге).")
+    resolve_parser.add_argument(
+        "status",
+        choices=["submitted", "rejected"],
+        help="submitted — вывод выполнен, rejected — не выполнен, средства возвращаются.",
+    )
+    args = parser.parse_args(argv)
+
+    setup_logging(log_to_file=not settings.DEBUG)
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import asyncio
+from logging import getLogger
+from uuid import UUID
+
+from api.v1.wallet.service import WalletService
+from core.config import settings
+from core.logging_config import setup_logging
+from crypto_processing.client import CryptoProcessingClient
+from crypto_processing.exceptions import (
+    CryptoProcessingConnectionError,
+    CryptoProcessingRejectedError,
+    CryptoProcessingUnavailableError,
+)
+from infra.postgres.models import Withdrawal, WithdrawalStatus
+from infra.postgres.pg import async_session_factory
+from infra.postgres.uow import PostgresUnitOfWork
+from infra.redis.redis_api import RedisAPI
+
+logger = getLogger(__name__)
+
+
+class WithdrawalWorker:
+    """
+    Отправляет заявки на вывод (таблица withdrawal) в крипто-процессинг вне транзакции с блокировкой кошелька.
+
+    Заявка сначала фиксируется как SUBMITTING, затем отправляется, и результат записывается
+    отдельной короткой транзакцией. Заявки, оставшиеся в SUBMITTING после падения процесса,
+    периодически переводятся в UNKNOWN. Повторно они не отправляются: результат заявок в UNKNOWN
+    сверяется вручную (crypto_processing.withdrawal_review).
+    """
+
+    def __init__(
+        self,
+        client: CryptoProcessingClient,
+        redis: RedisAPI | None = None,
+        batch_size: int = settings.withdrawal_worker_batch_size,
+        concurrency: int = settings.withdrawal_worker_concurrency,
+        poll_interval: float = settings.withdrawal_worker_poll_interval,
+        max_attempts: int = settings.withdrawal_max_attempts,
+        retry_delay: float = settings.withdrawal_retry_delay,
+        reconcile_interval: float = settings.withdrawal_reconcile_interval,
+        reconcile_after: float = settings.withdrawal_reconcile_after,
+    ):
+        self._client = client
+        self._redis = redis
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._reconcile_interval = reconcile_interval
+        self._reconcile_after = reconcile_after
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._stopped = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    async def run(self) -> None:
+        logger.info("Withdrawal worker started")
+        loop = asyncio.get_running_loop()
+        reconciled_at = 0.0
+        while not self._stopped.is_set():
+            if loop.time() - reconciled_at >= self._reconcile_interval:
+                reconciled_at = loop.time()
+                try:
+                    await self.expire_stale()
+                except Exception:
+                    logger.exception("Stale withdrawals check failed")
+            try:
+                processed = await self.process_batch()
+            except Exception:
+                logger.exception("Withdrawal batch failed")
+                processed = 0
+            if processed >= self._batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=self._poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def process_batch(self) -> int:
+        uow = PostgresUnitOfWork(session_factory=async_session_factory)
+        try:
+            withdrawals = await WalletService(uow=uow).claim_withdrawals(self._batch_size)
+        except Exception:
+            await uow.release(commit=False)
+            raise
+
+        await asyncio.gather(*(self._submit(withdrawal) for withdrawal in withdrawals))
+        return len(withdrawals)
+
+    async def expire_stale(self) -> int:
+        uow = PostgresUnitOfWork(session_factory=async_session_factory)
+        try:
+            return await WalletService(uow=uow).expire_stale_withdrawals(self._batch_size, self._reconcile_after)
+        except Exception:
+            await uow.release(commit=False)
+            raise
+
+    async def _submit(self, withdrawal: Withdrawal) -> None:
+        error = None
+        async with self._semaphore:
+            try:
+                await self._client.withdraw_funds(withdrawal.withdrawal_id, withdrawal.address, withdrawal.amount)
+                status = WithdrawalStatus.SUBMITTED
+            except CryptoProcessingConnectionError as e:
+                # Запрос не ушел — отправку можно безопасно повторить
+                status, error = WithdrawalStatus.QUEUED, e.message
+            except CryptoProcessingRejectedError as e:
+                status, error = WithdrawalStatus.REJECTED, e.message
+            except CryptoProcessingUnavailableError as e:
+                status, error = WithdrawalStatus.UNKNOWN, e.message
+            except Exception as e:
+                logger.exception("Withdrawal %s submit failed", withdrawal.withdrawal_id)
+                status, error = WithdrawalStatus.UNKNOWN, repr(e)
+
+        try:
+            await self._complete(withdrawal.withdrawal_id, status, error)
+        except Exception:
+            logger.exception("Failed to record withdrawal %s result %s", withdrawal.withdrawal_id, status.name)
+
+    async def _complete(self, withdrawal_id: UUID, status: WithdrawalStatus, error: str | None) -> None:
+        uow = PostgresUnitOfWork(session_factory=async_session_factory)
+        try:
+            await WalletService(uow=uow, redis=self._redis).complete_withdrawal(
+                withdrawal_id, status, error, self._retry_delay, self._max_attempts
+            )
+        except Exception:
+            await uow.release(commit=False)
+            raise
+
+
+async def _run() -> None:
+    redis = RedisAPI()
+    try:
+        async with CryptoProcessingClient() as client:
+            await WithdrawalWorker(client, redis).run()
+    finally:
+        await redis.close()
+
+
+def main() -> None:
+    setup_logging(log_to_file=not settings.DEBUG)
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+from enum import Enum
+from itertools import islice
+from typing import Any, Callable, Iterable, Mapping
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.types import TypeDecorator
+
+from infra.postgres.models.base import Base
+
+DEFAULT_BATCH_SIZE = 10_000
+
+
+def _to_db_value(value: Any) -> Any:
+    # Enum-колонки (native_enum=False) хранят имя члена перечисления, как и ORM
+    if isinstance(value, Enum):
+        return value.name
+    return value
+
+
+def _converter(column_type: Any, dialect: Any) -> Callable[[Any], Any]:
+    # TypeDecorator-колонки (например, MicroAmount) преобразуют значение так же, как при INSERT через ORM
+    if isinstance(column_type, TypeDecorator):
+        return lambda value: _to_db_value(column_type.process_bind_param(value, dialect))
+    return _to_db_value
+
+
+async def copy_rows(
+    db: AsyncSession | AsyncConnection,
+    model: type[Base],
+    rows: Iterable[Mapping[str, Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Загружает строки в таблицу модели через COPY (asyncpg copy_records_to_table).
+
+    Набор колонок берется из первой строки; остальные колонки получают значения по умолчанию из БД.
+    ORM-события и flush не выполняются, строки не попадают в identity map сессии.
+    """
+    connection = db if isinstance(db, AsyncConnection) else await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+
+    table = model.__table__
+    rows = iter(rows)
+    columns: list[str] | None = None
+    converters: list[Callable[[Any], Any]] = []
+    copied = 0
+    while batch := list(islice(rows, batch_size)):
+        if columns is None:
+            columns = list(batch[0])
+            unknown = set(columns) - set(table.columns.keys())
+            if unknown:
+                raise ValueError(f"Unknown columns for {table.name}: {sorted(unknown)}")
+            converters = [_converter(table.columns[column].type, connection.dialect) for column in columns]
+
+        await driver_connection.copy_records_to_table(
+            table.name,
+            records=[
+                tuple(convert(row[column]) for convert, column in zip(converters, columns)) for row in batch
+            ],
+            columns=columns,
+            schema_name=table.schema,
+        )
+        copied += len(batch)
+    return copied
@@ -0,0 +1,138 @@
+import argparse
+import asyncio
+from logging import getLogger
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from core.config import settings
+from core.logging_config import setup_logging
+from infra.postgres.pg import engine
+
+logger = getLogger(__name__)
+
+# Ключ advisory lock: снимки обновляет только один процесс
+SNAPSHOT_LOCK_KEY = 0x1ED6E5
+
+_OLD_TRANSACTIONS = text(
+    "SELECT count(*) FROM pg_stat_activity "
+    "WHERE backend_xid IS NOT NULL AND pid <> pg_backend_pid() "
+    "AND xact_start < clock_timestamp() - make_interval(secs => :lag)"
+)
+_LOW_WATERMARK = text("SELECT coalesce(max(last_posting_id), 0) FROM wallet_balance_snapshot")
+_HIGH_WATERMARK = text(
+    "SELECT posting_id FROM ledger_posting "
+    "WHERE created_at < clock_timestamp() - make_interval(secs => :lag) "
+    "ORDER BY posting_id DESC LIMIT 1"
+)
+_BATCH_BOUND = text(
+    "SELECT posting_id FROM ledger_posting "
+    "WHERE wallet_id IS NOT NULL AND posting_id > :low "
+    "ORDER BY posting_id OFFSET :offset LIMIT 1"
+)
+_UPSERT_SNAPSHOTS = text(
+    "INSERT INTO wallet_balance_snapshot (wallet_id, last_posting_id, balance, updated_at) "
+    "SELECT wallet_id, CAST(:high AS bigint), sum(amount), now() FROM ledger_posting "
+    "WHERE wallet_id IS NOT NULL AND posting_id > :low AND posting_id <= :high "
+    "GROUP BY wallet_id "
+    "ON CONFLICT (wallet_id) DO UPDATE SET "
+    "balance = wallet_balance_snapshot.balance + EXCLUDED.balance, "
+    "last_posting_id = EXCLUDED.last_posting_id, "
+    "updated_at = EXCLUDED.updated_at"
+)
+_UNBALANCED_TRANSACTIONS = text(
+    "SELECT transaction_id FROM ledger_posting WHERE transaction_id IN ("
+    "SELECT transaction_id FROM ledger_posting WHERE posting_id > :low AND posting_id <= :high"
+    ") GROUP BY transaction_id HAVING sum(amount) <> 0 LIMIT 10"
+)
+_NEGATIVE_SNAPSHOTS = text(
+    "SELECT wallet_id FROM wallet_balance_snapshot "
+    "WHERE last_posting_id = CAST(:high AS bigint) AND balance < 0 LIMIT 10"
+)
+
+
+class LedgerImbalanceError(Exception):
+    """Проводки переносимого диапазона не сходятся"""
+
+
+async def compact_snapshots(
+    conn: AsyncConnection,
+    lag: float = settings.postgres_ledger_snapshot_lag,
+    batch_size: int = settings.postgres_ledger_snapshot_batch_size,
+) -> int:
+    """
+    Переносит проводки старше lag секунд в снимки балансов кошельков.
+
+    Обрабатывается диапазон posting_id после последнего снимка, не больше batch_size проводок кошельков.
+    posting_id выдается при вставке, поэтому проводка старше lag с меньшим номером
+    не может появиться позже, если транзакции короче lag.
+    Проход пропускается, пока открыта транзакция с выданным xid старше lag:
+    ее проводки могут получить номер меньше high и быть потеряны снимком.
+    Если транзакции диапазона не сходятся в ноль или снимок уходит в минус,
+    поднимается LedgerImbalanceError и снимки не обновляются.
+    Возвращает количество обновленных снимков.
+    """
+    locked = await conn.scalar(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": SNAPSHOT_LOCK_KEY})
+    if not locked:
+        logger.info("Ledger snapshots are being compacted by another process")
+        return 0
+
+    old_transactions = await conn.scalar(_OLD_TRANSACTIONS, {"lag": lag})
+    if old_transactions:
+        logger.warning("Ledger compaction skipped: %s transactions are older than %s seconds", old_transactions, lag)
+        return 0
+
+    low = await conn.scalar(_LOW_WATERMARK)
+    high = await conn.scalar(_HIGH_WATERMARK, {"lag": lag})
+    if high is None or high <= low:
+        return 0
+    bound = await conn.scalar(_BATCH_BOUND, {"low": low, "offset": batch_size - 1})
+    if bound is not None:
+        high = min(high, bound)
+
+    unbalanced = (await conn.execute(_UNBALANCED_TRANSACTIONS, {"low": low, "high": high})).scalars().all()
+    if unbalanced:
+        raise LedgerImbalanceError(f"Unbalanced ledger transactions in ({low}, {high}]: {unbalanced}")
+
+    result = await conn.execute(_UPSERT_SNAPSHOTS, {"low": low, "high": high})
+    negative = (await conn.execute(_NEGATIVE_SNAPSHOTS, {"high": high})).scalars().all()
+    if negative:
+        raise LedgerImbalanceError(f"Negative wallet balances after compacting ({low}, {high}]: {negative}")
+    logger.info("Ledger postings (%s, %s] compacted into %s snapshots", low, high, result.rowcount)
+    return result.rowcount
+
+
+async def _run(interval: float, once: bool) -> None:
+    try:
+        while True:
+            try:
+                async with engine.begin() as conn:
+                    await compact_snapshots(conn)
+            except Exception:
+                if once:
+                    raise
+                logger.exception("Ledger snapshot compaction failed")
+            if once:
+                return
+            await asyncio.sleep(interval)
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Перенос проводок журнала в снимки балансов кошельков.")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=settings.postgres_ledger_snapshot_interval,
+        help="Интервал между проходами в секундах.",
+    )
+    parser.add_argument("--once", action="store_true", help="Выполнить один проход и завершиться.")
+    args = parser.parse_args(argv)
+
+    setup_logging(log_to_file=not settings.DEBUG)
+    asyncio.run(_run(args.interval, args.once))
+
+
+if __name__ == "__main__":
+    main()
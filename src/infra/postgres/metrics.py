@@ -0,0 +1,23 @@
+from prometheus_client import Gauge
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Количество соединений, выданных из пула",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+
+def instrument_pool(engine: AsyncEngine, name: str) -> None:
+    """Отслеживает занятость пула соединений"""
+    gauge = DB_POOL_CHECKED_OUT.labels(pool=name)
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _on_checkout(*_args) -> None:
+        gauge.inc()
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def _on_checkin(*_args) -> None:
+        gauge.dec()
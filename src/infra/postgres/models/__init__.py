@@ -1,9 +1,14 @@
 from infra.postgres.models.user import User
 from infra.postgres.models.referral import Referral, ReferralType
 from infra.postgres.models.wallet import Wallet, WalletStatus, WalletCurrency
+from infra.postgres.models.wallet_address import WalletAddress
 from infra.postgres.models.operation import Operation, OperationStatus, OperationType
 from infra.postgres.models.cryptocurrency_replenishment import CryptocurrencyReplenishment
 from infra.postgres.models.sbp_payment import SbpPayment, SbpPaymentStatus
+from infra.postgres.models.deposit_address import DepositAddress
+from infra.postgres.models.webhook_inbox import WebhookInbox
+from infra.postgres.models.withdrawal import Withdrawal, WithdrawalStatus
+from infra.postgres.models.ledger import LedgerAccount, LedgerPosting, WalletBalanceSnapshot
 from infra.postgres.models.referral_operation import ReferralOperation, ReferralOperationStatus, ReferralOperationType
 
 
@@ -17,10 +22,18 @@ __all__ = [
     "Wallet",
     "WalletStatus",
     "WalletCurrency",
+    "WalletAddress",
     "Operation",
     "OperationType",
     "OperationStatus",
     "CryptocurrencyReplenishment",
     "SbpPayment",
     "SbpPaymentStatus",
+    "DepositAddress",
+    "WebhookInbox",
+    "Withdrawal",
+    "WithdrawalStatus",
+    "LedgerAccount",
+    "LedgerPosting",
+    "WalletBalanceSnapshot",
 ]
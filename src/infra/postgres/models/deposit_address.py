@@ -0,0 +1,13 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.sqltypes import String
+
+from infra.postgres.models.base import Base
+from infra.postgres.mixins import CreateTimestampMixin
+
+
+class DepositAddress(Base, CreateTimestampMixin):
+    """Заранее зарегистрированный в крипто-процессинге адрес, еще не выданный пользователю"""
+    __tablename__ = "deposit_address_pool"
+
+    address: Mapped[str] = mapped_column(String, primary_key=True)
+    network: Mapped[str] = mapped_column(String, nullable=False, default="TRC20", server_default="TRC20")
@@ -0,0 +1,95 @@
+from datetime import datetime
+from enum import Enum as PyEnum
+from uuid import UUID
+
+from sqlalchemy import BigInteger, CheckConstraint, ForeignKey, Identity, Index, cast, func, select, text
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, column_property, mapped_column
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.sqltypes import Enum
+
+from core.money import Money
+from infra.postgres.models.base import Base
+from infra.postgres.models.wallet import Wallet
+
+
+class LedgerAccount(str, PyEnum):
+    WALLET = "wallet"                # кошелек пользователя (wallet_id обязателен)
+    DEPOSITS = "deposits"            # поступления из блокчейна
+    WITHDRAWALS = "withdrawals"      # выводы в блокчейн
+    SBP_PAYOUTS = "sbp_payouts"      # оплаты по СБП
+    NETWORK_FEES = "network_fees"    # комиссии сети
+    PAYMENT_FEES = "payment_fees"    # комиссии банка за оплату по СБП
+
+
+class LedgerPosting(Base):
+    """
+    Неизменяемая проводка журнала: суммы проводок одной транзакции (transaction_id) в сумме дают 0.
+
+    Баланс кошелька — последний снимок (WalletBalanceSnapshot) плюс проводки после него.
+    """
+    __tablename__ = "ledger_posting"
+
+    posting_id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    transaction_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False, index=True)
+    account: Mapped[LedgerAccount] = mapped_column(
+        Enum(LedgerAccount, name="ledger_account_enum", native_enum=False),
+        nullable=False,
+    )
+    wallet_id: Mapped[UUID | None] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("wallet.wallet_id", onupdate="CASCADE", ondelete="NO ACTION"),
+        nullable=True,
+    )
+    amount: Mapped[Money] = mapped_column(BigInteger, nullable=False)
+    # Время вставки, а не начала транзакции: по нему компактизация отсекает еще не закоммиченные проводки
+    created_at: Mapped[datetime] = mapped_column(server_default=func.clock_timestamp(), nullable=False)
+
+    __table_args__ = (
+        CheckConstraint("(account = 'WALLET') = (wallet_id IS NOT NULL)", name="ck_ledger_posting_wallet_account"),
+        Index(
+            "ix_ledger_posting_wallet_id_posting_id",
+            "wallet_id",
+            "posting_id",
+            postgresql_where=text("wallet_id IS NOT NULL"),
+        ),
+    )
+
+
+class WalletBalanceSnapshot(Base):
+    """Баланс кошелька по проводкам с posting_id <= last_posting_id"""
+    __tablename__ = "wallet_balance_snapshot"
+
+    wallet_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("wallet.wallet_id", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    last_posting_id: Mapped[int] = mapped_column(BigInteger, nullable=False, index=True)
+    balance: Mapped[Money] = mapped_column(BigInteger, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
+def wallet_balance(wallet_id: ColumnElement[UUID]) -> ColumnElement[Money]:
+    """Выражение баланса кошелька: снимок плюс сумма проводок после него"""
+    snapshot = (
+        select(WalletBalanceSnapshot)
+        .where(WalletBalanceSnapshot.wallet_id == wallet_id)
+        .correlate_except(WalletBalanceSnapshot)
+    )
+    snapshot_balance = snapshot.with_only_columns(WalletBalanceSnapshot.balance).scalar_subquery()
+    snapshot_posting_id = snapshot.with_only_columns(WalletBalanceSnapshot.last_posting_id).scalar_subquery()
+    recent = (
+        select(func.sum(LedgerPosting.amount))
+        .where(
+            LedgerPosting.wallet_id == wallet_id,
+            LedgerPosting.posting_id > func.coalesce(snapshot_posting_id, 0),
+        )
+        .correlate_except(LedgerPosting)
+        .scalar_subquery()
+    )
+    return cast(func.coalesce(snapshot_balance, 0) + func.coalesce(recent, 0), BigInteger)
+
+
+# Баланс кошелька вычисляется из журнала и загружается вместе с кошельком (только для чтения)
+Wallet.balance = column_property(wallet_balance(Wallet.wallet_id))
@@ -1,15 +1,16 @@
 from uuid import UUID
-from decimal import Decimal
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 from enum import Enum as PyEnum
 
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey, DECIMAL, text
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column, relationship
+from sqlalchemy import ForeignKey, Index, PrimaryKeyConstraint, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.sql.sqltypes import Enum
 
+from core.money import Money
 from infra.postgres.models.base import Base
 from infra.postgres.mixins import CreateTimestampMixin
+from infra.postgres.types import MicroAmount
 
 if TYPE_CHECKING:
     from infra.postgres.models.wallet import Wallet # noqa: F401
@@ -33,7 +34,6 @@ class Operation(Base, CreateTimestampMixin):
 
     operation_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
-        primary_key=True,
         server_default=text("gen_random_uuid()"),
         index=True
     )
@@ -51,12 +51,37 @@ class Operation(Base, CreateTimestampMixin):
         Enum(OperationType, name="operation_type_enum", native_enum=False),
         nullable=False,
     )
-    amount: Mapped[Decimal] = mapped_column(DECIMAL(precision=20, scale=6), nullable=False)
-    fee: Mapped[Decimal] = mapped_column(DECIMAL(precision=20, scale=6), nullable=False)
-    total_amount: Mapped[Decimal] = mapped_column(DECIMAL(precision=20, scale=6), nullable=False)
+    amount: Mapped[Money] = mapped_column(MicroAmount, nullable=False)
+    fee: Mapped[Money] = mapped_column(MicroAmount, nullable=False)
+    total_amount: Mapped[Money] = mapped_column(MicroAmount, nullable=False)
 
     wallet: Mapped["Wallet"] = relationship("Wallet", back_populates="operations")
     crypto_replenishment: Mapped[Optional["CryptocurrencyReplenishment"]] = relationship(
-        "CryptocurrencyReplenishment", back_populates="operation", uselist=False
+        "CryptocurrencyReplenishment",
+        primaryjoin="Operation.operation_id == foreign(CryptocurrencyReplenishment.operation_id)",
+        back_populates="operation",
+        uselist=False,
     )
-    sbp_payments: Mapped[list["SbpPayment"]] = relationship("SbpPayment", back_populates="operation")
+    sbp_payments: Mapped[list["SbpPayment"]] = relationship(
+        "SbpPayment",
+        primaryjoin="Operation.operation_id == foreign(SbpPayment.operation_id)",
+        back_populates="operation",
+    )
+
+    # Таблица секционирована по месяцам created_at (секции создает infra.postgres.partitions),
+    # поэтому первичный ключ в БД составной; для ORM идентичность — operation_id
+    __table_args__ = (
+        PrimaryKeyConstraint("operation_id", "created_at"),
+        Index(
+            "ix_operation_wallet_id_created_at_operation_id",
+            "wallet_id",
+            text("created_at DESC"),
+            text("operation_id DESC"),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    @classmethod
+    @declared_attr
+    def __mapper_args__(cls) -> dict[str, Any]:
+        return {"eager_defaults": True, "primary_key": [cls.__table__.c.operation_id]}
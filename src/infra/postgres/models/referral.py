@@ -10,6 +10,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.sqltypes import Integer, Enum
 
+from core.money import Money
 from infra.postgres.models.base import Base
 
 if TYPE_CHECKING:
@@ -43,7 +44,7 @@ class Referral(Base):
         nullable=True,
     )
     referral_count: Mapped[int] = mapped_column(Integer, server_default="0")
-    balance: Mapped[int] = mapped_column(Integer, server_default="0")
+    balance: Mapped[Money] = mapped_column(BigInteger, server_default="0")
 
 
     user: Mapped["User"] = relationship(
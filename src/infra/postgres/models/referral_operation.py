@@ -1,18 +1,21 @@
-from decimal import Decimal
 from enum import Enum as PyEnum
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy import (
     BigInteger,
     ForeignKey,
+    PrimaryKeyConstraint,
     text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
-from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.sql.sqltypes import Enum, DECIMAL
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
+from sqlalchemy.sql.sqltypes import Enum
 
+from core.money import Money
 from infra.postgres.mixins import CreateUpdateTimestampMixin
 from infra.postgres.models.base import Base
+from infra.postgres.types import MicroAmount
 
 
 class ReferralOperationType(PyEnum):
@@ -31,7 +34,6 @@ class ReferralOperation(Base, CreateUpdateTimestampMixin):
 
     referral_operation_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
-        primary_key=True,
         server_default=text("gen_random_uuid()"),
         index=True
     )
@@ -54,4 +56,15 @@ class ReferralOperation(Base, CreateUpdateTimestampMixin):
         Enum(ReferralOperationType, name="referral_operation_type_enum", native_enum=False),
         nullable=False,
     )
-    amount: Mapped[Decimal] = mapped_column(DECIMAL(precision=20, scale=6), nullable=False)
+    amount: Mapped[Money] = mapped_column(MicroAmount, nullable=False)
+
+    # Секционирование по месяцам created_at, как у operation
+    __table_args__ = (
+        PrimaryKeyConstraint("referral_operation_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    @classmethod
+    @declared_attr
+    def __mapper_args__(cls) -> dict[str, Any]:
+        return {"eager_defaults": True, "primary_key": [cls.__table__.c.referral_operation_id]}
@@ -4,12 +4,14 @@ from decimal import Decimal
 from enum import Enum as PyEnum
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey, DECIMAL, text, Integer, Text
+from sqlalchemy import DECIMAL, text, Integer, Text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.sql.sqltypes import Enum
 
+from core.money import Money
 from infra.postgres.models.base import Base
 from infra.postgres.mixins import CreateTimestampMixin
+from infra.postgres.types import MicroAmount
 
 if TYPE_CHECKING:
     from infra.postgres.models.operation import Operation # noqa: F401
@@ -32,16 +34,15 @@ class SbpPayment(Base, CreateTimestampMixin):
     )
     operation_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
-        ForeignKey("operation.operation_id", onupdate="CASCADE", ondelete="NO ACTION"),
         nullable=False,
         index=True,
     )
     rub_amount: Mapped[int] = mapped_column(Integer, nullable=False)
     fee_rub: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     total_amount_rub: Mapped[int] = mapped_column(Integer, nullable=False)
-    crypto_amount: Mapped[Decimal] = mapped_column(DECIMAL(precision=20, scale=6), nullable=False)
-    fee_crypto: Mapped[Decimal] = mapped_column(DECIMAL(precision=20, scale=6), nullable=False, server_default="0")
-    total_amount_crypto: Mapped[Decimal] = mapped_column(DECIMAL(precision=20, scale=6), nullable=False)
+    crypto_amount: Mapped[Money] = mapped_column(MicroAmount, nullable=False)
+    fee_crypto: Mapped[Money] = mapped_column(MicroAmount, nullable=False, server_default="0")
+    total_amount_crypto: Mapped[Money] = mapped_column(MicroAmount, nullable=False)
     exchange: Mapped[Decimal] = mapped_column(DECIMAL(precision=20, scale=6), nullable=False)
     sbp_url: Mapped[str] = mapped_column(Text, nullable=False)
     outgoing_payment_id: Mapped[str] = mapped_column(Text, nullable=False)
@@ -50,5 +51,9 @@ class SbpPayment(Base, CreateTimestampMixin):
         nullable=False,
     )
 
-    operation: Mapped["Operation"] = relationship("Operation", back_populates="sbp_payments") 
+    operation: Mapped["Operation"] = relationship(
+        "Operation",
+        primaryjoin="foreign(SbpPayment.operation_id) == Operation.operation_id",
+        back_populates="sbp_payments",
+    ) 
     
\ No newline at end of file
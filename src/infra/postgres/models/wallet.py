@@ -1,5 +1,4 @@
 from enum import Enum as PyEnum
-from decimal import Decimal
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -12,14 +11,16 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.schema import UniqueConstraint
-from sqlalchemy.sql.sqltypes import ARRAY, String, DECIMAL
+from sqlalchemy.sql.sqltypes import ARRAY, String
 
+from core.money import Money
 from infra.postgres.models.base import Base
 from infra.postgres.mixins import CreateUpdateTimestampMixin
 
 if TYPE_CHECKING:
     from infra.postgres.models.user import User # noqa: F401
     from infra.postgres.models.operation import Operation # noqa: F401
+    from infra.postgres.models.wallet_address import WalletAddress # noqa: F401
 
 
 class WalletCurrency(str, PyEnum):
@@ -50,12 +51,9 @@ class Wallet(Base, CreateUpdateTimestampMixin):
         Enum(WalletCurrency, name="wallet_currency_enum", native_enum=False),
         nullable=False,
     )
-    balance: Mapped[Decimal] = mapped_column(
-        DECIMAL(precision=20, scale=6),
-        nullable=False,
-        default=Decimal("0.0"),
-        server_default="0.0",
-    )
+    # balance (Money) — только для чтения, вычисляется из журнала проводок: см. infra.postgres.models.ledger
+    if TYPE_CHECKING:
+        balance: Money
     addresses: Mapped[list[str]] = mapped_column(
         ARRAY(String),
         nullable=False,
@@ -70,6 +68,7 @@ class Wallet(Base, CreateUpdateTimestampMixin):
 
     user: Mapped["User"] = relationship("User", back_populates="wallets")
     operations: Mapped[list["Operation"]] = relationship("Operation", back_populates="wallet")
+    deposit_addresses: Mapped[list["WalletAddress"]] = relationship("WalletAddress", back_populates="wallet")
 
     __table_args__ = (
         UniqueConstraint("currency", "telegram_id", name="uq_wallet_currency_telegram_id"),
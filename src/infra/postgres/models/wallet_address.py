@@ -0,0 +1,28 @@
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql.sqltypes import String
+
+from infra.postgres.models.base import Base
+from infra.postgres.mixins import CreateTimestampMixin
+
+if TYPE_CHECKING:
+    from infra.postgres.models.wallet import Wallet # noqa: F401
+
+
+class WalletAddress(Base, CreateTimestampMixin):
+    """Депозитный адрес кошелька; первичный ключ по адресу дает индексный поиск кошелька в вебхуках"""
+    __tablename__ = "wallet_address"
+
+    address: Mapped[str] = mapped_column(String, primary_key=True)
+    wallet_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("wallet.wallet_id", onupdate="CASCADE", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    network: Mapped[str] = mapped_column(String, nullable=False)
+
+    wallet: Mapped["Wallet"] = relationship("Wallet", back_populates="deposit_addresses")
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Identity, Index, Integer, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.sqltypes import String, Text
+
+from infra.postgres.models.base import Base
+from infra.postgres.mixins import CreateTimestampMixin
+
+
+class WebhookInbox(Base, CreateTimestampMixin):
+    """Принятый, но еще не примененный вебхук крипто-процессинга; обработанные записи удаляются"""
+    __tablename__ = "webhook_inbox"
+
+    inbox_id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    tx_id: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    next_attempt_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_webhook_inbox_next_attempt_at_inbox_id", "next_attempt_at", "inbox_id"),
+    )
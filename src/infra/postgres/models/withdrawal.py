@@ -0,0 +1,61 @@
+from datetime import datetime
+from enum import Enum as PyEnum
+from uuid import UUID
+
+from sqlalchemy import BigInteger, ForeignKey, Index, Integer, func, text
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.sqltypes import Enum, String, Text
+
+from infra.postgres.models.base import Base
+from infra.postgres.mixins import CreateUpdateTimestampMixin
+
+
+class WithdrawalStatus(PyEnum):
+    QUEUED = "queued"          # ждет отправки в крипто-процессинг
+    SUBMITTING = "submitting"  # отправляется; зависшие заявки переводятся в UNKNOWN
+    SUBMITTED = "submitted"    # принят крипто-процессингом
+    REJECTED = "rejected"      # отклонен, средства возвращены
+    UNKNOWN = "unknown"        # результат неизвестен (таймаут, 5xx), средства зарезервированы до ручной сверки
+
+
+class Withdrawal(Base, CreateUpdateTimestampMixin):
+    """Заявка на вывод средств: баланс уже зарезервирован, отправку выполняет crypto_processing.withdrawal_worker"""
+    __tablename__ = "withdrawal"
+
+    withdrawal_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+    operation_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False, unique=True)
+    wallet_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("wallet.wallet_id", onupdate="CASCADE", ondelete="NO ACTION"),
+        nullable=False,
+        index=True,
+    )
+    address: Mapped[str] = mapped_column(String(255), nullable=False)
+    amount: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    status: Mapped[WithdrawalStatus] = mapped_column(
+        Enum(WithdrawalStatus, name="withdrawal_status_enum", native_enum=False),
+        nullable=False,
+        default=WithdrawalStatus.QUEUED,
+        server_default=WithdrawalStatus.QUEUED.name,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    next_attempt_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_withdrawal_queued_next_attempt_at",
+            "next_attempt_at",
+            postgresql_where=text("status = 'QUEUED'"),
+        ),
+        Index(
+            "ix_withdrawal_unresolved_updated_at",
+            "updated_at",
+            postgresql_where=text("status IN ('SUBMITTING', 'UNKNOWN')"),
+        ),
+    )
@@ -0,0 +1,194 @@
+import argparse
+import asyncio
+import re
+from datetime import date, datetime, timezone
+from logging import getLogger
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from core.config import settings
+from core.logging_config import setup_logging
+from infra.postgres.pg import engine
+
+logger = getLogger(__name__)
+
+# Таблицы, секционированные по месяцам created_at
+PARTITIONED_TABLES = ("operation", "referral_operation")
+
+# Ключ advisory lock: секции создает только один процесс
+PARTITION_LOCK_KEY = 0x1ED6E6
+
+_PARTITION_NAME = re.compile(r"_y(\d{4})m(\d{2})$")
+_PARTITION_BOUND = re.compile(r"FOR VALUES FROM \((.+)\) TO \((.+)\)")
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_y{month.year}m{month.month:02d}"
+
+
+class DefaultPartitionNotEmptyError(Exception):
+    """В DEFAULT-секции есть строки из диапазона новой месячной секции"""
+
+
+def _parse_bound(value: str) -> date | None:
+    # MINVALUE/MAXVALUE — открытая граница
+    if value in ("MINVALUE", "MAXVALUE"):
+        return None
+    return date.fromisoformat(value.strip("'")[:10])
+
+
+async def _get_partitions(conn: AsyncConnection, table: str) -> tuple[list[tuple[date | None, date | None]], str | None]:
+    """Возвращает диапазоны существующих секций и имя DEFAULT-секции"""
+    result = await conn.execute(
+        text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        ),
+        {"table": table},
+    )
+    ranges, default = [], None
+    for name, bound in result.all():
+        if bound == "DEFAULT":
+            default = name
+            continue
+        match = _PARTITION_BOUND.fullmatch(bound)
+        if match is None:
+            logger.warning("Partition %s has unexpected bound: %s", name, bound)
+            continue
+        ranges.append((_parse_bound(match[1]), _parse_bound(match[2])))
+    return ranges, default
+
+
+def _is_covered(ranges: list[tuple[date | None, date | None]], start: date, end: date) -> bool:
+    return any(
+        (low is None or low < end) and (high is None or start < high)
+        for low, high in ranges
+    )
+
+
+async def ensure_partitions(conn: AsyncConnection, months_ahead: int = settings.postgres_partition_months_ahead) -> int:
+    """
+    Создает недостающие месячные секции с текущего месяца на months_ahead вперед.
+
+    Диапазон, уже покрытый другой секцией (например, исторической), пропускается.
+    Если в DEFAULT-секции есть строки из диапазона новой секции, поднимается
+    DefaultPartitionNotEmptyError: такие строки нужно перенести вручную.
+    Возвращает количество созданных секций.
+    """
+    # Приложение при старте и обслуживающий процесс не создают секции одновременно
+    await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+
+    current = datetime.now(timezone.utc).date().replace(day=1)
+    created = 0
+    for table in PARTITIONED_TABLES:
+        ranges, default = await _get_partitions(conn, table)
+        if default is not None:
+            stray = await conn.scalar(text(f"SELECT count(*) FROM {default}"))
+            if stray:
+                logger.error("Default partition %s holds %s rows", default, stray)
+        for offset in range(months_ahead + 1):
+            start = _add_months(current, offset)
+            end = _add_months(start, 1)
+            if _is_covered(ranges, start, end):
+                continue
+            name = partition_name(table, start)
+            if default is not None:
+                conflicting = await conn.scalar(
+                    text(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE created_at >= :start AND created_at < :end)"),
+                    {"start": start, "end": end},
+                )
+                if conflicting:
+                    raise DefaultPartitionNotEmptyError(
+                        f"Partition {name} cannot be created: {default} holds rows from [{start}, {end})"
+                    )
+            await conn.execute(text(
+                f"CREATE TABLE {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+            ranges.append((start, end))
+            created += 1
+            logger.info("Partition %s created", name)
+    return created
+
+
+async def detach_partitions(conn: AsyncConnection, before: date) -> list[str]:
+    """Отключает месячные секции, целиком лежащие раньше before; данные остаются в отдельных таблицах"""
+    detached = []
+    for table in PARTITIONED_TABLES:
+        result = await conn.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": table},
+        )
+        for name in result.scalars():
+            match = _PARTITION_NAME.search(name)
+            if match is None or name != partition_name(table, date(int(match[1]), int(match[2]), 1)):
+                continue
+            if _add_months(date(int(match[1]), int(match[2]), 1), 1) > before:
+                continue
+            await conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+            detached.append(name)
+            logger.info("Partition %s detached", name)
+    return detached
+
+
+async def _run(months_ahead: int, detach_before: date | None, interval: float, once: bool) -> None:
+    try:
+        while True:
+            try:
+                async with engine.begin() as conn:
+                    await ensure_partitions(conn, months_ahead)
+                    if detach_before is not None:
+                        await detach_partitions(conn, detach_before)
+            except Exception:
+                if once:
+                    raise
+                logger.exception("Partition maintenance failed")
+            if once:
+                return
+            await asyncio.sleep(interval)
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Обслуживание месячных секций таблиц операций.")
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=settings.postgres_partition_months_ahead,
+        help="На сколько месяцев вперед создавать секции.",
+    )
+    parser.add_argument(
+        "--detach-before",
+        type=date.fromisoformat,
+        default=None,
+        help="Отключить секции, целиком лежащие раньше даты (YYYY-MM-DD).",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=settings.postgres_partition_maintenance_interval,
+        help="Интервал между проходами в секундах.",
+    )
+    parser.add_argument("--once", action="store_true", help="Выполнить один проход и завершиться.")
+    args = parser.parse_args(argv)
+
+    setup_logging(log_to_file=not settings.DEBUG)
+    asyncio.run(_run(args.months_ahead, args.detach_before, args.interval, args.once))
+
+
+if __name__ == "__main__":
+    main()
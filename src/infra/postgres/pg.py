@@ -1,8 +1,12 @@
 from asyncio import current_task
 from contextlib import asynccontextmanager
+import random
+import time
 from typing import AsyncIterator
+from uuid import uuid4
 
-from sqlalchemy import AsyncAdaptedQueuePool
+from sqlalchemy import AsyncAdaptedQueuePool, event, make_url
+from sqlalchemy.exc import DisconnectionError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -12,27 +16,105 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from core.config import settings
+from infra.postgres.metrics import instrument_pool
+from infra.postgres.query_stats import instrument_queries
+from infra.postgres.slow_queries import slow_query_recorder
 
-connect_args = {
-    "server_settings": {
-        "jit": "off",
-        "statement_timeout": "30000",
+
+def _connect_args() -> dict:
+    if settings.postgres_pgbouncer:
+        # В transaction pooling подготовленные выражения не переживают смену серверного соединения,
+        # а параметры стартового пакета PgBouncer не пропускает — jit и statement_timeout задаются на роли
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {
+        "statement_cache_size": settings.postgres_statement_cache_size,
+        "server_settings": {
+            "jit": "off",
+            "statement_timeout": str(settings.postgres_statement_timeout),
+        },
     }
-}
-
-engine: AsyncEngine = create_async_engine(
-    settings.POSTGRES_URL,
-    echo=settings.DEBUG,
-    echo_pool=False,
-    connect_args=connect_args,
-    poolclass=AsyncAdaptedQueuePool,
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=3600,
-)
+
+
+def _apply_recycle_jitter(_engine: AsyncEngine, recycle: int, jitter: float) -> None:
+    """Разносит переоткрытие соединений во времени: каждому соединению свой срок жизни"""
+    if recycle <= 0 or jitter <= 0:
+        return
+
+    @event.listens_for(_engine.sync_engine, "connect")
+    def _on_connect(_dbapi_connection, connection_record) -> None:
+        connection_record.info["expires_at"] = time.monotonic() + recycle * (1 - random.uniform(0, jitter))
+
+    @event.listens_for(_engine.sync_engine, "checkout")
+    def _on_checkout(_dbapi_connection, connection_record, _connection_proxy) -> None:
+        expires_at = connection_record.info.get("expires_at")
+        if expires_at is not None and time.monotonic() > expires_at:
+            raise DisconnectionError("Connection exceeded its jittered recycle age")
+
+
+def create_engine(url: str, name: str) -> AsyncEngine:
+    url = make_url(url).difference_update_query(["async_fallback"])
+    prepared_statement_cache_size = 0 if settings.postgres_pgbouncer else settings.postgres_statement_cache_size
+    url = url.update_query_dict({"prepared_statement_cache_size": str(prepared_statement_cache_size)})
+
+    _engine = create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        echo_pool=False,
+        connect_args=_connect_args(),
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.postgres_pool_size,
+        max_overflow=settings.postgres_max_overflow,
+        pool_timeout=settings.postgres_pool_timeout,
+        pool_recycle=settings.postgres_pool_recycle,
+        pool_pre_ping=settings.postgres_pool_pre_ping,
+    )
+    _apply_recycle_jitter(_engine, settings.postgres_pool_recycle, settings.postgres_pool_recycle_jitter)
+    instrument_pool(_engine, name)
+    instrument_queries(_engine)
+    slow_query_recorder.instrument(_engine, name)
+    return _engine
+
+
+engine: AsyncEngine = create_engine(settings.POSTGRES_URL, "primary")
 
 async_session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+# Сессии только для чтения: транзакция открывается как READ ONLY и не коммитится
+read_only_session_factory = async_sessionmaker(
+    engine.execution_options(postgresql_readonly=True),
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
+# Для длинных отчетов: согласованный снимок без риска serialization failure (ждет безопасный снимок)
+report_session_factory = async_sessionmaker(
+    engine.execution_options(isolation_level="SERIALIZABLE", postgresql_readonly=True, postgresql_deferrable=True),
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
+
+replica_engine: AsyncEngine | None = None
+replica_session_factory: async_sessionmaker[AsyncSession] | None = None
+replica_report_session_factory: async_sessionmaker[AsyncSession] | None = None
+if settings.POSTGRES_REPLICA_URL:
+    replica_engine = create_engine(settings.POSTGRES_REPLICA_URL, "replica")
+    replica_session_factory = async_sessionmaker(
+        replica_engine.execution_options(postgresql_readonly=True),
+        expire_on_commit=False,
+        class_=AsyncSession,
+    )
+    # SERIALIZABLE на hot standby недоступен, снимок дает REPEATABLE READ
+    replica_report_session_factory = async_sessionmaker(
+        replica_engine.execution_options(isolation_level="REPEATABLE READ", postgresql_readonly=True),
+        expire_on_commit=False,
+        class_=AsyncSession,
+    )
+
+# Планы медленных запросов снимаются там, где меньше мешают рабочей нагрузке
+slow_query_recorder.use_for_explain(replica_engine or engine)
+
 session: async_scoped_session[AsyncSession] = async_scoped_session(
     session_factory=async_session_factory,
     scopefunc=current_task,
@@ -50,3 +132,13 @@ async def get_db() -> AsyncIterator[AsyncSession]:
             raise error
         finally:
             await db.close()
+
+
+def get_read_only_session_factory(replica: bool = False, report: bool = False) -> async_sessionmaker[AsyncSession]:
+    """Фабрика сессий только для чтения: транзакция READ ONLY, без commit"""
+    if replica:
+        factory = replica_report_session_factory if report else replica_session_factory
+        if factory is None:
+            raise RuntimeError("Read replica is not configured")
+        return factory
+    return report_session_factory if report else read_only_session_factory
@@ -0,0 +1,75 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "Количество SQL-запросов за HTTP-запрос",
+    ["route"],
+    buckets=(1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_time_per_request_seconds",
+    "Суммарное время SQL-запросов за HTTP-запрос",
+    ["route"],
+)
+DB_ROWS_PER_REQUEST = Histogram(
+    "db_rows_per_request",
+    "Количество строк, прочитанных и измененных за HTTP-запрос",
+    ["route"],
+    buckets=(0, 1, 10, 50, 100, 500, 1000, 5000, 10000),
+)
+
+_WHITESPACE = re.compile(r"\s+")
+_PARAMETER = re.compile(r"\$\d+|%\(\w+\)s|\b\d+\b")
+_PARAMETER_LIST = re.compile(r"\(\?(?:, \?)+\)")
+
+
+def normalize_statement(statement: str) -> str:
+    """Приводит запрос к шаблону: параметры и числа -> ?, списки IN любой длины -> (?)"""
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    statement = _PARAMETER.sub("?", statement)
+    return _PARAMETER_LIST.sub("(?)", statement)
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+    rows: int = 0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def add(self, statement: str, duration: float, rows: int) -> None:
+        self.count += 1
+        self.duration += duration
+        self.rows += max(rows, 0)
+        self.statements[normalize_statement(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Запросы, выполненные за HTTP-запрос больше threshold раз (признак N+1)"""
+        return [(statement, count) for statement, count in self.statements.most_common() if count > threshold]
+
+
+# Статистика текущего HTTP-запроса; вне запроса (воркеры, CLI) запросы не учитываются
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def instrument_queries(engine: AsyncEngine) -> None:
+    """Считает запросы, время и строки движка в статистику текущего HTTP-запроса"""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany) -> None:
+        context._query_started_at = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(_conn, cursor, statement, _parameters, context, _executemany) -> None:
+        stats = query_stats.get()
+        if stats is None:
+            return
+        stats.add(statement, time.perf_counter() - context._query_started_at, cursor.rowcount)
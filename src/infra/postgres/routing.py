@@ -0,0 +1,92 @@
+import asyncio
+import time
+from contextvars import ContextVar
+from logging import getLogger
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from infra.postgres.pg import replica_engine
+from infra.redis.redis_api import RedisAPI
+
+logger = getLogger(__name__)
+
+# Пользователь текущего запроса; выставляется при аутентификации
+current_user_id: ContextVar[int | None] = ContextVar("current_user_id", default=None)
+
+HAS_WRITES_KEY = "has_writes"
+
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, _flush_context) -> None:
+    if session.new or session.dirty or session.deleted:
+        session.info[HAS_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml(orm_execute_state) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[HAS_WRITES_KEY] = True
+
+
+class ReplicaRouter:
+    """
+    Выбор между primary и репликой для запросов на чтение.
+
+    Реплика используется, если она доступна и отставание не превышает max_lag.
+    После записи пользователя его чтения sticky_ttl секунд идут на primary (read-your-writes).
+    """
+    STICKY_REDIS_SPACENAME = "db_primary"
+
+    def __init__(self, max_lag: float, sticky_ttl: int, check_interval: float):
+        self._max_lag = max_lag
+        self._sticky_ttl = sticky_ttl
+        self._check_interval = check_interval
+        self._available = False
+        self._checked_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return replica_engine is not None
+
+    async def mark_write(self, redis: RedisAPI, user_id: int) -> None:
+        if self.enabled:
+            await redis.set(f"{self.STICKY_REDIS_SPACENAME}:{user_id}", "", self._sticky_ttl)
+
+    async def use_replica(self, redis: RedisAPI, user_id: int | None) -> bool:
+        if not self.enabled:
+            return False
+        if user_id is not None and await redis.exists(f"{self.STICKY_REDIS_SPACENAME}:{user_id}"):
+            return False
+        return await self.is_replica_available()
+
+    async def is_replica_available(self) -> bool:
+        if time.monotonic() - self._checked_at < self._check_interval or self._lock.locked():
+            return self._available
+
+        async with self._lock:
+            try:
+                async with replica_engine.connect() as conn:
+                    lag = float((await conn.execute(REPLICA_LAG_QUERY)).scalar_one())
+                self._available = lag <= self._max_lag
+                if not self._available:
+                    logger.warning("Read replica lag %.1fs exceeds %.1fs, reading from primary", lag, self._max_lag)
+            except Exception:
+                logger.exception("Read replica is unavailable, reading from primary")
+                self._available = False
+            self._checked_at = time.monotonic()
+        return self._available
+
+
+replica_router = ReplicaRouter(
+    max_lag=settings.postgres_replica_max_lag,
+    sticky_ttl=settings.postgres_read_your_writes_ttl,
+    check_interval=settings.postgres_replica_check_interval,
+)
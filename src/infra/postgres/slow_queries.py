@@ -0,0 +1,130 @@
+import asyncio
+import json
+import random
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from logging import getLogger
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.config import settings
+from infra.postgres.query_stats import query_stats
+
+logger = getLogger(__name__)
+
+# EXPLAIN ANALYZE выполняет запрос, поэтому план снимается только для чтения
+_EXPLAINABLE_PREFIXES = ("select", "with")
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Заменяет значения параметров их типами: в лог и буфер не попадают адреса, суммы и id"""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(value) if isinstance(value, (list, tuple, dict)) else type(value).__name__
+                for value in parameters]
+    return type(parameters).__name__
+
+
+@dataclass
+class SlowQuery:
+    statement: str
+    parameters: Any
+    duration_ms: float
+    engine: str
+    recorded_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    plan: Any = None
+
+
+class SlowQueryRecorder:
+    """
+    Фиксирует запросы дольше порога в кольцевом буфере процесса и пишет их в лог как JSON.
+
+    Для доли медленных SELECT в фоне снимается EXPLAIN (ANALYZE, BUFFERS) на реплике,
+    если она настроена, иначе на primary; одновременно выполняется не больше одного EXPLAIN.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float = settings.postgres_slow_query_threshold,
+        explain_sample_rate: float = settings.postgres_slow_query_explain_sample_rate,
+        buffer_size: int = settings.postgres_slow_query_buffer_size,
+    ):
+        self._threshold = threshold_ms / 1000
+        self._explain_sample_rate = explain_sample_rate
+        self._queries: deque[SlowQuery] = deque(maxlen=buffer_size)
+        self._explain_engine: AsyncEngine | None = None
+        self._explain_task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._threshold > 0
+
+    def recent(self) -> list[SlowQuery]:
+        return list(reversed(self._queries))
+
+    def instrument(self, engine: AsyncEngine, name: str) -> None:
+        if not self.enabled:
+            return
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def _before_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany) -> None:
+            context._slow_query_started_at = time.perf_counter()
+
+        @event.listens_for(engine.sync_engine, "after_cursor_execute")
+        def _after_cursor_execute(_conn, _cursor, statement, parameters, context, executemany) -> None:
+            duration = time.perf_counter() - context._slow_query_started_at
+            if duration >= self._threshold and not statement.startswith("EXPLAIN"):
+                self._record(statement, parameters, duration, name, explain=not executemany)
+
+    def use_for_explain(self, engine: AsyncEngine) -> None:
+        self._explain_engine = engine
+
+    def _record(self, statement: str, parameters: Any, duration: float, engine_name: str, explain: bool) -> None:
+        query = SlowQuery(
+            statement=statement,
+            parameters=redact_parameters(parameters),
+            duration_ms=round(duration * 1000, 1),
+            engine=engine_name,
+        )
+        self._queries.append(query)
+        logger.warning(json.dumps({"event": "slow_query", **asdict(query)}, ensure_ascii=False, default=str))
+
+        if explain and self._should_explain(statement):
+            self._explain_task = asyncio.get_running_loop().create_task(self._explain(query, parameters))
+
+    def _should_explain(self, statement: str) -> bool:
+        if self._explain_engine is None or random.random() >= self._explain_sample_rate:
+            return False
+        if self._explain_task is not None and not self._explain_task.done():
+            return False
+        return statement.lstrip().lower().startswith(_EXPLAINABLE_PREFIXES)
+
+    async def _explain(self, query: SlowQuery, parameters: Any) -> None:
+        # Задача наследует контекст запроса; EXPLAIN не должен попадать в его статистику
+        query_stats.set(None)
+        try:
+            async with self._explain_engine.connect() as conn:
+                conn = await conn.execution_options(postgresql_readonly=True)
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query.statement}", parameters
+                )
+                query.plan = result.scalar()
+                await conn.rollback()
+        except Exception as e:
+            logger.warning("EXPLAIN for slow query failed: %s", e)
+            return
+        logger.warning(
+            json.dumps(
+                {"event": "slow_query_plan", "statement": query.statement, "plan": query.plan},
+                ensure_ascii=False,
+                default=str,
+            )
+        )
+
+
+slow_query_recorder = SlowQueryRecorder()
@@ -19,5 +19,10 @@ class PostgresStorage(Generic[ModelT]):
         await self._db.flush()
         return obj
 
+    async def add_all(self, objs: list[ModelT]) -> list[ModelT]:
+        self._db.add_all(objs)
+        await self._db.flush()
+        return objs
+
     async def get_by_id(self, obj_id) -> ModelT | None:
         return await self._db.get(self.model_cls, obj_id)
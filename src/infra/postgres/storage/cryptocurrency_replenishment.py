@@ -1,4 +1,5 @@
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 
 from infra.postgres.models import CryptocurrencyReplenishment
 from infra.postgres.storage.base_storage import PostgresStorage
@@ -11,3 +12,21 @@ class CryptocurrencyReplenishmentStorage(PostgresStorage[CryptocurrencyReplenish
         stmt = select(self.model_cls).where(self.model_cls.tx_id == tx_id)
         result = await self._db.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def insert_new(self, replenishments: list[dict]) -> set[str]:
+        """
+        Вставляет пополнения, пропуская уже записанные tx_id (ON CONFLICT DO NOTHING).
+
+        Возвращает tx_id вставленных строк: повтор стоит одного запроса без исключения,
+        а конкурентная вставка того же tx_id ждет первую транзакцию и ничего не вставляет.
+        """
+        if not replenishments:
+            return set()
+        stmt = (
+            insert(self.model_cls)
+            .values(replenishments)
+            .on_conflict_do_nothing(index_elements=[self.model_cls.tx_id])
+            .returning(self.model_cls.tx_id)
+        )
+        result = await self._db.execute(stmt)
+        return set(result.scalars().all())
@@ -0,0 +1,40 @@
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert
+
+from infra.postgres.models.deposit_address import DepositAddress
+from infra.postgres.storage.base_storage import PostgresStorage
+
+
+class DepositAddressStorage(PostgresStorage[DepositAddress]):
+    model_cls = DepositAddress
+
+    async def claim(self) -> str | None:
+        """Забирает свободный адрес из пула; конкурентные регистрации не ждут друг друга"""
+        candidate = (
+            select(self.model_cls.address)
+            .order_by(self.model_cls.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            delete(self.model_cls)
+            .where(self.model_cls.address == candidate)
+            .returning(self.model_cls.address)
+        )
+        result = await self._db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def count(self) -> int:
+        result = await self._db.execute(select(func.count()).select_from(self.model_cls))
+        return result.scalar_one()
+
+    async def add_many(self, addresses: list[str]) -> None:
+        if not addresses:
+            return
+        stmt = (
+            insert(self.model_cls)
+            .values([{"address": address} for address in addresses])
+            .on_conflict_do_nothing(index_elements=[self.model_cls.address])
+        )
+        await self._db.execute(stmt)
@@ -0,0 +1,93 @@
+from typing import Iterable, NamedTuple
+from uuid import UUID
+
+from sqlalchemy import insert, literal, select
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+
+from core.money import Money
+from infra.postgres.models.ledger import LedgerAccount, LedgerPosting, wallet_balance
+from infra.postgres.storage.base_storage import PostgresStorage
+
+
+class LedgerEntry(NamedTuple):
+    account: LedgerAccount
+    amount: Money  # микро-единицы USDT, со знаком
+    wallet_id: UUID | None = None
+
+
+def credit_entries(
+    wallet_id: UUID,
+    source: LedgerAccount,
+    total_amount: Money,
+    amount: Money,
+    fee_account: LedgerAccount,
+) -> list[LedgerEntry]:
+    """Зачисление: из total_amount на кошелек приходит amount, остаток — комиссия"""
+    return [
+        LedgerEntry(source, -total_amount),
+        LedgerEntry(LedgerAccount.WALLET, amount, wallet_id),
+        LedgerEntry(fee_account, total_amount - amount),
+    ]
+
+
+def debit_entries(
+    wallet_id: UUID,
+    destination: LedgerAccount,
+    amount: Money,
+    fee: Money,
+    fee_account: LedgerAccount,
+) -> list[LedgerEntry]:
+    """Списание: с кошелька уходит amount + fee"""
+    return [
+        LedgerEntry(LedgerAccount.WALLET, -(amount + fee), wallet_id),
+        LedgerEntry(destination, amount),
+        LedgerEntry(fee_account, fee),
+    ]
+
+
+def reversal_entries(entries: Iterable[LedgerEntry]) -> list[LedgerEntry]:
+    """Сторно: те же проводки с обратным знаком"""
+    return [entry._replace(amount=-entry.amount) for entry in entries]
+
+
+class LedgerStorage(PostgresStorage[LedgerPosting]):
+    """
+    Журнал проводок: только вставки, строки не изменяются.
+
+    Зачисления на кошелек не требуют блокировок. Списания должны выполняться
+    под блокировкой строки кошелька (SELECT ... FOR UPDATE) с проверкой get_balance после нее.
+    """
+    model_cls = LedgerPosting
+
+    async def post(self, transaction_id: UUID, entries: Iterable[LedgerEntry]) -> None:
+        await self.post_many([(transaction_id, entries)])
+
+    async def post_many(self, transactions: Iterable[tuple[UUID, Iterable[LedgerEntry]]]) -> None:
+        """Записывает проводки нескольких транзакций одним INSERT; нулевые проводки пропускаются"""
+        rows = []
+        for transaction_id, entries in transactions:
+            entries = list(entries)
+            if sum(entry.amount for entry in entries) != 0:
+                raise ValueError(f"Unbalanced ledger transaction {transaction_id}: {entries}")
+            rows.extend(
+                {
+                    "transaction_id": transaction_id,
+                    "account": entry.account,
+                    "wallet_id": entry.wallet_id,
+                    "amount": entry.amount,
+                }
+                for entry in entries
+                if entry.amount
+            )
+        if rows:
+            await self._db.execute(insert(self.model_cls).values(rows))
+
+    async def get_balance(self, wallet_id: UUID) -> Money:
+        """
+        Баланс кошелька отдельным запросом.
+
+        Перед списанием вызывается после блокировки кошелька: в READ COMMITTED запрос,
+        дождавшийся блокировки, видит баланс на момент своего начала, а этот — уже после нее.
+        """
+        stmt = select(wallet_balance(literal(wallet_id, PGUUID(as_uuid=True))))
+        return await self._db.scalar(stmt)
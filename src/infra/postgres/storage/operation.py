@@ -1,10 +1,11 @@
+from datetime import datetime
 from uuid import UUID
 from typing import Sequence
-from decimal import Decimal
 
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, func, tuple_, Select
 from sqlalchemy.orm import selectinload
 
+from core.money import Money
 from infra.postgres.models import Operation, Wallet
 from infra.postgres.models.operation import OperationStatus, OperationType
 from infra.postgres.storage.base_storage import PostgresStorage
@@ -18,31 +19,36 @@ class OperationStorage(PostgresStorage[Operation]):
             wallet_id: UUID,
             limit: int | None = None,
             offset: int | None = None,
+            after: tuple[datetime, UUID] | None = None,
     ) -> Sequence[Operation]:
-        stmt = (
-            select(self.model_cls)
-            .where(self.model_cls.wallet_id == wallet_id)
-            .order_by(self.model_cls.created_at.desc())
-            .options(selectinload(self.model_cls.crypto_replenishment))
-        )
-        if limit is not None:
-            stmt = stmt.limit(limit)
-        if offset is not None:
-            stmt = stmt.offset(offset)
-        result = await self._db.execute(stmt)
-        return result.scalars().all()
+        stmt = select(self.model_cls).where(self.model_cls.wallet_id == wallet_id)
+        return await self._get_page(stmt, limit, offset, after)
 
     async def get_user_operations(
             self,
             telegram_id: int,
             limit: int | None = None,
             offset: int | None = None,
+            after: tuple[datetime, UUID] | None = None,
     ) -> Sequence[Operation]:
+        # Фильтр через подзапрос по кошелькам, чтобы использовать индекс (wallet_id, created_at, operation_id)
+        wallet_ids = select(Wallet.wallet_id).where(Wallet.telegram_id == telegram_id)
+        stmt = select(self.model_cls).where(self.model_cls.wallet_id.in_(wallet_ids))
+        return await self._get_page(stmt, limit, offset, after)
+
+    async def _get_page(
+            self,
+            stmt: Select,
+            limit: int | None,
+            offset: int | None,
+            after: tuple[datetime, UUID] | None,
+    ) -> Sequence[Operation]:
+        """Страница операций от новых к старым; after — ключ последней операции предыдущей страницы"""
+        if after is not None:
+            stmt = stmt.where(tuple_(self.model_cls.created_at, self.model_cls.operation_id) < after)
         stmt = (
-            select(self.model_cls)
-            .join(Wallet, Operation.wallet_id == Wallet.wallet_id)
-            .where(Wallet.telegram_id == telegram_id)
-            .order_by(self.model_cls.created_at.desc())
+            stmt
+            .order_by(self.model_cls.created_at.desc(), self.model_cls.operation_id.desc())
             .options(selectinload(self.model_cls.crypto_replenishment))
         )
         if limit is not None:
@@ -71,9 +77,9 @@ class OperationStorage(PostgresStorage[Operation]):
         result = await self._db.execute(stmt)
         return result.scalar_one_or_none() is not None
 
-    async def get_total_referrals_spending(self, ids: Sequence[int]) -> Decimal:
+    async def get_total_referrals_spending(self, ids: Sequence[int]) -> Money:
         stmt = (
-            select(func.coalesce(func.sum(Operation.total_amount), Decimal("0")))
+            select(func.coalesce(func.sum(Operation.total_amount), 0))
             .select_from(Operation)
             .join(Wallet, Operation.wallet_id == Wallet.wallet_id)
             .where(
@@ -82,12 +88,12 @@ class OperationStorage(PostgresStorage[Operation]):
             )
         )
         result = await self._db.execute(stmt)
-        return result.scalar() or Decimal("0")
+        return result.scalar() or 0
 
-    async def get_user_total_spending(self, telegram_id: int) -> Decimal:
+    async def get_user_total_spending(self, telegram_id: int) -> Money:
         """Получает общую сумму потраченных средств пользователем (только успешные операции списания)"""
         stmt = (
-            select(func.coalesce(func.sum(Operation.total_amount), Decimal("0")))
+            select(func.coalesce(func.sum(Operation.total_amount), 0))
             .select_from(Operation)
             .join(Wallet, Operation.wallet_id == Wallet.wallet_id)
             .where(
@@ -97,4 +103,4 @@ class OperationStorage(PostgresStorage[Operation]):
             )
         )
         result = await self._db.execute(stmt)
-        return result.scalar() or Decimal("0")
+        return result.scalar() or 0
@@ -1,8 +1,8 @@
 from uuid import UUID
-from decimal import Decimal
 from typing import Sequence
 from sqlalchemy import select, update, func
 
+from core.money import Money
 from infra.postgres.models import ReferralOperation, Referral
 from infra.postgres.storage.base_storage import PostgresStorage
 
@@ -64,7 +64,7 @@ class ReferralOperationStorage(PostgresStorage[ReferralOperation]):
         result = await self._db.execute(stmt)
         return result.scalar() or 0
 
-    async def has_cpa_bonus_for_amount(self, referral_id: int, amount: Decimal) -> bool:
+    async def has_cpa_bonus_for_amount(self, referral_id: int, amount: Money) -> bool:
         """Проверяет, был ли уже начислен CPA бонус с указанной суммой для реферала"""
         from infra.postgres.models.referral_operation import ReferralOperationType, ReferralOperationStatus
         
@@ -81,12 +81,12 @@ class ReferralOperationStorage(PostgresStorage[ReferralOperation]):
         count = result.scalar() or 0
         return count > 0
 
-    async def get_referrer_total_earned(self, referrer_id: int) -> Decimal:
+    async def get_referrer_total_earned(self, referrer_id: int) -> Money:
         """Получает общую сумму, полученную от всех рефералов (начисленную на баланс referrer_id)"""
         from infra.postgres.models.referral_operation import ReferralOperationType, ReferralOperationStatus
         
         stmt = (
-            select(func.coalesce(func.sum(self.model_cls.amount), Decimal("0")))
+            select(func.coalesce(func.sum(self.model_cls.amount), 0))
             .where(
                 self.model_cls.referral_id == referrer_id,
                 self.model_cls.operation_type == ReferralOperationType.DEPOSIT,
@@ -94,9 +94,9 @@ class ReferralOperationStorage(PostgresStorage[ReferralOperation]):
             )
         )
         result = await self._db.execute(stmt)
-        return result.scalar() or Decimal("0")
+        return result.scalar() or 0
 
-    async def get_referral_total_earned(self, referrer_id: int, referral_telegram_id: int) -> Decimal:
+    async def get_referral_total_earned(self, referrer_id: int, referral_telegram_id: int) -> Money:
         """
         Получает сумму, которую принес конкретный реферал на баланс реферера.
         Использует поле source_referral_id для точного определения источника.
@@ -104,7 +104,7 @@ class ReferralOperationStorage(PostgresStorage[ReferralOperation]):
         from infra.postgres.models.referral_operation import ReferralOperationType, ReferralOperationStatus
         
         stmt = (
-            select(func.coalesce(func.sum(self.model_cls.amount), Decimal("0")))
+            select(func.coalesce(func.sum(self.model_cls.amount), 0))
             .where(
                 self.model_cls.referral_id == referrer_id,
                 self.model_cls.source_referral_id == referral_telegram_id,
@@ -113,7 +113,7 @@ class ReferralOperationStorage(PostgresStorage[ReferralOperation]):
             )
         )
         result = await self._db.execute(stmt)
-        return result.scalar() or Decimal("0")
+        return result.scalar() or 0
 
     async def get_deposit_operations_with_source(
         self,
@@ -1,9 +1,10 @@
 from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import select, literal, and_
+from sqlalchemy import select, and_
 
 from infra.postgres.models.wallet import Wallet
+from infra.postgres.models.wallet_address import WalletAddress
 from infra.postgres.storage.base_storage import PostgresStorage
 
 
@@ -13,13 +14,26 @@ class WalletStorage(PostgresStorage[Wallet]):
     async def get_wallet_by_address_for_update(self, address: str) -> Wallet | None:
         stmt = (
             select(self.model_cls)
-            .where(self.model_cls.addresses.any(literal(address)))
+            .join(WalletAddress, WalletAddress.wallet_id == self.model_cls.wallet_id)
+            .where(WalletAddress.address == address)
             .limit(1)
-            .with_for_update()
+            .with_for_update(of=self.model_cls)
         )
         result = await self._db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_wallets_by_addresses(self, addresses: list[str]) -> dict[str, Wallet]:
+        """Кошельки по депозитным адресам; без блокировки — зачисление только добавляет проводки"""
+        if not addresses:
+            return {}
+        stmt = (
+            select(WalletAddress.address, self.model_cls)
+            .join(WalletAddress, WalletAddress.wallet_id == self.model_cls.wallet_id)
+            .where(WalletAddress.address.in_(addresses))
+        )
+        result = await self._db.execute(stmt)
+        return {address: wallet for address, wallet in result.all()}
+
     async def get_wallet_by_id_for_update(self, wallet_id: UUID, user_id: UUID) -> Wallet | None:
         stmt = (
             select(self.model_cls)
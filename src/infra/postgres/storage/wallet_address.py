@@ -0,0 +1,6 @@
+from infra.postgres.models.wallet_address import WalletAddress
+from infra.postgres.storage.base_storage import PostgresStorage
+
+
+class WalletAddressStorage(PostgresStorage[WalletAddress]):
+    model_cls = WalletAddress
@@ -0,0 +1,71 @@
+from typing import Sequence
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from infra.postgres.models.webhook_inbox import WebhookInbox
+from infra.postgres.storage.base_storage import PostgresStorage
+
+
+class WebhookInboxStorage(PostgresStorage[WebhookInbox]):
+    model_cls = WebhookInbox
+
+    async def push(self, tx_id: str, payload: dict) -> None:
+        """Сохраняет вебхук; повторная доставка той же транзакции игнорируется"""
+        stmt = (
+            insert(self.model_cls)
+            .values(tx_id=tx_id, payload=payload)
+            .on_conflict_do_nothing(index_elements=[self.model_cls.tx_id])
+        )
+        await self._db.execute(stmt)
+
+    async def push_many(self, entries: list[tuple[str, dict]]) -> None:
+        if not entries:
+            return
+        stmt = (
+            insert(self.model_cls)
+            .values([{"tx_id": tx_id, "payload": payload} for tx_id, payload in entries])
+            .on_conflict_do_nothing(index_elements=[self.model_cls.tx_id])
+        )
+        await self._db.execute(stmt)
+
+    async def claim(
+        self, limit: int, max_attempts: int, inbox_ids: list[int] | None = None
+    ) -> Sequence[WebhookInbox]:
+        """Забирает готовые к обработке записи; параллельные обработчики получают разные записи"""
+        stmt = (
+            select(self.model_cls)
+            .where(
+                self.model_cls.next_attempt_at <= func.now(),
+                self.model_cls.attempts < max_attempts,
+            )
+            .order_by(self.model_cls.next_attempt_at, self.model_cls.inbox_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        if inbox_ids is not None:
+            stmt = stmt.where(self.model_cls.inbox_id.in_(inbox_ids))
+        result = await self._db.execute(stmt)
+        return result.scalars().all()
+
+    async def delete_many(self, inbox_ids: list[int]) -> None:
+        if not inbox_ids:
+            return
+        await self._db.execute(delete(self.model_cls).where(self.model_cls.inbox_id.in_(inbox_ids)))
+
+    async def postpone(self, inbox_ids: list[int], error: str, base_delay: float) -> None:
+        """Откладывает записи с экспоненциальной задержкой по числу попыток"""
+        if not inbox_ids:
+            return
+        stmt = (
+            update(self.model_cls)
+            .where(self.model_cls.inbox_id.in_(inbox_ids))
+            .values(
+                attempts=self.model_cls.attempts + 1,
+                last_error=error,
+                next_attempt_at=func.now()
+                + func.make_interval(0, 0, 0, 0, 0, 0, base_delay * func.power(2, self.model_cls.attempts)),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self._db.execute(stmt)
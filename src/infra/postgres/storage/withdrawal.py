@@ -0,0 +1,58 @@
+from datetime import timedelta
+from typing import Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select
+
+from infra.postgres.models.withdrawal import Withdrawal, WithdrawalStatus
+from infra.postgres.storage.base_storage import PostgresStorage
+
+
+class WithdrawalStorage(PostgresStorage[Withdrawal]):
+    model_cls = Withdrawal
+
+    async def claim(self, limit: int) -> Sequence[Withdrawal]:
+        """Забирает заявки к отправке; параллельные обработчики получают разные заявки"""
+        stmt = (
+            select(self.model_cls)
+            .where(
+                self.model_cls.status == WithdrawalStatus.QUEUED,
+                self.model_cls.next_attempt_at <= func.now(),
+            )
+            .order_by(self.model_cls.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._db.execute(stmt)
+        return result.scalars().all()
+
+    async def claim_stale(self, limit: int, stale_after: float) -> Sequence[Withdrawal]:
+        """Забирает заявки, оставшиеся в SUBMITTING дольше stale_after секунд (процесс упал во время отправки)"""
+        stmt = (
+            select(self.model_cls)
+            .where(
+                self.model_cls.status == WithdrawalStatus.SUBMITTING,
+                self.model_cls.updated_at <= func.now() - timedelta(seconds=stale_after),
+            )
+            .order_by(self.model_cls.updated_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._db.execute(stmt)
+        return result.scalars().all()
+
+    async def get_unknown(self, limit: int) -> Sequence[Withdrawal]:
+        """Заявки с неизвестным результатом, ожидающие ручной сверки"""
+        stmt = (
+            select(self.model_cls)
+            .where(self.model_cls.status == WithdrawalStatus.UNKNOWN)
+            .order_by(self.model_cls.updated_at)
+            .limit(limit)
+        )
+        result = await self._db.execute(stmt)
+        return result.scalars().all()
+
+    async def get_for_update(self, withdrawal_id: UUID) -> Withdrawal | None:
+        stmt = select(self.model_cls).where(self.model_cls.withdrawal_id == withdrawal_id).with_for_update()
+        result = await self._db.execute(stmt)
+        return result.scalar_one_or_none()
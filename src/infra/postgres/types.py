@@ -0,0 +1,22 @@
+from decimal import Decimal
+
+from sqlalchemy import DECIMAL
+from sqlalchemy.types import TypeDecorator
+
+from core.money import Money, from_micros, to_micros
+
+
+class MicroAmount(TypeDecorator):
+    """Колонка NUMERIC(20, 6) с суммой в USDT, в Python — int в микро-единицах (core.money)"""
+    impl = DECIMAL(precision=20, scale=6)
+    cache_ok = True
+
+    def process_bind_param(self, value: Money | None, dialect) -> Decimal | None:
+        if value is None:
+            return None
+        return from_micros(value)
+
+    def process_result_value(self, value: Decimal | None, dialect) -> Money | None:
+        if value is None:
+            return None
+        return to_micros(value, exact=False)
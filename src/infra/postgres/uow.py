@@ -1,37 +1,180 @@
-from typing import Annotated, AsyncIterator
+from typing import Annotated, AsyncIterator, Callable, TypeVar
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from infra.postgres.pg import get_db
+from infra.postgres.pg import async_session_factory, get_read_only_session_factory
+from infra.postgres.routing import replica_router, current_user_id, HAS_WRITES_KEY
 from infra.postgres.storage.user import UserStorage
 from infra.postgres.storage.referral import ReferralStorage
 from infra.postgres.storage.wallet import WalletStorage
+from infra.postgres.storage.wallet_address import WalletAddressStorage
 from infra.postgres.storage.operation import OperationStorage
 from infra.postgres.storage.cryptocurrency_replenishment import CryptocurrencyReplenishmentStorage
 from infra.postgres.storage.sbp_payment import SbpPaymentStorage
 from infra.postgres.storage.referral_operation import ReferralOperationStorage
+from infra.postgres.storage.deposit_address import DepositAddressStorage
+from infra.postgres.storage.webhook_inbox import WebhookInboxStorage
+from infra.postgres.storage.withdrawal import WithdrawalStorage
+from infra.postgres.storage.ledger import LedgerStorage
+from infra.redis.dependencies import RedisDep
+
+StorageT = TypeVar("StorageT")
 
 
 class PostgresUnitOfWork:
     """
     A single entry point for working with storages.
     Manages access to data storages using the provided database session.
+
+    If a session factory is given, the session (and its pooled connection) is opened
+    on first storage access and can be returned early with release().
     """
-    def __init__(self, db: AsyncSession) -> None:
-        self.db = db
-        self.user = UserStorage(db)
-        self.referral = ReferralStorage(db)
-        self.wallet = WalletStorage(db)
-        self.operation = OperationStorage(db)
-        self.cryptocurrency_replenishment = CryptocurrencyReplenishmentStorage(db)
-        self.sbp_payment = SbpPaymentStorage(db)
-        self.referral_operation = ReferralOperationStorage(db)
+    def __init__(
+        self,
+        db: AsyncSession | None = None,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        read_only: bool = False,
+    ) -> None:
+        if db is None and session_factory is None:
+            raise ValueError("Either db or session_factory must be provided")
+        self._db = db
+        self._session_factory = session_factory
+        self._read_only = read_only
+        self._storages: dict[type, object] = {}
+        self._has_writes = False
+
+    @property
+    def db(self) -> AsyncSession:
+        if self._db is None:
+            self._db = self._session_factory()
+        return self._db
+
+    @property
+    def has_writes(self) -> bool:
+        return self._has_writes or (self._db is not None and bool(self._db.info.get(HAS_WRITES_KEY)))
+
+    def _storage(self, storage_cls: type[StorageT]) -> StorageT:
+        storage = self._storages.get(storage_cls)
+        if storage is None:
+            storage = self._storages[storage_cls] = storage_cls(self.db)
+        return storage
+
+    @property
+    def user(self) -> UserStorage:
+        return self._storage(UserStorage)
+
+    @property
+    def referral(self) -> ReferralStorage:
+        return self._storage(ReferralStorage)
+
+    @property
+    def wallet(self) -> WalletStorage:
+        return self._storage(WalletStorage)
+
+    @property
+    def wallet_address(self) -> WalletAddressStorage:
+        return self._storage(WalletAddressStorage)
+
+    @property
+    def operation(self) -> OperationStorage:
+        return self._storage(OperationStorage)
+
+    @property
+    def cryptocurrency_replenishment(self) -> CryptocurrencyReplenishmentStorage:
+        return self._storage(CryptocurrencyReplenishmentStorage)
+
+    @property
+    def sbp_payment(self) -> SbpPaymentStorage:
+        return self._storage(SbpPaymentStorage)
+
+    @property
+    def referral_operation(self) -> ReferralOperationStorage:
+        return self._storage(ReferralOperationStorage)
+
+    @property
+    def deposit_address(self) -> DepositAddressStorage:
+        return self._storage(DepositAddressStorage)
+
+    @property
+    def webhook_inbox(self) -> WebhookInboxStorage:
+        return self._storage(WebhookInboxStorage)
+
+    @property
+    def withdrawal(self) -> WithdrawalStorage:
+        return self._storage(WithdrawalStorage)
+
+    @property
+    def ledger(self) -> LedgerStorage:
+        return self._storage(LedgerStorage)
+
+    async def release(self, commit: bool = True) -> None:
+        """
+        Завершает транзакцию и возвращает соединение в пул.
+        Повторное обращение к хранилищам откроет новую сессию.
+        """
+        if self._db is None or self._session_factory is None:
+            return
+
+        db, self._db = self._db, None
+        self._storages.clear()
+        self._has_writes = self._has_writes or bool(db.info.get(HAS_WRITES_KEY))
+        try:
+            if commit and not self._read_only:
+                await db.commit()
+            else:
+                await db.rollback()
+        finally:
+            await db.close()
+
+
+async def get_uow(redis: RedisDep) -> AsyncIterator[PostgresUnitOfWork]:
+    uow = PostgresUnitOfWork(session_factory=async_session_factory)
+    try:
+        yield uow
+    except Exception:
+        await uow.release(commit=False)
+        raise
+    await uow.release()
+
+    user_id = current_user_id.get()
+    if user_id is not None and uow.has_writes:
+        await replica_router.mark_write(redis, user_id)
+
+
+async def get_read_only_uow(redis: RedisDep) -> AsyncIterator[PostgresUnitOfWork]:
+    """UoW для эндпоинтов только на чтение: READ ONLY транзакция без commit, по возможности на реплике"""
+    use_replica = await replica_router.use_replica(redis, current_user_id.get())
+    uow = PostgresUnitOfWork(session_factory=get_read_only_session_factory(replica=use_replica), read_only=True)
+    try:
+        yield uow
+    finally:
+        await uow.release()
+
+
+async def get_primary_read_only_uow() -> AsyncIterator[PostgresUnitOfWork]:
+    """UoW только на чтение с primary: для данных, которые после чтения кэшируются и не должны отставать"""
+    uow = PostgresUnitOfWork(session_factory=get_read_only_session_factory(), read_only=True)
+    try:
+        yield uow
+    finally:
+        await uow.release()
 
 
-async def get_uow() -> AsyncIterator[PostgresUnitOfWork]:
-    async with get_db() as db:
-        yield PostgresUnitOfWork(db)
+async def get_report_uow(redis: RedisDep) -> AsyncIterator[PostgresUnitOfWork]:
+    """UoW для тяжелых отчетов: READ ONLY транзакция на согласованном снимке"""
+    use_replica = await replica_router.use_replica(redis, current_user_id.get())
+    uow = PostgresUnitOfWork(
+        session_factory=get_read_only_session_factory(replica=use_replica, report=True),
+        read_only=True,
+    )
+    try:
+        yield uow
+    finally:
+        await uow.release()
 
 
 PostgresUnitOfWorkDep = Annotated[PostgresUnitOfWork, Depends(get_uow)]
+ReadOnlyUnitOfWorkDep = Annotated[PostgresUnitOfWork, Depends(get_read_only_uow)]
+PrimaryReadOnlyUnitOfWorkDep = Annotated[PostgresUnitOfWork, Depends(get_primary_read_only_uow)]
+ReportUnitOfWorkDep = Annotated[PostgresUnitOfWork, Depends(get_report_uow)]
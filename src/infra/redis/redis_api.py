@@ -1,5 +1,6 @@
 import json
 import redis.asyncio as redis
+from redis.exceptions import ResponseError
 
 from core.config import settings
 
@@ -23,6 +24,31 @@ class RedisAPI:
     async def get(self, key: str) -> str | None:
         return await self._client.get(name=key)
 
+    async def getex(self, key: str, expire: int) -> str | None:
+        """Получить значение и продлить время жизни ключа"""
+        return await self._client.getex(name=key, ex=expire)
+
+    async def getex_many(self, keys: list[tuple[str, int]]) -> list[str | None]:
+        """Получить значения нескольких ключей с продлением времени жизни за один запрос"""
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key, expire in keys:
+                pipe.getex(name=key, ex=expire)
+            return await pipe.execute()
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        """Получить значения нескольких ключей за один запрос"""
+        return await self._client.mget(keys)
+
+    async def incr_many(self, keys: list[str], expire: int = 0) -> list[int]:
+        """Увеличить несколько счетчиков (и продлить их время жизни) за один запрос"""
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.incr(key)
+                if expire:
+                    pipe.expire(key, expire)
+            results = await pipe.execute()
+        return results[::2] if expire else results
+
     async def delete(self, key: str):
         await self._client.delete(key)
 
@@ -32,6 +58,9 @@ class RedisAPI:
     async def incr(self, key: str) -> int:
         return await self._client.incr(key)
 
+    async def decrby(self, key: str, amount: int) -> int:
+        return await self._client.decrby(key, amount)
+
     async def expire(self, key: str, seconds: int) -> bool:
         return await self._client.expire(key, seconds)
 
@@ -58,6 +87,18 @@ class RedisAPI:
         """Обрезать список до указанного диапазона"""
         await self._client.ltrim(key, start, end)
 
+    async def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        """Добавить элементы в упорядоченное множество"""
+        return await self._client.zadd(key, mapping)
+
+    async def zrange(self, key: str, start: int = 0, end: int = -1) -> list[str]:
+        """Получить элементы упорядоченного множества"""
+        return await self._client.zrange(key, start, end)
+
+    async def zremrangebyscore(self, key: str, min_score: float | str, max_score: float | str) -> int:
+        """Удалить элементы упорядоченного множества по диапазону score"""
+        return await self._client.zremrangebyscore(key, min_score, max_score)
+
     async def set_json(self, key: str, value: dict, expire: int = 0):
         """Сохранить JSON объект"""
         await self._client.set(name=key, value=json.dumps(value), ex=expire or None)
@@ -81,3 +122,47 @@ class RedisAPI:
         """Получить список JSON объектов"""
         values = await self._client.lrange(key, start, end)
         return [json.loads(v) for v in values]
+
+    async def xadd(self, key: str, fields: dict, maxlen: int | None = None) -> str:
+        """Добавить запись в поток (с приблизительным ограничением длины)"""
+        return await self._client.xadd(key, fields, maxlen=maxlen, approximate=True)
+
+    async def xgroup_create(self, key: str, group: str, last_id: str = "0") -> None:
+        """Создать группу потребителей потока, если её ещё нет"""
+        try:
+            await self._client.xgroup_create(key, group, id=last_id, mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def xreadgroup(
+        self,
+        group: str,
+        consumer: str,
+        key: str,
+        count: int = 100,
+        block: int | None = None,
+    ) -> list[tuple[str, dict]]:
+        """Прочитать новые записи потока в рамках группы потребителей"""
+        response = await self._client.xreadgroup(group, consumer, {key: ">"}, count=count, block=block)
+        if not response:
+            return []
+        return [(entry_id, fields) for _, entries in response for entry_id, fields in entries]
+
+    async def xautoclaim(
+        self,
+        key: str,
+        group: str,
+        consumer: str,
+        min_idle_time: int,
+        count: int = 100,
+    ) -> list[tuple[str, dict]]:
+        """Забрать зависшие записи других потребителей группы"""
+        response = await self._client.xautoclaim(key, group, consumer, min_idle_time, count=count)
+        return [(entry_id, fields) for entry_id, fields in response[1] if fields]
+
+    async def xack(self, key: str, group: str, *entry_ids: str) -> int:
+        """Подтвердить обработку записей потока"""
+        if not entry_ids:
+            return 0
+        return await self._client.xack(key, group, *entry_ids)
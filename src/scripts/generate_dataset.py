@@ -0,0 +1,343 @@
+import argparse
+import asyncio
+import random
+import secrets
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import text
+
+from api.v1.referral.levels import CPA_REWARD, CPA_THRESHOLD
+from core.money import MICROS, Money, from_micros, mul_div
+from infra.postgres.bulk import copy_rows
+from infra.postgres.pg import engine
+from infra.postgres.models import (
+    Operation,
+    OperationStatus,
+    OperationType,
+    Referral,
+    ReferralOperation,
+    ReferralOperationStatus,
+    ReferralOperationType,
+    ReferralType,
+    SbpPayment,
+    SbpPaymentStatus,
+    User,
+    Wallet,
+    WalletAddress,
+    WalletBalanceSnapshot,
+    WalletCurrency,
+)
+
+# Синтетические telegram_id берутся вне диапазона реальных
+TELEGRAM_ID_BASE = 10 ** 12
+WITHDRAW_FEE_PERCENT = 1
+REVENUE_SHARE_PERCENT = 30
+
+FINALIZE_STATEMENTS = (
+    # Счетчики и балансы рефералов зависят от строк из разных пачек, поэтому считаются в конце.
+    # referral_operation.amount хранится в USDT, referral.balance — в микро-единицах
+    """
+    UPDATE referral SET referral_count = counts.referral_count
+    FROM (SELECT referred_by, count(*) AS referral_count FROM referral
+          WHERE referred_by >= :base GROUP BY referred_by) AS counts
+    WHERE referral.telegram_id = counts.referred_by
+    """,
+    """
+    UPDATE referral SET balance = totals.balance
+    FROM (SELECT referral_id,
+                 round(sum(CASE WHEN operation_type = 'DEPOSIT' THEN amount ELSE -amount END) * :micros)::bigint AS balance
+          FROM referral_operation WHERE referral_id >= :base AND status = 'CONFIRMED'
+          GROUP BY referral_id) AS totals
+    WHERE referral.telegram_id = totals.referral_id
+    """,
+)
+ANALYZE_TABLES = (
+    "user",
+    "referral",
+    "wallet",
+    "wallet_balance_snapshot",
+    "wallet_address",
+    "operation",
+    "referral_operation",
+    "sbp_payment",
+)
+
+
+@dataclass
+class Chunk:
+    users: list[dict] = field(default_factory=list)
+    referrals: list[dict] = field(default_factory=list)
+    wallets: list[dict] = field(default_factory=list)
+    balance_snapshots: list[dict] = field(default_factory=list)
+    wallet_addresses: list[dict] = field(default_factory=list)
+    operations: list[dict] = field(default_factory=list)
+    sbp_payments: list[dict] = field(default_factory=list)
+    referral_operations: list[dict] = field(default_factory=list)
+
+
+class DatasetGenerator:
+    """
+    Генерирует пользователей с реферальными деревьями и историей операций.
+
+    Пригласивший выбирается среди ранее зарегистрированных со смещением к первым пользователям,
+    поэтому размер деревьев распределен с тяжелым хвостом, как в продакшене.
+    Генерация потоковая: память не зависит от общего числа пользователей.
+    """
+
+    def __init__(self, users: int, avg_operations: float, months: int, referral_share: float):
+        self._users = users
+        self._avg_operations = avg_operations
+        self._referral_share = referral_share
+        self._finished_at = datetime.utcnow()
+        self._started_at = self._finished_at - timedelta(days=30 * months)
+
+    @staticmethod
+    def telegram_id(index: int) -> int:
+        return TELEGRAM_ID_BASE + index
+
+    @staticmethod
+    def referral_type(index: int) -> ReferralType:
+        return ReferralType.FIXED_INCOME if index % 10 == 0 else ReferralType.PERCENTAGE_INCOME
+
+    def chunk(self, start: int, stop: int) -> Chunk:
+        chunk = Chunk()
+        for index in range(start, stop):
+            self._add_user(chunk, index)
+        return chunk
+
+    def _registered_at(self, index: int) -> datetime:
+        share = (index + random.random()) / self._users
+        return self._started_at + (self._finished_at - self._started_at) * share
+
+    def _add_user(self, chunk: Chunk, index: int) -> None:
+        telegram_id = self.telegram_id(index)
+        registered_at = self._registered_at(index)
+
+        referrer_index = None
+        if index and random.random() < self._referral_share:
+            referrer_index = int(index * random.random() ** 3)
+
+        chunk.users.append({"telegram_id": telegram_id, "created_at": registered_at})
+        chunk.referrals.append({
+            "telegram_id": telegram_id,
+            "referred_by": None if referrer_index is None else self.telegram_id(referrer_index),
+            "code": uuid4().hex,
+            "active": referrer_index is not None,
+            "type": self.referral_type(index),
+        })
+
+        wallet_id = uuid4()
+        address = f"T{secrets.token_hex(17)}"[:34]
+        balance = self._add_operations(chunk, wallet_id, registered_at, index, referrer_index)
+        chunk.wallets.append({
+            "wallet_id": wallet_id,
+            "telegram_id": telegram_id,
+            "currency": WalletCurrency.USDT,
+            "addresses": [address],
+            "created_at": registered_at,
+            "updated_at": registered_at,
+        })
+        # Синтетическая история в журнал не пишется: итоговый баланс сразу заносится в снимок
+        chunk.balance_snapshots.append({
+            "wallet_id": wallet_id,
+            "last_posting_id": 0,
+            "balance": balance,
+            "updated_at": registered_at,
+        })
+        chunk.wallet_addresses.append({
+            "address": address,
+            "wallet_id": wallet_id,
+            "network": "TRC20",
+            "created_at": registered_at,
+        })
+
+    def _add_operations(
+        self,
+        chunk: Chunk,
+        wallet_id,
+        registered_at: datetime,
+        index: int,
+        referrer_index: int | None,
+    ) -> Money:
+        count = int(random.expovariate(1 / self._avg_operations)) if self._avg_operations > 0 else 0
+        span = (self._finished_at - registered_at).total_seconds()
+        moments = sorted(registered_at + timedelta(seconds=random.uniform(0, span)) for _ in range(count))
+
+        balance = 0
+        withdrawn = 0
+        for created_at in moments:
+            amount = round(random.lognormvariate(3.5, 1.0) * 100) * (MICROS // 100)
+            if balance == 0 or random.random() < 0.55:
+                balance += amount
+                chunk.operations.append(self._operation(wallet_id, OperationType.DEPOSIT, amount, 0, created_at))
+                continue
+
+            amount = min(amount, balance)
+            fee = mul_div(amount, WITHDRAW_FEE_PERCENT, 100)
+            total_amount = amount + fee
+            status = OperationStatus.CONFIRMED if total_amount <= balance else OperationStatus.CANCELLED
+            if status is OperationStatus.CONFIRMED and random.random() < 0.02:
+                status = OperationStatus.PENDING
+            operation = self._operation(wallet_id, OperationType.WITHDRAW, amount, fee, created_at, status)
+            chunk.operations.append(operation)
+            if random.random() < 0.7:
+                chunk.sbp_payments.append(self._sbp_payment(operation))
+            if status is OperationStatus.CANCELLED:
+                continue
+
+            balance -= total_amount
+            if referrer_index is not None:
+                reward = self._referral_reward(referrer_index, fee, withdrawn, withdrawn + amount)
+                if reward:
+                    chunk.referral_operations.append({
+                        "referral_operation_id": uuid4(),
+                        "referral_id": self.telegram_id(referrer_index),
+                        "source_referral_id": self.telegram_id(index),
+                        "status": ReferralOperationStatus.CONFIRMED,
+                        "operation_type": ReferralOperationType.DEPOSIT,
+                        "amount": reward,
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                    })
+            withdrawn += amount
+        return balance
+
+    def _referral_reward(self, referrer_index: int, fee: Money, before: Money, after: Money) -> Money:
+        if self.referral_type(referrer_index) is ReferralType.FIXED_INCOME:
+            return CPA_REWARD if before < CPA_THRESHOLD <= after else 0
+        return mul_div(fee, REVENUE_SHARE_PERCENT, 100)
+
+    @staticmethod
+    def _operation(
+        wallet_id,
+        operation_type: OperationType,
+        amount: Money,
+        fee: Money,
+        created_at: datetime,
+        status: OperationStatus = OperationStatus.CONFIRMED,
+    ) -> dict:
+        return {
+            "operation_id": uuid4(),
+            "wallet_id": wallet_id,
+            "status": status,
+            "operation_type": operation_type,
+            "amount": amount,
+            "fee": fee,
+            "total_amount": amount + fee,
+            "created_at": created_at,
+        }
+
+    @staticmethod
+    def _sbp_payment(operation: dict) -> dict:
+        exchange = Decimal(str(round(random.uniform(88, 100), 2)))
+        rub_amount = int(from_micros(operation["amount"]) * exchange)
+        fee_rub = int(from_micros(operation["fee"]) * exchange)
+        status = {
+            OperationStatus.CONFIRMED: SbpPaymentStatus.CONFIRMED,
+            OperationStatus.PENDING: SbpPaymentStatus.PENDING,
+            OperationStatus.CANCELLED: SbpPaymentStatus.CANCELLED,
+        }[operation["status"]]
+        return {
+            "sbp_payment_id": uuid4(),
+            "operation_id": operation["operation_id"],
+            "rub_amount": rub_amount,
+            "fee_rub": fee_rub,
+            "total_amount_rub": rub_amount + fee_rub,
+            "crypto_amount": operation["amount"],
+            "fee_crypto": operation["fee"],
+            "total_amount_crypto": operation["total_amount"],
+            "exchange": exchange,
+            "sbp_url": f"https://qr.nspk.ru/{secrets.token_hex(16)}",
+            "outgoing_payment_id": secrets.token_hex(12),
+            "status": status,
+            "created_at": operation["created_at"],
+        }
+
+
+async def load_chunk(chunk: Chunk) -> int:
+    # Порядок загрузки соответствует внешним ключам
+    tables = (
+        (User, chunk.users),
+        (Referral, chunk.referrals),
+        (Wallet, chunk.wallets),
+        (WalletBalanceSnapshot, chunk.balance_snapshots),
+        (WalletAddress, chunk.wallet_addresses),
+        (Operation, chunk.operations),
+        (SbpPayment, chunk.sbp_payments),
+        (ReferralOperation, chunk.referral_operations),
+    )
+    copied = 0
+    async with engine.begin() as conn:
+        for model, rows in tables:
+            copied += await copy_rows(conn, model, rows)
+    return copied
+
+
+async def generate_dataset(users: int, chunk_size: int, generator: DatasetGenerator) -> None:
+    started = time.perf_counter()
+    total = 0
+    try:
+        for start in range(0, users, chunk_size):
+            total += await load_chunk(generator.chunk(start, min(start + chunk_size, users)))
+            elapsed = time.perf_counter() - started
+            print(f"{min(start + chunk_size, users):>10,} users {total:>14,} rows {total / elapsed:>10,.0f} rows/s")
+
+        async with engine.begin() as conn:
+            for statement in FINALIZE_STATEMENTS:
+                await conn.execute(text(statement), {"base": TELEGRAM_ID_BASE, "micros": MICROS})
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            for table in ANALYZE_TABLES:
+                await conn.exec_driver_sql(f'ANALYZE "{table}"')
+    finally:
+        await engine.dispose()
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments for generating a synthetic dataset."""
+    parser = argparse.ArgumentParser(
+        description="Bulk-load synthetic users, referral trees and operation history via COPY."
+    )
+    parser.add_argument("--users", type=int, default=100_000, help="Number of users to generate.")
+    parser.add_argument(
+        "--avg-operations",
+        type=float,
+        default=20,
+        help="Average number of operations per user (exponentially distributed).",
+    )
+    parser.add_argument("--months", type=int, default=12, help="History depth in months.")
+    parser.add_argument(
+        "--referral-share",
+        type=float,
+        default=0.6,
+        help="Share of users who joined through a referral link.",
+    )
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="Users per COPY transaction.")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible results.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Entry point for generating a synthetic dataset via CLI."""
+    args = parse_args()
+    if args.users <= 0 or args.chunk_size <= 0:
+        raise ValueError("Users and chunk size must be greater than zero.")
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    generator = DatasetGenerator(args.users, args.avg_operations, args.months, args.referral_share)
+    asyncio.run(generate_dataset(args.users, args.chunk_size, generator))
+
+
+if __name__ == "__main__":
+    main()
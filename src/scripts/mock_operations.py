@@ -4,15 +4,17 @@ import random
 import sys
 from decimal import Decimal
 from pathlib import Path
-from uuid import UUID
+from uuid import UUID, uuid4
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from core.money import Money, to_micros
 from infra.postgres.pg import get_db
 from infra.postgres.uow import PostgresUnitOfWork
-from infra.postgres.models import Operation, OperationStatus, OperationType, Wallet
+from infra.postgres.models import LedgerAccount, Operation, OperationStatus, OperationType, Wallet
+from infra.postgres.storage.ledger import credit_entries, debit_entries
 
 
 def parse_args() -> argparse.Namespace:
@@ -62,10 +64,10 @@ def validate_args(args: argparse.Namespace) -> None:
         raise ValueError("Maximum amount must be greater than or equal to minimum amount.")
 
 
-def generate_amount(min_amount: Decimal, max_amount: Decimal) -> Decimal:
-    """Generate a random Decimal amount within the given range."""
+def generate_amount(min_amount: Decimal, max_amount: Decimal) -> Money:
+    """Generate a random amount within the given range, in micro-units."""
     value = random.uniform(float(min_amount), float(max_amount))
-    return Decimal(str(round(value, 6)))
+    return to_micros(round(value, 6))
 
 
 async def create_mock_operations(
@@ -81,13 +83,15 @@ async def create_mock_operations(
         wallet: Wallet | None = await uow.wallet.get_by_id(wallet_id)
         if wallet is None:
             raise ValueError(f"Wallet with id {wallet_id} not found.")
+        balance = await uow.ledger.get_balance(wallet_id)
 
         for index in range(count):
             amount = generate_amount(min_amount, max_amount)
 
             if index % 2 == 0:
-                fee = Decimal("0.0")
+                fee = 0
                 operation = Operation(
+                    operation_id=uuid4(),
                     wallet_id=wallet.wallet_id,
                     status=OperationStatus.CONFIRMED,
                     operation_type=OperationType.DEPOSIT,
@@ -96,18 +100,25 @@ async def create_mock_operations(
                     total_amount=amount,
                 )
                 await uow.operation.add(operation)
-                wallet.balance += amount
+                await uow.ledger.post(
+                    operation.operation_id,
+                    credit_entries(
+                        wallet.wallet_id, LedgerAccount.DEPOSITS, amount, amount, LedgerAccount.NETWORK_FEES
+                    ),
+                )
+                balance += amount
                 continue
 
-            fee = Decimal("0.0")
+            fee = 0
             total_amount = amount + fee
 
-            if wallet.balance < total_amount:
+            if balance < total_amount:
                 operation_status = OperationStatus.CANCELLED
             else:
                 operation_status = OperationStatus.CONFIRMED
 
             operation = Operation(
+                operation_id=uuid4(),
                 wallet_id=wallet.wallet_id,
                 status=operation_status,
                 operation_type=OperationType.WITHDRAW,
@@ -118,7 +129,13 @@ async def create_mock_operations(
             await uow.operation.add(operation)
 
             if operation_status is OperationStatus.CONFIRMED:
-                wallet.balance -= total_amount
+                await uow.ledger.post(
+                    operation.operation_id,
+                    debit_entries(
+                        wallet.wallet_id, LedgerAccount.WITHDRAWALS, amount, fee, LedgerAccount.NETWORK_FEES
+                    ),
+                )
+                balance -= total_amount
 
 
 def main() -> None:
@@ -0,0 +1,73 @@
+from logging import getLogger
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.config import settings
+from infra.postgres.query_stats import (
+    DB_QUERIES_PER_REQUEST,
+    DB_ROWS_PER_REQUEST,
+    DB_TIME_PER_REQUEST,
+    QueryStats,
+    query_stats,
+)
+
+logger = getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time"
+
+
+class QueryStatsMiddleware:
+    """
+    Собирает статистику SQL-запросов за HTTP-запрос.
+
+    Метрики пишутся с меткой шаблона маршрута, повторы одного запроса сверх порога
+    логируются как вероятный N+1. Отладочные заголовки отражают запросы до начала ответа.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        repeated_threshold: int = settings.postgres_repeated_query_threshold,
+        debug_headers: bool = settings.postgres_query_stats_header,
+    ):
+        self.app = app
+        self._repeated_threshold = repeated_threshold
+        self._debug_headers = debug_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = query_stats.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            if self._debug_headers and message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = [
+                    *message["headers"],
+                    (QUERY_COUNT_HEADER.lower().encode(), str(stats.count).encode()),
+                    (QUERY_TIME_HEADER.lower().encode(), f"{stats.duration * 1000:.1f}".encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            query_stats.reset(token)
+            self._observe(scope, stats)
+
+    def _observe(self, scope: Scope, stats: QueryStats) -> None:
+        route = scope.get("route")
+        if route is None or stats.count == 0:
+            return
+
+        path = getattr(route, "path", scope["path"])
+        DB_QUERIES_PER_REQUEST.labels(route=path).observe(stats.count)
+        DB_TIME_PER_REQUEST.labels(route=path).observe(stats.duration)
+        DB_ROWS_PER_REQUEST.labels(route=path).observe(stats.rows)
+
+        for statement, count in stats.repeated(self._repeated_threshold):
+            logger.warning("Possible N+1 on %s %s: %s queries of %s", scope["method"], path, count, statement)
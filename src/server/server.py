@@ -1,13 +1,19 @@
 from contextlib import asynccontextmanager
+from logging import getLogger
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_fastapi_instrumentator import Instrumentator
 
+from api.v1.base.cursor import NEXT_CURSOR_HEADER
 from core.config import settings
 from core.logging_config import setup_logging
 from core.error_handler import register_exception_handlers
+from crypto_processing.dependencies import crypto_processing_client
+from server.middleware import QUERY_COUNT_HEADER, QUERY_TIME_HEADER, QueryStatsMiddleware
+
+logger = getLogger(__name__)
 
 
 def _init_router(_app: FastAPI) -> None:
@@ -25,21 +31,42 @@ def _init_prometheus(_app: FastAPI) -> None:
 
 
 def _init_middleware(_app: FastAPI) -> None:
+    _app.add_middleware(QueryStatsMiddleware)
+
     _app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.cors_origins,
         allow_credentials=settings.cors_allow_credentials,
         allow_methods=settings.cors_allow_methods,
         allow_headers=settings.cors_allow_headers,
+        expose_headers=[NEXT_CURSOR_HEADER, QUERY_COUNT_HEADER, QUERY_TIME_HEADER],
     )
 
 
+async def _ensure_partitions() -> None:
+    from infra.postgres.partitions import ensure_partitions
+    from infra.postgres.pg import engine
+
+    # Секции на ближайшие месяцы; недоступность БД не должна мешать старту приложения
+    try:
+        async with engine.begin() as conn:
+            await ensure_partitions(conn)
+    except Exception:
+        logger.exception("Failed to create table partitions")
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     setup_logging(
         log_to_file=False if settings.DEBUG else True,
     )
-    yield
+    await _ensure_partitions()
+
+    await crypto_processing_client.open()
+    try:
+        yield
+    finally:
+        await crypto_processing_client.close()
 
 
 def create_app() -> FastAPI:
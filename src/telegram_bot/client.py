@@ -0,0 +1,50 @@
+import aiohttp
+
+from core.config import settings
+from telegram_bot.exceptions import TelegramApiError, TelegramRetryAfterError
+
+
+class TelegramBotClient:
+    BASE_URL = "https://api.telegram.org"
+    token = settings.telegram_bot_token
+    timeout = aiohttp.ClientTimeout(total=10)
+
+    def __init__(self, connection_limit: int = 100):
+        self._connection_limit = connection_limit
+        self.session: aiohttp.ClientSession | None = None
+
+    async def __aenter__(self):
+        self.session = aiohttp.ClientSession(
+            timeout=self.timeout,
+            connector=aiohttp.TCPConnector(limit=self._connection_limit),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.session and not self.session.closed:
+            await self.session.close()
+
+    async def _call(self, method: str, payload: dict) -> dict:
+        if not self.session:
+            raise RuntimeError("Client session is not initialized. Use 'async with TelegramBotClient() as client'.")
+
+        url = f"{self.BASE_URL}/bot{self.token}/{method}"
+        try:
+            async with self.session.post(url, json=payload) as resp:
+                data = await resp.json(content_type=None)
+                status = resp.status
+        except (aiohttp.ClientError, TimeoutError) as e:
+            raise TelegramApiError(f"{method} request failed: {e!r}") from e
+        except ValueError as e:
+            # Не-JSON ответ (например, страница ошибки прокси) считается временной ошибкой
+            raise TelegramApiError(f"{method} returned invalid JSON: {e!r}") from e
+
+        if status == 429:
+            retry_after = (data.get("parameters") or {}).get("retry_after", 1)
+            raise TelegramRetryAfterError(retry_after=int(retry_after), message=data.get("description", ""))
+        if not data.get("ok"):
+            raise TelegramApiError(data.get("description", f"{method} failed"), status_code=status)
+        return data.get("result", {})
+
+    async def send_message(self, chat_id: int, text: str) -> dict:
+        return await self._call("sendMessage", {"chat_id": chat_id, "text": text})
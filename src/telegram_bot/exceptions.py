@@ -0,0 +1,19 @@
+class TelegramApiError(Exception):
+    """Ошибка при вызове Telegram Bot API"""
+
+    def __init__(self, message: str, status_code: int | None = None):
+        self.message = message
+        self.status_code = status_code
+        super().__init__(self.message)
+
+    @property
+    def is_transient(self) -> bool:
+        return self.status_code is None or self.status_code >= 500
+
+
+class TelegramRetryAfterError(TelegramApiError):
+    """Превышен лимит Telegram Bot API (429), повторить через retry_after секунд"""
+
+    def __init__(self, retry_after: int, message: str = "Too Many Requests"):
+        self.retry_after = retry_after
+        super().__init__(message, status_code=429)
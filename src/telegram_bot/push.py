@@ -0,0 +1,16 @@
+from core.config import settings
+from infra.redis.redis_api import RedisAPI
+
+PUSH_STREAM_KEY = "notifications:push"
+PUSH_GROUP_NAME = "telegram_push"
+
+
+async def enqueue_push(redis: RedisAPI, chat_id: int, text: str) -> None:
+    """Ставит сообщение в поток на доставку в Telegram (без обращения к Telegram)"""
+    if not settings.telegram_push_enabled:
+        return
+    await redis.xadd(
+        PUSH_STREAM_KEY,
+        {"chat_id": str(chat_id), "text": text},
+        maxlen=settings.telegram_push_stream_maxlen,
+    )
@@ -0,0 +1,162 @@
+import argparse
+import asyncio
+import os
+import socket
+from collections import OrderedDict, defaultdict
+from logging import getLogger
+
+from core.config import settings
+from core.logging_config import setup_logging
+from infra.redis.redis_api import RedisAPI
+from telegram_bot.client import TelegramBotClient
+from telegram_bot.exceptions import TelegramApiError, TelegramRetryAfterError
+from telegram_bot.push import PUSH_STREAM_KEY, PUSH_GROUP_NAME
+from telegram_bot.rate_limit import TokenBucket
+
+logger = getLogger(__name__)
+
+
+class PushDeliveryWorker:
+    """
+    Доставляет уведомления из Redis Stream в Telegram.
+
+    Несколько процессов с разными consumer_name делят поток через одну группу потребителей.
+    Общий лимит и лимит на чат соблюдаются token bucket'ами, ответ 429 учитывает retry_after.
+    """
+    BATCH_SIZE = 100
+    BLOCK_MS = 5000
+    MAX_ATTEMPTS = 5
+    RETRY_BACKOFF = 1.0
+    CLAIM_IDLE_MS = 60_000
+    MAX_CHAT_BUCKETS = 10_000
+    ERROR_BACKOFF = 5.0
+
+    def __init__(
+        self,
+        redis: RedisAPI,
+        client: TelegramBotClient,
+        consumer_name: str,
+        rate_limit: float = settings.telegram_push_rate_limit,
+        chat_rate_limit: float = settings.telegram_push_chat_rate_limit,
+        concurrency: int = settings.telegram_push_concurrency,
+    ):
+        self._redis = redis
+        self._client = client
+        self._consumer_name = consumer_name
+        self._global_bucket = TokenBucket(rate_limit)
+        self._chat_rate_limit = chat_rate_limit
+        self._chat_buckets: OrderedDict[int, TokenBucket] = OrderedDict()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._stopped = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    async def run(self) -> None:
+        await self._redis.xgroup_create(PUSH_STREAM_KEY, PUSH_GROUP_NAME)
+        logger.info("Push worker %s started", self._consumer_name)
+
+        claim = True
+        while not self._stopped.is_set():
+            try:
+                # Зависшие записи забираются при старте и когда поток пуст
+                if claim:
+                    await self._claim_stale()
+                entries = await self._redis.xreadgroup(
+                    PUSH_GROUP_NAME, self._consumer_name, PUSH_STREAM_KEY, count=self.BATCH_SIZE, block=self.BLOCK_MS
+                )
+                claim = not entries
+                await self._process(entries)
+            except Exception:
+                # Недоставленные записи остаются в группе и будут забраны повторно
+                logger.exception("Push batch failed")
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), timeout=self.ERROR_BACKOFF)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _claim_stale(self) -> None:
+        """Забирает записи, зависшие у упавших потребителей группы"""
+        entries = await self._redis.xautoclaim(
+            PUSH_STREAM_KEY, PUSH_GROUP_NAME, self._consumer_name, self.CLAIM_IDLE_MS, self.BATCH_SIZE
+        )
+        await self._process(entries)
+
+    async def _process(self, entries: list[tuple[str, dict]]) -> None:
+        if not entries:
+            return
+
+        # Сообщения одного чата отправляются последовательно, разные чаты — параллельно
+        by_chat: dict[int, list[tuple[str, str]]] = defaultdict(list)
+        for entry_id, fields in entries:
+            try:
+                by_chat[int(fields["chat_id"])].append((entry_id, fields["text"]))
+            except (KeyError, ValueError):
+                logger.warning("Malformed push entry %s: %s", entry_id, fields)
+                await self._redis.xack(PUSH_STREAM_KEY, PUSH_GROUP_NAME, entry_id)
+
+        await asyncio.gather(*(self._deliver_chat(chat_id, messages) for chat_id, messages in by_chat.items()))
+
+    async def _deliver_chat(self, chat_id: int, messages: list[tuple[str, str]]) -> None:
+        async with self._semaphore:
+            for entry_id, text in messages:
+                await self._deliver(chat_id, text)
+                await self._redis.xack(PUSH_STREAM_KEY, PUSH_GROUP_NAME, entry_id)
+
+    async def _deliver(self, chat_id: int, text: str) -> None:
+        chat_bucket = self._get_chat_bucket(chat_id)
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            await chat_bucket.acquire()
+            await self._global_bucket.acquire()
+            try:
+                await self._client.send_message(chat_id, text)
+                return
+            except TelegramRetryAfterError as e:
+                logger.warning("Telegram flood limit for chat %s, retry after %ss", chat_id, e.retry_after)
+                chat_bucket.pause(e.retry_after)
+            except TelegramApiError as e:
+                if not e.is_transient:
+                    # Бот заблокирован, чат не найден и т.п. — повтор не поможет
+                    logger.info("Push to chat %s dropped: %s", chat_id, e.message)
+                    return
+                logger.warning("Push to chat %s failed (attempt %s): %s", chat_id, attempt, e.message)
+                await asyncio.sleep(self.RETRY_BACKOFF * 2 ** (attempt - 1))
+
+        logger.error("Push to chat %s dropped after %s attempts", chat_id, self.MAX_ATTEMPTS)
+
+    def _get_chat_bucket(self, chat_id: int) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = TokenBucket(self._chat_rate_limit, capacity=1)
+            self._chat_buckets[chat_id] = bucket
+            if len(self._chat_buckets) > self.MAX_CHAT_BUCKETS:
+                self._chat_buckets.popitem(last=False)
+        else:
+            self._chat_buckets.move_to_end(chat_id)
+        return bucket
+
+
+async def _run(consumer_name: str) -> None:
+    redis = RedisAPI()
+    try:
+        async with TelegramBotClient() as client:
+            await PushDeliveryWorker(redis, client, consumer_name).run()
+    finally:
+        await redis.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Доставка уведомлений пользователям в Telegram.")
+    parser.add_argument(
+        "--consumer",
+        default=f"{socket.gethostname()}-{os.getpid()}",
+        help="Имя потребителя в группе (уникальное для каждого процесса).",
+    )
+    args = parser.parse_args(argv)
+
+    setup_logging(log_to_file=not settings.DEBUG)
+    asyncio.run(_run(args.consumer))
+
+
+if __name__ == "__main__":
+    main()